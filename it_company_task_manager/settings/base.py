@@ -56,6 +56,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "task_manager.middleware.QueryInstrumentationMiddleware",
+    "task_manager.middleware.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -95,6 +97,59 @@ DATABASES = {
     }
 }
 
+DATABASE_ROUTERS = ["task_manager.routers.ReplicaRouter"]
+
+# Aliases in DATABASES that GET requests to REPLICA_VIEWS may read from.
+REPLICA_DATABASES = []
+REPLICA_VIEWS = [
+    "index",
+    "task-list",
+    "task-detail",
+    "project-list",
+    "project-detail",
+    "worker-list",
+    "worker-detail",
+    "team-list",
+    "team-detail",
+    "categories",
+    "export",
+    "api-list",
+    "api-detail",
+]
+# After a write, the user's requests read from the primary this long.
+REPLICA_STICKY_SECONDS = 10
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+# "fragments" holds rendered template fragments and their version stamps,
+# see task_manager.fragments. "sessions" holds sessions and the users
+# they belong to, see task_manager.auth.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "fragments": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "fragments",
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    },
+    "sessions": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "sessions",
+    },
+}
+
+# Sessions are read from the cache and written through to the database.
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+SESSION_CACHE_ALIAS = "sessions"
+
+AUTHENTICATION_BACKENDS = ["task_manager.auth.CachedModelBackend"]
+
+# Seconds a request user stays cached.
+USER_CACHE_TIMEOUT = 60
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -123,6 +178,54 @@ AUTH_USER_MODEL = "task_manager.Worker"
 
 LOGIN_REDIRECT_URL = '/'
 
+# Use cursor (keyset) pagination instead of OFFSET pages in list views
+KEYSET_PAGINATION = False
+
+# Backend used by SearchForm, see task_manager.search
+SEARCH_BACKEND = "task_manager.search.IContainsSearchBackend"
+
+# Maximum number of SQL queries per URL name for GET requests, checked by
+# QueryInstrumentationMiddleware. Going over is logged, and raises
+# QueryBudgetExceeded when QUERY_BUDGET_RAISE is set (dev.py, which the
+# tests run with).
+QUERY_BUDGETS = {
+    "index": 7,
+    "task-list": 4,
+    "task-detail": 3,
+    "project-list": 4,
+    "project-detail": 8,
+    "worker-list": 4,
+    "worker-detail": 6,
+    "team-list": 5,
+    "team-detail": 7,
+    # The session, the user and both reference tables; none once cached.
+    "categories": 4,
+    "api-list": 7,
+    "api-detail": 6,
+    "api-workload": 4,
+    "changes": 2,
+    "live": 2,
+}
+QUERY_BUDGET_RAISE = False
+
+# Addresses allowed to read the /metrics/ endpoint
+INTERNAL_IPS = ["127.0.0.1", "::1"]
+
+# Seconds the change feed waits at a gap in the event ids before taking
+# it for a rollback; every rollback stalls the feed this long. Keep it
+# above the time from writing events to committing them: events committed
+# later than this are skipped, see task_manager.outbox
+CHANGES_SETTLE_SECONDS = 5
+
+# Live task updates (server-sent events, ASGI only), see task_manager.live
+LIVE_BROKER = "task_manager.live.LocalBroker"
+# Seconds between keep-alive comments of an idle stream
+LIVE_HEARTBEAT = 15
+# Events queued per client before it is asked to reload
+LIVE_QUEUE_SIZE = 100
+# Changed tasks rendered per change; above it pages are asked to reload
+LIVE_MAX_ROWS = 100
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
 
@@ -7,6 +7,9 @@ DEBUG = True
 
 ALLOWED_HOSTS = []
 
+# Going over a query budget fails the request, in development and tests.
+QUERY_BUDGET_RAISE = True
+
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
@@ -14,5 +17,12 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
-    }
+    },
+    # A second connection to the same file, standing in for a read
+    # replica; list it in REPLICA_DATABASES to route reads to it.
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db.sqlite3",
+        "TEST": {"MIRROR": "default"},
+    },
 }
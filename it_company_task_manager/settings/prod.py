@@ -14,6 +14,8 @@ if RENDER_EXTERNAL_HOSTNAME:
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "task_manager.middleware.QueryInstrumentationMiddleware",
+    "task_manager.middleware.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -30,7 +32,69 @@ DATABASES = {
         "PASSWORD": os.environ["POSTGRES_PASSWORD"],
         "HOST": os.environ["POSTGRES_HOST"],
         "PORT": int(os.environ["POSTGRES_DB_PORT"]),
+        # Test each connection before a request reuses it.
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
+# Connections per worker process. gunicorn and uvicorn both start
+# WEB_CONCURRENCY processes, which share the POSTGRES_MAX_CONNECTIONS
+# the server allows this app. Each process keeps a psycopg pool; with
+# POSTGRES_POOL=false connections persist for POSTGRES_CONN_MAX_AGE
+# seconds instead.
+WEB_CONCURRENCY = int(os.environ.get("WEB_CONCURRENCY", 1))
+POSTGRES_MAX_CONNECTIONS = int(os.environ.get("POSTGRES_MAX_CONNECTIONS", 80))
+POSTGRES_CONN_MAX_AGE = int(os.environ.get("POSTGRES_CONN_MAX_AGE", 600))
+
+if os.environ.get("POSTGRES_POOL", "true") == "true":
+    pool_size = max(2, POSTGRES_MAX_CONNECTIONS // WEB_CONCURRENCY)
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": min(
+                pool_size, int(os.environ.get("POSTGRES_POOL_MIN_SIZE", 2))
+            ),
+            "max_size": pool_size,
+            # Seconds a checkout waits before failing with PoolTimeout.
+            "timeout": float(os.environ.get("POSTGRES_POOL_TIMEOUT", 10)),
+            "max_lifetime": POSTGRES_CONN_MAX_AGE,
+            "max_idle": min(POSTGRES_CONN_MAX_AGE, 300),
+        }
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = POSTGRES_CONN_MAX_AGE
+
+# Read replicas, as comma-separated "host" or "host:port"; they share
+# the primary's database name and credentials.
+for i, replica in enumerate(
+    filter(None, os.environ.get("POSTGRES_REPLICA_HOSTS", "").split(","))
+):
+    host, _, port = replica.strip().partition(":")
+    DATABASES[f"replica_{i}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": int(port or DATABASES["default"]["PORT"]),
+        "TEST": {"MIRROR": "default"},
+    }
+REPLICA_DATABASES = [alias for alias in DATABASES if alias != "default"]
+
+# Fragments must be shared by all worker processes on the host.
+CACHES["fragments"] = {
+    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+    "LOCATION": os.environ.get(
+        "FRAGMENT_CACHE_DIR", BASE_DIR / ".cache" / "fragments"
+    ),
+    "OPTIONS": {"MAX_ENTRIES": 5000},
+}
+# A logout or a user change must reach every worker process at once.
+CACHES["sessions"] = {
+    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+    "LOCATION": os.environ.get(
+        "SESSION_CACHE_DIR", BASE_DIR / ".cache" / "sessions"
+    ),
+    # Evicted sessions are read back from the database.
+    "OPTIONS": {"MAX_ENTRIES": 10000},
+}
+
+SEARCH_BACKEND = "task_manager.search.PostgresSearchBackend"
+
 STATIC_ROOT = "staticfiles/"
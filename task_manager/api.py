@@ -0,0 +1,341 @@
+import json
+from dataclasses import dataclass
+from typing import Callable
+
+from django import forms
+from django.contrib.auth import get_user_model
+from django.core.paginator import InvalidPage
+from django.db.models import Model, QuerySet
+from django.forms.models import model_to_dict
+from django.http import QueryDict
+
+from task_manager.filters import filter_projects, filter_tasks, search_by
+from task_manager.forms import (
+    PositionForm,
+    ProjectForm,
+    TaskForm,
+    TaskTypeForm,
+    TeamForm,
+    WorkerCreationForm,
+    WorkerForm,
+)
+from task_manager.models import Position, Project, Task, TaskType, Team
+from task_manager.pagination import KeysetPaginator
+
+API_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 200
+
+
+class ApiError(Exception):
+    """A request the API rejects, answered as ``{"errors": errors}``."""
+
+    def __init__(self, errors: dict, status: int = 400) -> None:
+        super().__init__(errors)
+        self.errors = errors
+        self.status = status
+
+
+def no_filters(queryset: QuerySet, data: QueryDict) -> QuerySet:
+    return queryset
+
+
+@dataclass(frozen=True)
+class Resource:
+    """
+    A model served by the API. ``fields`` are the readable names, in
+    output order: columns, foreign keys (as ids) and to-many relations
+    (as lists of ids). Writes go through the model's form.
+    """
+
+    model: type[Model]
+    fields: tuple[str, ...]
+    form_class: type[forms.ModelForm]
+    create_form_class: type[forms.ModelForm] | None = None
+    filter: Callable[[QuerySet, QueryDict], QuerySet] = no_filters
+
+    def is_relation(self, name: str) -> bool:
+        return name != "id" and self.model._meta.get_field(name).is_relation
+
+    def is_to_many(self, name: str) -> bool:
+        if not self.is_relation(name):
+            return False
+        field = self.model._meta.get_field(name)
+        return field.many_to_many or field.one_to_many
+
+    def related_resource(self, name: str) -> str:
+        model = self.model._meta.get_field(name).related_model
+        return next(
+            key for key, resource in RESOURCES.items()
+            if resource.model is model
+        )
+
+
+RESOURCES: dict[str, Resource] = {
+    "tasks": Resource(
+        Task,
+        (
+            "id",
+            "name",
+            "description",
+            "deadline",
+            "priority",
+            "is_completed",
+            "task_type",
+            "project",
+            "assignees",
+            "updated_at",
+        ),
+        TaskForm,
+        filter=filter_tasks,
+    ),
+    "projects": Resource(
+        Project,
+        (
+            "id",
+            "project_name",
+            "deadline",
+            "budget",
+            "status",
+            "description",
+            "teams",
+            "updated_at",
+        ),
+        ProjectForm,
+        filter=filter_projects,
+    ),
+    "teams": Resource(
+        Team,
+        ("id", "name", "project", "description", "workers", "updated_at"),
+        TeamForm,
+        filter=search_by("name"),
+    ),
+    "workers": Resource(
+        get_user_model(),
+        (
+            "id",
+            "username",
+            "first_name",
+            "last_name",
+            "email",
+            "position",
+            "team",
+            "is_team_lead",
+            "updated_at",
+        ),
+        WorkerForm,
+        create_form_class=WorkerCreationForm,
+        filter=search_by("username"),
+    ),
+    "task-types": Resource(
+        TaskType, ("id", "name"), TaskTypeForm, filter=search_by("name")
+    ),
+    "positions": Resource(
+        Position, ("id", "name"), PositionForm, filter=search_by("name")
+    ),
+}
+
+
+def split(value: str | None) -> list[str]:
+    return [name for name in (value or "").split(",") if name]
+
+
+def get_fieldset(resource: Resource, value: str | None) -> list[str]:
+    """The ``fields=`` sparse fieldset; ``id`` is always returned."""
+    names = split(value)
+    if not names:
+        return list(resource.fields)
+
+    unknown = sorted(set(names) - set(resource.fields))
+    if unknown:
+        raise ApiError({"fields": [f"Unknown fields: {', '.join(unknown)}."]})
+    return ["id", *dict.fromkeys(name for name in names if name != "id")]
+
+
+def get_includes(resource: Resource, value: str | None) -> list[str]:
+    names = split(value)
+    invalid = sorted(
+        name for name in names
+        if name not in resource.fields or not resource.is_relation(name)
+    )
+    if invalid:
+        raise ApiError(
+            {"include": [f"Cannot include: {', '.join(invalid)}."]}
+        )
+    return list(dict.fromkeys(names))
+
+
+def get_page_size(value: str | None) -> int:
+    if not value:
+        return API_PAGE_SIZE
+    try:
+        page_size = int(value)
+    except ValueError:
+        raise ApiError({"page_size": ["Enter a whole number."]})
+    return max(1, min(page_size, API_MAX_PAGE_SIZE))
+
+
+def related_ids(
+    model: type[Model], name: str, ids: list[int]
+) -> dict[int, list[int]]:
+    """Ids of a to-many relation for many rows, in one query."""
+    related = {}
+    if not ids:
+        return related
+    pairs = model.objects.filter(pk__in=ids).order_by("pk", name)
+    for pk, related_id in pairs.values_list("pk", name):
+        if related_id is not None:
+            related.setdefault(pk, []).append(related_id)
+    return related
+
+
+def finish_rows(
+    resource: Resource, rows: list[dict], fields: list[str]
+) -> list[dict]:
+    """Attach the to-many ids and keep the requested fields only."""
+    ids = [row["id"] for row in rows]
+    to_many = {
+        name: related_ids(resource.model, name, ids)
+        for name in fields if resource.is_to_many(name)
+    }
+    return [
+        {
+            name: (
+                to_many[name].get(row["id"], [])
+                if name in to_many else row[name]
+            )
+            for name in fields
+        }
+        for row in rows
+    ]
+
+
+def columns(resource: Resource, fields: list[str]) -> list[str]:
+    return [name for name in fields if not resource.is_to_many(name)]
+
+
+def read(
+    resource: Resource, queryset: QuerySet, fields: list[str]
+) -> list[dict]:
+    rows = queryset.values(*columns(resource, fields))
+    return finish_rows(resource, list(rows), fields)
+
+
+def read_included(
+    resource: Resource, rows: list[dict], includes: list[str], data: QueryDict
+) -> dict[str, list[dict]]:
+    """
+    Related rows for ``include=``, one query per related resource (plus
+    one per to-many field it returns), whatever the number of rows.
+    ``fields[<resource>]=`` picks their fieldset.
+    """
+    wanted: dict[str, set] = {}
+    for name in includes:
+        ids = wanted.setdefault(resource.related_resource(name), set())
+        for row in rows:
+            value = row[name]
+            ids.update(value if isinstance(value, list) else [value])
+
+    included = {}
+    for key, ids in wanted.items():
+        ids.discard(None)
+        target = RESOURCES[key]
+        fields = get_fieldset(target, data.get(f"fields[{key}]"))
+        included[key] = read(
+            target, target.model.objects.filter(pk__in=ids), fields
+        ) if ids else []
+    return included
+
+
+def get_fields(resource: Resource, data: QueryDict) -> tuple[list, list]:
+    fields = get_fieldset(resource, data.get("fields"))
+    includes = get_includes(resource, data.get("include"))
+    # Included relations are always returned with the rows.
+    fields += [name for name in includes if name not in fields]
+    return fields, includes
+
+
+def read_list(resource: Resource, data: QueryDict) -> dict:
+    """A keyset-paginated page of rows, straight from ``.values()``."""
+    fields, includes = get_fields(resource, data)
+    queryset = resource.filter(resource.model.objects.all(), data)
+    keys = KeysetPaginator.get_ordering_keys(queryset)
+    rows = queryset.values(
+        *dict.fromkeys([
+            *columns(resource, fields), *(key.lstrip("-") for key in keys)
+        ])
+    )
+    paginator = KeysetPaginator(rows, get_page_size(data.get("page_size")))
+    try:
+        page = paginator.page(data.get("cursor"))
+    except InvalidPage as e:
+        raise ApiError({"cursor": [str(e)]})
+
+    document = {
+        "data": finish_rows(resource, page.object_list, fields),
+        "next": page.next_cursor,
+        "previous": page.previous_cursor,
+    }
+    if includes:
+        document["included"] = read_included(
+            resource, document["data"], includes, data
+        )
+    return document
+
+
+def read_detail(resource: Resource, pk: int, data: QueryDict) -> dict:
+    fields, includes = get_fields(resource, data)
+    rows = read(resource, resource.model.objects.filter(pk=pk), fields)
+    if not rows:
+        raise ApiError({"id": ["Not found."]}, status=404)
+
+    document = {"data": rows[0]}
+    if includes:
+        document["included"] = read_included(resource, rows, includes, data)
+    return document
+
+
+def get_instance(resource: Resource, pk: int) -> Model:
+    instance = resource.model.objects.filter(pk=pk).first()
+    if instance is None:
+        raise ApiError({"id": ["Not found."]}, status=404)
+    return instance
+
+
+def parse_body(body: bytes) -> dict:
+    try:
+        data = json.loads(body or b"{}")
+    except ValueError:
+        raise ApiError({"__all__": ["Invalid JSON."]})
+    if not isinstance(data, dict):
+        raise ApiError({"__all__": ["Expected a JSON object."]})
+    return data
+
+
+def form_data(instance: Model, form_class: type[forms.ModelForm]) -> dict:
+    """The instance's current values, as a form would submit them."""
+    data = model_to_dict(instance, fields=list(form_class.base_fields))
+    return {
+        name: (
+            [obj.pk for obj in value] if isinstance(value, list) else value
+        )
+        for name, value in data.items()
+    }
+
+
+def save(
+    resource: Resource,
+    data: dict,
+    instance: Model | None = None,
+    partial: bool = False,
+) -> Model:
+    """Validate ``data`` with the resource's form and save it."""
+    form_class = resource.form_class
+    if instance is None and resource.create_form_class:
+        form_class = resource.create_form_class
+    if partial:
+        data = {**form_data(instance, form_class), **data}
+
+    form = form_class(data=data, instance=instance)
+    if not form.is_valid():
+        raise ApiError(form.errors)
+    return form.save()
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class TaskManagerConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "task_manager"
+
+    def ready(self) -> None:
+        from task_manager import signals  # noqa: F401
+        from task_manager.instrumentation import metrics
+        from task_manager.pooling import connection_metrics
+
+        metrics.register_collector(connection_metrics)
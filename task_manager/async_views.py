@@ -0,0 +1,95 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth.mixins import AccessMixin
+from django.db.models import Model, QuerySet
+from django.http import Http404, HttpRequest, HttpResponse
+from django.views.generic import DetailView, ListView, TemplateView
+
+
+async def alist(queryset: QuerySet) -> list:
+    return [obj async for obj in queryset]
+
+
+class AsyncLoginRequiredMixin(AccessMixin):
+    """LoginRequiredMixin for async views."""
+
+    async def dispatch(
+        self, request: HttpRequest, *args, **kwargs
+    ) -> HttpResponse:
+        # The lazy request.user would query synchronously; load it once
+        # for the view and the templates.
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+        return await super().dispatch(request, *args, **kwargs)
+
+
+class AsyncTemplateView(TemplateView):
+    async def aget_context_data(self, **kwargs) -> dict:
+        return self.get_context_data(**kwargs)
+
+    async def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        context = await self.aget_context_data(**kwargs)
+        return self.render_to_response(context)
+
+
+class AsyncDetailView(DetailView):
+    async def aget_object(self, queryset: QuerySet | None = None) -> Model:
+        if queryset is None:
+            queryset = self.get_queryset()
+        try:
+            return await queryset.aget(pk=self.kwargs[self.pk_url_kwarg])
+        except queryset.model.DoesNotExist:
+            raise Http404(
+                f"No {queryset.model._meta.verbose_name} found matching "
+                f"the query"
+            )
+
+    async def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        self.object = await self.aget_object()
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
+
+
+class AsyncListView(ListView):
+    """
+    ListView fetching the page with the async ORM before
+    ``get_context_data()``, which then uses it as is.
+    """
+
+    fetched_page = None
+
+    async def aget_queryset(self) -> QuerySet:
+        return self.get_queryset()
+
+    async def apaginate_queryset(
+        self, queryset: QuerySet, page_size: int
+    ) -> tuple:
+        paginator, page, object_list, is_paginated = await sync_to_async(
+            self.paginate_queryset
+        )(queryset, page_size)
+        page.object_list = await alist(object_list)
+        return paginator, page, page.object_list, is_paginated
+
+    def get_paginate_by(self, queryset: QuerySet) -> int | None:
+        if self.fetched_page is not None:
+            return None
+        return super().get_paginate_by(queryset)
+
+    async def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        self.object_list = await self.aget_queryset()
+        page_size = self.get_paginate_by(self.object_list)
+        if not page_size:
+            self.object_list = await alist(self.object_list)
+            return self.render_to_response(self.get_context_data())
+
+        self.fetched_page = await self.apaginate_queryset(
+            self.object_list, page_size
+        )
+        paginator, page, object_list, is_paginated = self.fetched_page
+        context = self.get_context_data(object_list=object_list)
+        context.update({
+            "paginator": paginator,
+            "page_obj": page,
+            "is_paginated": is_paginated,
+        })
+        return self.render_to_response(context)
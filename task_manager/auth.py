@@ -0,0 +1,67 @@
+from typing import Iterable
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import caches
+
+
+def user_cache_key(user_id) -> str:
+    return f"auth-user:{user_id}"
+
+
+def forget_users(user_ids: Iterable) -> None:
+    """Drop the cached request users of ``user_ids``."""
+    keys = [user_cache_key(pk) for pk in user_ids if pk]
+    if keys:
+        caches[settings.SESSION_CACHE_ALIAS].delete_many(keys)
+
+
+def get_user_queryset():
+    return get_user_model()._default_manager.select_related(
+        "position", "team__project"
+    )
+
+
+def load_user(user_id):
+    """Fetch the user with their relations and cache them."""
+    user = get_user_queryset().filter(pk=user_id).first()
+    if user is not None:
+        caches[settings.SESSION_CACHE_ALIAS].set(
+            user_cache_key(user_id), user, settings.USER_CACHE_TIMEOUT
+        )
+    return user
+
+
+async def aload_user(user_id):
+    user = await get_user_queryset().filter(pk=user_id).afirst()
+    if user is not None:
+        await caches[settings.SESSION_CACHE_ALIAS].aset(
+            user_cache_key(user_id), user, settings.USER_CACHE_TIMEOUT
+        )
+    return user
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    ModelBackend that loads the user of each request together with their
+    position, team and team project in one query, and caches it next to
+    the sessions for USER_CACHE_TIMEOUT seconds. Logging in caches the
+    user; saving any of them forgets it, see task_manager.signals.
+    """
+
+    def get_user(self, user_id):
+        user = caches[settings.SESSION_CACHE_ALIAS].get(
+            user_cache_key(user_id)
+        ) or load_user(user_id)
+        if user is not None and self.user_can_authenticate(user):
+            return user
+        return None
+
+    async def aget_user(self, user_id):
+        user = await caches[settings.SESSION_CACHE_ALIAS].aget(
+            user_cache_key(user_id)
+        ) or await aload_user(user_id)
+        if user is not None and self.user_can_authenticate(user):
+            return user
+        return None
@@ -0,0 +1,75 @@
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.http import QueryDict
+
+from task_manager.filters import filter_tasks
+from task_manager.models import Project, Task, Worker, tasks_bulk_changed
+
+
+def select_tasks(
+    task_ids: Iterable[int] | None = None,
+    filters: QueryDict | None = None,
+) -> QuerySet:
+    """Tasks picked by id, or by the same filters as the task list."""
+    queryset = Task.objects.all()
+    if task_ids:
+        queryset = queryset.filter(pk__in=task_ids)
+    if filters is not None:
+        queryset = filter_tasks(queryset, filters)
+    return queryset
+
+
+def complete_tasks(tasks: QuerySet) -> int:
+    return tasks.filter(is_completed=False).update(is_completed=True)
+
+
+def set_priority(tasks: QuerySet, priority: int) -> int:
+    return tasks.exclude(priority=priority).update(priority=priority)
+
+
+def move_to_project(tasks: QuerySet, project: Project | None) -> int:
+    return tasks.update(project=project)
+
+
+@transaction.atomic
+def reassign_tasks(
+    tasks: QuerySet,
+    workers: Iterable[Worker],
+    replace: bool = True,
+) -> int:
+    """
+    Assign ``workers`` to every task with bulk through-table writes,
+    dropping the previous assignees when ``replace`` is set.
+    """
+    affected = list(tasks.order_by().values_list("pk", "project_id"))
+    task_ids = [pk for pk, _ in affected]
+    through = Task.assignees.through
+
+    worker_ids = set()
+    if replace:
+        previous = through.objects.filter(task_id__in=task_ids)
+        # Receivers of the signal below can no longer see these assignees.
+        worker_ids = set(previous.values_list("worker_id", flat=True))
+        previous.delete()
+
+    through.objects.bulk_create(
+        [
+            through(task_id=task_id, worker_id=worker.pk)
+            for task_id in task_ids
+            for worker in workers
+        ],
+        ignore_conflicts=True,
+        batch_size=1000,
+    )
+    tasks_bulk_changed.send(
+        sender=Task,
+        task_ids=task_ids,
+        project_ids={
+            project_id for _, project_id in affected if project_id
+        },
+        fields={"assignees"},
+        worker_ids=worker_ids,
+    )
+    return len(task_ids)
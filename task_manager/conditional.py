@@ -0,0 +1,101 @@
+import hashlib
+from datetime import datetime, time
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+from django.views.decorators.http import condition
+
+from task_manager.fragments import REFERENCE, get_stamps, stamp_key
+
+
+class ConditionalGetMixin:
+    """
+    Answer repeat GETs with 304 Not Modified before the page is rendered.
+
+    Views must define ``get_freshness()``, returning the values the page
+    depends on, usually one aggregate of ``Max("updated_at")`` and
+    ``Count`` over the rows shown.
+    The ETag also covers the URL, the user, today's date (overdue markers)
+    and the fragment stamps of ``get_stamp_keys()``, by default the
+    reference stamp (task type, position and usernames); Last-Modified is
+    the latest of the timestamps.
+    """
+
+    # The required hook returning the freshness values.
+    freshness_hook = "get_freshness"
+
+    def check_freshness_hook(self) -> None:
+        if not callable(getattr(self, self.freshness_hook, None)):
+            raise ImproperlyConfigured(
+                f"{type(self).__name__} must define {self.freshness_hook}()."
+            )
+
+    def get_stamp_keys(self) -> list[str]:
+        return [stamp_key(REFERENCE)]
+
+    def get_validators(self) -> tuple[str, datetime]:
+        if not hasattr(self, "_validators"):
+            self._validators = self.make_validators(
+                self.get_freshness(), get_stamps(self.get_stamp_keys())
+            )
+        return self._validators
+
+    def make_validators(
+        self, freshness: dict, stamps: dict
+    ) -> tuple[str, datetime]:
+        user = self.request.user
+        today = timezone.localdate()
+        timestamps = [
+            value for value in freshness.values()
+            if isinstance(value, datetime)
+        ]
+        last_modified = max(
+            value for value in (
+                timezone.make_aware(datetime.combine(today, time.min)),
+                user.last_login,
+                user.updated_at,
+                *timestamps,
+            )
+            if value is not None
+        )
+
+        source = repr((
+            self.request.get_full_path(),
+            user.pk,
+            user.last_login,
+            user.updated_at,
+            today,
+            stamps,
+            sorted(freshness.items()),
+        ))
+        etag = hashlib.md5(source.encode(), usedforsecurity=False).hexdigest()
+        return etag, last_modified
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        self.check_freshness_hook()
+        view = condition(
+            etag_func=lambda *args, **kwargs: self.get_validators()[0],
+            last_modified_func=lambda *args, **kwargs: (
+                self.get_validators()[1]
+            ),
+        )(super().get)
+        return view(request, *args, **kwargs)
+
+
+class AsyncConditionalGetMixin(ConditionalGetMixin):
+    """
+    ConditionalGetMixin for async views, which define ``aget_freshness()``
+    instead. It is awaited before ``condition()``, which calls the
+    validator functions synchronously.
+    """
+
+    freshness_hook = "aget_freshness"
+
+    async def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        self.check_freshness_hook()
+        freshness = await self.aget_freshness()
+        stamps = await sync_to_async(get_stamps)(self.get_stamp_keys())
+        self._validators = self.make_validators(freshness, stamps)
+        return await super().get(request, *args, **kwargs)
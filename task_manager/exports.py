@@ -0,0 +1,146 @@
+import csv
+import json
+from typing import Callable, Iterable, Iterator
+
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch, QuerySet
+from django.http import QueryDict
+
+from task_manager.filters import filter_projects, filter_tasks, search_by
+from task_manager.models import Project, Task, Worker
+
+EXPORT_CHUNK_SIZE = 2000
+
+TASK_FIELDS = (
+    "id",
+    "name",
+    "description",
+    "deadline",
+    "priority",
+    "is_completed",
+    "task_type",
+    "project",
+    "assignees",
+)
+PROJECT_FIELDS = (
+    "id",
+    "project_name",
+    "deadline",
+    "budget",
+    "status",
+    "description",
+)
+WORKER_FIELDS = (
+    "id",
+    "username",
+    "first_name",
+    "last_name",
+    "email",
+    "position",
+    "team",
+    "is_team_lead",
+)
+
+
+def task_records(queryset: QuerySet, chunk_size: int) -> Iterator[dict]:
+    # iterator() prefetches assignees once per chunk.
+    tasks = queryset.select_related("task_type", "project").prefetch_related(
+        Prefetch("assignees", queryset=Worker.objects.only("id", "username"))
+    )
+    for task in tasks.iterator(chunk_size=chunk_size):
+        yield {
+            "id": task.pk,
+            "name": task.name,
+            "description": task.description,
+            "deadline": task.deadline,
+            "priority": task.priority,
+            "is_completed": task.is_completed,
+            "task_type": task.task_type.name,
+            "project": task.project.project_name if task.project else None,
+            "assignees": [worker.username for worker in task.assignees.all()],
+        }
+
+
+def project_records(queryset: QuerySet, chunk_size: int) -> Iterator[dict]:
+    yield from queryset.values(*PROJECT_FIELDS).iterator(
+        chunk_size=chunk_size
+    )
+
+
+def worker_records(queryset: QuerySet, chunk_size: int) -> Iterator[dict]:
+    rows = queryset.values(
+        "id",
+        "username",
+        "first_name",
+        "last_name",
+        "email",
+        "position__name",
+        "team__name",
+        "is_team_lead",
+    )
+    for row in rows.iterator(chunk_size=chunk_size):
+        row["position"] = row.pop("position__name")
+        row["team"] = row.pop("team__name")
+        yield row
+
+
+def get_tasks(filters: QueryDict) -> QuerySet:
+    return filter_tasks(Task.objects.all(), filters)
+
+
+def get_projects(filters: QueryDict) -> QuerySet:
+    return filter_projects(Project.objects.order_by("pk"), filters)
+
+
+def get_workers(filters: QueryDict) -> QuerySet:
+    return search_by("username")(
+        get_user_model().objects.order_by("pk"), filters
+    )
+
+
+# resource name -> (columns, queryset factory, record generator)
+RESOURCES: dict[str, tuple[tuple, Callable, Callable]] = {
+    "tasks": (TASK_FIELDS, get_tasks, task_records),
+    "projects": (PROJECT_FIELDS, get_projects, project_records),
+    "workers": (WORKER_FIELDS, get_workers, worker_records),
+}
+
+
+class Echo:
+    """File-like object that returns what is written, for csv.writer."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def render_csv(fields: tuple, records: Iterable[dict]) -> Iterator[str]:
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    for record in records:
+        if isinstance(record.get("assignees"), list):
+            record["assignees"] = " ".join(record["assignees"])
+        yield writer.writerow([record[field] for field in fields])
+
+
+def render_jsonl(fields: tuple, records: Iterable[dict]) -> Iterator[str]:
+    for record in records:
+        yield json.dumps(record, cls=DjangoJSONEncoder) + "\n"
+
+
+FORMATS = {
+    "csv": ("text/csv", render_csv),
+    "jsonl": ("application/x-ndjson", render_jsonl),
+}
+
+
+def export(
+    resource: str,
+    export_format: str,
+    filters: QueryDict | None = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[str]:
+    fields, get_queryset, records = RESOURCES[resource]
+    _, render = FORMATS[export_format]
+    queryset = get_queryset(filters if filters is not None else QueryDict())
+    return render(fields, records(queryset, chunk_size))
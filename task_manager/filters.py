@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import Iterable
+
+from django.db.models import Q, QuerySet
+from django.http import QueryDict
+
+from task_manager import reference
+from task_manager.forms import SearchForm
+from task_manager.models import TaskType
+
+
+def filter_tasks(
+    queryset: QuerySet,
+    data: QueryDict,
+    task_types: Iterable[TaskType] | None = None,
+) -> QuerySet:
+    """
+    Apply the task list filters (overdue, completion, type, search).
+    ``task_types`` defaults to the cached reference rows.
+    """
+    form = SearchForm(data=data, field_name="name")
+    if not form.is_valid():
+        return queryset
+
+    if data.get("overdue") == "true":
+        queryset = queryset.filter(
+            deadline__lt=datetime.now().date(), is_completed=False
+        )
+
+    if data.get("hide_completed") == "true":
+        queryset = queryset.filter(is_completed=False)
+
+    type_filters = Q()
+    if task_types is None:
+        task_types = reference.task_types.all()
+    for task_type in task_types:
+        if data.get(task_type.name) == "true":
+            type_filters |= Q(task_type=task_type)
+
+    if type_filters:
+        queryset = queryset.filter(type_filters)
+
+    return form.search(queryset)
+
+
+def has_task_filters(data: QueryDict) -> bool:
+    """Whether ``data`` sets any of the task list filters."""
+    flags = ["overdue", "hide_completed"] + [
+        task_type.name for task_type in reference.task_types.all()
+    ]
+    return (
+        any(data.get(flag) == "true" for flag in flags)
+        or bool(data.get("search_field", "").strip())
+    )
+
+
+def filter_projects(queryset: QuerySet, data: QueryDict) -> QuerySet:
+    """Apply the project list filters (overdue, active, search)."""
+    form = SearchForm(data=data, field_name="project_name")
+    if not form.is_valid():
+        return queryset
+
+    if data.get("overdue") == "true":
+        queryset = queryset.filter(
+            deadline__lt=datetime.now().date(), status="Active"
+        )
+
+    if data.get("active") == "true":
+        queryset = queryset.filter(status="Active")
+
+    return form.search(queryset)
+
+
+def search_by(field_name: str):
+    """A filter searching ``field_name``, as on the worker list."""
+    def search(queryset: QuerySet, data: QueryDict) -> QuerySet:
+        form = SearchForm(data=data, field_name=field_name)
+        if form.is_valid():
+            return form.search(queryset)
+        return queryset
+
+    return search
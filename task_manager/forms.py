@@ -1,8 +1,34 @@
 from django import forms
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.db.models import QuerySet
+from django.forms.models import ModelChoiceIterator
 
 from task_manager.models import Task, Project, TaskType, Position, Team
+from task_manager.reference import TABLES
+from task_manager.search import get_search_backend
+
+
+class ReferenceChoiceIterator(ModelChoiceIterator):
+    def rows(self) -> list:
+        return TABLES[self.queryset.model].all()
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for obj in self.rows():
+            yield self.choice(obj)
+
+    def __len__(self) -> int:
+        return len(self.rows()) + (self.field.empty_label is not None)
+
+
+class ReferenceChoiceField(forms.ModelChoiceField):
+    """Renders its choices from the cached rows of a reference table."""
+
+    iterator = ReferenceChoiceIterator
 
 
 class TaskForm(forms.ModelForm):
@@ -22,6 +48,7 @@ class TaskForm(forms.ModelForm):
             "task_type",
             "project",
         ]
+        field_classes = {"task_type": ReferenceChoiceField}
         widgets = {
             "name":
                 forms.TextInput(attrs={"class": "w3-input w3-border"}),
@@ -88,7 +115,10 @@ class WorkerCreationForm(UserCreationForm):
             "team",
             "is_team_lead",
         )
-
+        field_classes = {
+            **UserCreationForm.Meta.field_classes,
+            "position": ReferenceChoiceField,
+        }
         widgets = {
             "username":
                 forms.TextInput(attrs={"class": "w3-input w3-border"}),
@@ -107,6 +137,23 @@ class WorkerCreationForm(UserCreationForm):
         }
 
 
+class WorkerForm(forms.ModelForm):
+    """Worker details without the password, for API updates."""
+
+    class Meta:
+        model = get_user_model()
+        fields = (
+            "username",
+            "first_name",
+            "last_name",
+            "email",
+            "position",
+            "team",
+            "is_team_lead",
+        )
+        field_classes = {"position": ReferenceChoiceField}
+
+
 class TeamForm(forms.ModelForm):
     class Meta:
         model = Team
@@ -121,9 +168,85 @@ class TeamForm(forms.ModelForm):
         }
 
 
+class IntegerListField(forms.Field):
+    widget = forms.MultipleHiddenInput
+
+    def to_python(self, value) -> list[int]:
+        if not value:
+            return []
+        try:
+            return [int(item) for item in value]
+        except (TypeError, ValueError):
+            raise ValidationError("Enter a list of ids.", code="invalid")
+
+
+class ProjectOrNoneField(forms.ModelChoiceField):
+    """A project, or no project for the explicit ``"none"`` value."""
+
+    NONE = "none"
+
+    def to_python(self, value) -> Project | None:
+        if value == self.NONE:
+            return None
+        return super().to_python(value)
+
+
+class TaskBulkActionForm(forms.Form):
+    class ActionChoices(models.TextChoices):
+        COMPLETE = "complete", "Set as completed"
+        REASSIGN = "reassign", "Reassign"
+        PRIORITIZE = "prioritize", "Change priority"
+        MOVE = "move", "Move to project"
+
+    action = forms.ChoiceField(choices=ActionChoices.choices)
+    task_ids = IntegerListField(required=False)
+    use_filters = forms.BooleanField(required=False)
+    priority = forms.TypedChoiceField(
+        choices=Task.PriorityChoices.choices, coerce=int, required=False
+    )
+    project = ProjectOrNoneField(
+        queryset=Project.objects.all(), required=False
+    )
+    assignees = forms.ModelMultipleChoiceField(
+        queryset=get_user_model().objects.all(), required=False
+    )
+    keep_assignees = forms.BooleanField(required=False)
+
+    def clean(self) -> dict:
+        # task_manager.filters imports this module.
+        from task_manager.filters import has_task_filters
+
+        cleaned_data = super().clean()
+        action = cleaned_data.get("action")
+
+        if not cleaned_data.get("task_ids"):
+            if not cleaned_data.get("use_filters"):
+                raise ValidationError(
+                    "Select tasks by id or apply the task list filters."
+                )
+            # Without a filter the selection is every task.
+            if not has_task_filters(self.data):
+                raise ValidationError(
+                    "Apply at least one task list filter."
+                )
+
+        required = {
+            self.ActionChoices.REASSIGN: "assignees",
+            self.ActionChoices.PRIORITIZE: "priority",
+        }.get(action)
+        if required and not cleaned_data.get(required):
+            self.add_error(required, "This field is required.")
+        # Moving needs a project, or "none" to take the tasks out of one.
+        if action == self.ActionChoices.MOVE and not self["project"].data:
+            self.add_error("project", "This field is required.")
+
+        return cleaned_data
+
+
 class SearchForm(forms.Form):
     def __init__(self, field_name: str, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
+        self.field_name = field_name
         self.fields["search_field"].widget.attrs[
             "placeholder"
         ] = f"Search by {field_name}"
@@ -134,3 +257,8 @@ class SearchForm(forms.Form):
         label="",
         widget=forms.TextInput(attrs={"class": "w3-input w3-border"}),
     )
+
+    def search(self, queryset: QuerySet) -> QuerySet:
+        return get_search_backend().search(
+            queryset, self.field_name, self.cleaned_data["search_field"]
+        )
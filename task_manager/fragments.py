@@ -0,0 +1,43 @@
+from typing import Iterable
+from uuid import uuid4
+
+from django.core.cache import caches
+
+FRAGMENT_CACHE = "fragments"
+# Stamp shared by every fragment, bumped when names shown all over the
+# site (task types, positions, usernames) change.
+REFERENCE = "reference"
+
+
+def stamp_key(scope: str, pk=None) -> str:
+    return f"stamp:{scope}" if pk is None else f"stamp:{scope}:{pk}"
+
+
+def get_stamps(keys: list[str]) -> list[str]:
+    """
+    Current version token of every key. A missing key (never set, culled or
+    evicted) gets a fresh token, so it can never match a stale fragment.
+    """
+    cache = caches[FRAGMENT_CACHE]
+    stamps = cache.get_many(keys)
+    missing = [key for key in keys if key not in stamps]
+    if missing:
+        for key in missing:
+            cache.add(key, uuid4().hex, None)
+        stamps.update(cache.get_many(missing))
+    return [stamps.get(key) or uuid4().hex for key in keys]
+
+
+def fragment_version(scope: str, pk) -> str:
+    return ".".join(get_stamps([stamp_key(scope, pk), stamp_key(REFERENCE)]))
+
+
+def bump(scope: str, ids: Iterable) -> None:
+    """Invalidate every fragment keyed on the ``scope`` stamps of ``ids``."""
+    stamps = {stamp_key(scope, pk): uuid4().hex for pk in ids if pk}
+    if stamps:
+        caches[FRAGMENT_CACHE].set_many(stamps, None)
+
+
+def bump_reference() -> None:
+    caches[FRAGMENT_CACHE].set(stamp_key(REFERENCE), uuid4().hex, None)
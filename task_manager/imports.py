@@ -0,0 +1,261 @@
+import csv
+import json
+from datetime import date
+from itertools import islice
+from typing import IO, Iterable, Iterator
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from task_manager.fragments import bump, bump_reference
+from task_manager.models import Position, Project, Task, TaskType, Team
+from task_manager.outbox import CREATED, record_changes
+
+IMPORT_BATCH_SIZE = 5000
+
+TRUE_VALUES = {"1", "true", "yes", "y", "t"}
+PRIORITIES = {
+    **{str(value): value for value in Task.PriorityChoices.values},
+    **{
+        label.lower(): value
+        for value, label in Task.PriorityChoices.choices
+    },
+}
+
+
+class ImportRowError(ValueError):
+    pass
+
+
+def read_records(
+    stream: IO[str], input_format: str
+) -> Iterator[dict | ImportRowError]:
+    """The rows of the file; unreadable rows are yielded as their error."""
+    if input_format == "csv":
+        yield from csv.DictReader(stream)
+        return
+
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            record = ImportRowError(f"Invalid JSON: {e}")
+        else:
+            if not isinstance(record, dict):
+                record = ImportRowError("Expected a JSON object.")
+        yield record
+
+
+def batched(records: Iterable, size: int) -> Iterator[list]:
+    records = iter(records)
+    while batch := list(islice(records, size)):
+        yield batch
+
+
+def parse_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in TRUE_VALUES
+
+
+def parse_text(value, label: str) -> str:
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        raise ImportRowError(f"Invalid {label}: {value!r}")
+    return value.strip()
+
+
+def parse_names(value) -> list[str]:
+    if isinstance(value, list):
+        return [str(name) for name in value]
+    return str(value or "").split()
+
+
+class NameLookup:
+    """
+    In-memory ``name -> pk`` map, optionally creating unknown names in
+    the transaction of the current batch.
+    """
+
+    def __init__(self, model, field: str, create_missing: bool) -> None:
+        self.model = model
+        self.field = field
+        self.create_missing = create_missing
+        self.ids = {}
+        # Created in the current batch, forgotten if it rolls back.
+        self.created = []
+        for pk, name in model.objects.order_by("-pk").values_list(
+            "pk", field
+        ):
+            self.ids[name] = pk
+
+    def get(self, name: str, dry_run: bool = False) -> int | None:
+        label = self.model._meta.verbose_name
+        if name is None or not str(name).strip():
+            raise ImportRowError(f"Missing {label}.")
+        if not isinstance(name, str):
+            raise ImportRowError(f"Invalid {label}: {name!r}")
+        if name in self.ids:
+            return self.ids[name]
+        if not self.create_missing:
+            raise ImportRowError(f"Unknown {label}: {name!r}")
+        if dry_run:
+            return None
+        obj = self.model.objects.create(**{self.field: name})
+        self.ids[name] = obj.pk
+        self.created.append(name)
+        return obj.pk
+
+    def end_batch(self, committed: bool) -> None:
+        if not committed:
+            for name in self.created:
+                del self.ids[name]
+        self.created = []
+
+
+class TaskImporter:
+    def __init__(self, create_missing: bool = False) -> None:
+        self.task_types = NameLookup(TaskType, "name", create_missing)
+        self.projects = NameLookup(Project, "project_name", False)
+        self.workers = NameLookup(get_user_model(), "username", False)
+        self.lookups = (self.task_types, self.projects, self.workers)
+
+    def build(self, record: dict, dry_run: bool) -> tuple[Task, list[int]]:
+        name = parse_text(record.get("name"), "task name")
+        if not name:
+            raise ImportRowError("Missing task name.")
+
+        try:
+            deadline = date.fromisoformat(str(record.get("deadline")))
+        except ValueError:
+            raise ImportRowError(f"Invalid deadline: {record.get('deadline')}")
+
+        priority = record.get("priority") or Task.PriorityChoices.MEDIUM
+        try:
+            priority = PRIORITIES[str(priority).strip().lower()]
+        except KeyError:
+            raise ImportRowError(f"Invalid priority: {priority}")
+
+        project = record.get("project")
+        task = Task(
+            name=name,
+            description=record.get("description") or "",
+            deadline=deadline,
+            priority=priority,
+            is_completed=parse_bool(record.get("is_completed")),
+            task_type_id=self.task_types.get(
+                record.get("task_type"), dry_run
+            ),
+            project_id=self.projects.get(project) if project else None,
+        )
+        assignees = [
+            self.workers.get(username)
+            for username in parse_names(record.get("assignees"))
+        ]
+        return task, assignees
+
+    def save(self, rows: list[tuple[Task, list[int]]]) -> None:
+        Task.objects.bulk_create(
+            [task for task, _ in rows],
+            assignees=[assignees for _, assignees in rows],
+        )
+
+
+class WorkerImporter:
+    def __init__(self, create_missing: bool = False) -> None:
+        self.positions = NameLookup(Position, "name", create_missing)
+        self.teams = NameLookup(Team, "name", create_missing)
+        self.lookups = (self.positions, self.teams)
+        self.usernames = set(
+            get_user_model().objects.values_list("username", flat=True)
+        )
+        # Imported workers log in after a password reset.
+        self.password = make_password(None)
+
+    def build(self, record: dict, dry_run: bool) -> tuple:
+        username = parse_text(record.get("username"), "username")
+        if not username:
+            raise ImportRowError("Missing username.")
+        if username in self.usernames:
+            raise ImportRowError(f"Duplicate username: {username!r}")
+        self.usernames.add(username)
+
+        team = record.get("team")
+        worker = get_user_model()(
+            username=username,
+            password=self.password,
+            first_name=record.get("first_name") or "",
+            last_name=record.get("last_name") or "",
+            email=record.get("email") or "",
+            position_id=self.positions.get(record.get("position"), dry_run),
+            team_id=self.teams.get(team, dry_run) if team else None,
+            is_team_lead=parse_bool(record.get("is_team_lead")),
+        )
+        return worker, None
+
+    def save(self, rows: list[tuple]) -> None:
+        # bulk_create() sends no post_save, so the receivers' work is
+        # done here.
+        workers = get_user_model().objects.bulk_create(
+            [worker for worker, _ in rows]
+        )
+        record_changes(
+            get_user_model(), [worker.pk for worker in workers], CREATED
+        )
+        bump("team", {worker.team_id for worker in workers})
+        bump_reference()
+
+
+IMPORTERS = {
+    "tasks": TaskImporter,
+    "workers": WorkerImporter,
+}
+
+
+def import_records(
+    records: Iterable[dict | ImportRowError],
+    resource: str = "tasks",
+    batch_size: int = IMPORT_BATCH_SIZE,
+    dry_run: bool = False,
+    create_missing: bool = False,
+) -> Iterator[tuple[int, list[tuple[int, str]]]]:
+    """
+    Import records in batches, each batch in its own transaction.
+
+    Yields ``(imported, errors)`` per batch, where ``errors`` lists
+    ``(row number, message)``. A batch with errors is not written;
+    in a dry run ``imported`` counts the rows that passed validation.
+    """
+    importer = IMPORTERS[resource](create_missing)
+    row_number = 0
+
+    for batch in batched(records, batch_size):
+        rows = []
+        errors = []
+        # Names created by --create-missing roll back with the batch.
+        with transaction.atomic():
+            for record in batch:
+                row_number += 1
+                try:
+                    if isinstance(record, ImportRowError):
+                        raise record
+                    rows.append(importer.build(record, dry_run))
+                except ImportRowError as e:
+                    errors.append((row_number, str(e)))
+
+            committed = not (errors or dry_run)
+            if committed:
+                importer.save(rows)
+            else:
+                transaction.set_rollback(True)
+        for lookup in importer.lookups:
+            lookup.end_batch(committed)
+
+        if committed:
+            yield len(rows), errors
+        else:
+            yield len(rows) if dry_run else 0, errors
@@ -0,0 +1,167 @@
+from datetime import date
+from typing import Iterable
+
+from asgiref.sync import sync_to_async
+
+from django.db.models import (
+    OuterRef,
+    Prefetch,
+    Subquery,
+    prefetch_related_objects,
+)
+from django.utils.functional import cached_property
+
+from task_manager.models import (
+    ACTIVE,
+    COMPLETED,
+    OVERDUE,
+    InboxEntry,
+    Task,
+    Worker,
+)
+from task_manager.reference import task_types
+
+INBOX_COLUMNS = (
+    "name",
+    "deadline",
+    "priority",
+    "is_completed",
+    "task_type_id",
+    "project_id",
+)
+# Task field names a bulk update may use -> InboxEntry column
+UPDATED_COLUMNS = {
+    **{column: column for column in INBOX_COLUMNS},
+    "task_type": "task_type_id",
+    "project": "project_id",
+}
+INBOX_BATCH_SIZE = 5000
+
+
+def make_entry(worker_id: int, task_id: int, *values) -> InboxEntry:
+    return InboxEntry(
+        worker_id=worker_id,
+        task_id=task_id,
+        **dict(zip(INBOX_COLUMNS, values)),
+    )
+
+
+def add_to_inbox(task_ids: Iterable[int], worker_ids: Iterable[int]) -> None:
+    """Give each worker an entry for each task."""
+    worker_ids = list(worker_ids)
+    tasks = Task.objects.filter(pk__in=task_ids).values_list(
+        "pk", *INBOX_COLUMNS
+    )
+    InboxEntry.objects.bulk_create(
+        [
+            make_entry(worker_id, *task)
+            for task in tasks
+            for worker_id in worker_ids
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def refresh_inbox(task_ids: Iterable[int] | None = None) -> int:
+    """
+    Rebuild the inbox entries of the given tasks from their assignees
+    (every entry when ``task_ids`` is None).
+    """
+    entries = InboxEntry.objects.all()
+    assignments = Task.assignees.through.objects.all()
+    if task_ids is not None:
+        task_ids = list(task_ids)
+        entries = entries.filter(task_id__in=task_ids)
+        assignments = assignments.filter(task_id__in=task_ids)
+
+    entries.delete()
+    rows = assignments.values_list(
+        "worker_id",
+        "task_id",
+        *(f"task__{column}" for column in INBOX_COLUMNS),
+    )
+    created = InboxEntry.objects.bulk_create(
+        [make_entry(*row) for row in rows.iterator()],
+        batch_size=INBOX_BATCH_SIZE,
+    )
+    return len(created)
+
+
+def sync_inbox(task: Task) -> None:
+    InboxEntry.objects.filter(task_id=task.pk).update(**{
+        column: getattr(task, column) for column in INBOX_COLUMNS
+    })
+
+
+def sync_inbox_fields(task_ids: Iterable[int], fields: set[str]) -> None:
+    """Copy the changed ``fields`` of many tasks in one UPDATE."""
+    columns = {
+        UPDATED_COLUMNS[field] for field in fields if field in UPDATED_COLUMNS
+    }
+    if not columns:
+        return
+    task = Task.objects.filter(pk=OuterRef("task_id"))
+    InboxEntry.objects.filter(task_id__in=task_ids).update(**{
+        column: Subquery(task.values(column)[:1]) for column in columns
+    })
+
+
+class Inbox:
+    """
+    A worker's tasks in deadline order, for the task table. The rows are
+    built from the inbox entries alone, with task types from the
+    reference table; only the assignees are read in a second query.
+    They are loaded once, on first use; templates call the methods
+    lazily.
+    """
+
+    def __init__(self, worker_id: int, **filters) -> None:
+        self.entries = InboxEntry.objects.filter(
+            worker_id=worker_id, **filters
+        )
+
+    @cached_property
+    def tasks(self) -> list[Task]:
+        tasks = self.to_tasks(list(self.entries), task_types.all())
+        prefetch_assignees(tasks)
+        return tasks
+
+    async def aload(self) -> None:
+        """Fetch the tasks up front, from an async view."""
+        tasks = self.to_tasks(
+            [entry async for entry in self.entries], await task_types.aall()
+        )
+        await sync_to_async(prefetch_assignees)(tasks)
+        self.__dict__["tasks"] = tasks
+
+    def to_tasks(self, entries: list, types: list) -> list[Task]:
+        types = {task_type.pk: task_type for task_type in types}
+        today = date.today()
+        tasks = []
+        for entry in entries:
+            task = Task(
+                pk=entry.task_id,
+                **{column: getattr(entry, column) for column in INBOX_COLUMNS}
+            )
+            task.task_type = types.get(entry.task_type_id)
+            # As annotated by TaskQuerySet.with_status_bucket().
+            task.status_bucket = (
+                COMPLETED if task.is_completed
+                else OVERDUE if task.deadline < today
+                else ACTIVE
+            )
+            tasks.append(task)
+        return tasks
+
+    def open_tasks(self) -> list[Task]:
+        return [task for task in self.tasks if not task.is_completed]
+
+    def completed_tasks(self) -> list[Task]:
+        return [task for task in self.tasks if task.is_completed]
+
+
+def prefetch_assignees(tasks: list[Task]) -> None:
+    prefetch_related_objects(
+        tasks,
+        Prefetch("assignees", queryset=Worker.objects.only("id", "username")),
+    )
@@ -0,0 +1,106 @@
+import re
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from typing import Callable
+
+SQL_LIST = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+SQL_NUMBER = re.compile(r"\b\d+\b")
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def fingerprint(sql: str) -> str:
+    """SQL with literals and IN lists collapsed, to spot N+1 patterns."""
+    return SQL_NUMBER.sub("?", SQL_LIST.sub("(...)", sql))
+
+
+class QueryRecorder:
+    """``connection.execute_wrapper`` that records every query's time."""
+
+    def __init__(self) -> None:
+        self.queries: list[tuple[str, float]] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - start))
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def duration(self) -> float:
+        return sum(duration for _, duration in self.queries)
+
+    def duplicates(self) -> dict[str, int]:
+        counts = Counter(fingerprint(sql) for sql, _ in self.queries)
+        return {sql: count for sql, count in counts.items() if count > 1}
+
+
+class MetricsRegistry:
+    """Process-local per-view request metrics, rendered for Prometheus."""
+
+    counters = (
+        ("requests_total", "Requests served."),
+        ("db_queries_total", "SQL queries executed."),
+        ("db_duplicate_queries_total", "Queries repeating a fingerprint."),
+        ("db_time_seconds_total", "Time spent in SQL queries."),
+        ("template_render_seconds_total", "Time spent rendering templates."),
+        ("query_budget_exceeded_total", "Requests over their query budget."),
+    )
+
+    def __init__(self, recent: int = 100) -> None:
+        self.lock = threading.Lock()
+        self.views = defaultdict(lambda: defaultdict(float))
+        self.recent = deque(maxlen=recent)
+        self.collectors: list[Callable[[], list[str]]] = []
+
+    def record(self, view: str, sample: dict) -> None:
+        with self.lock:
+            metrics = self.views[view]
+            metrics["requests_total"] += 1
+            metrics["db_queries_total"] += sample["queries"]
+            metrics["db_duplicate_queries_total"] += sum(
+                count - 1 for count in sample["duplicates"].values()
+            )
+            metrics["db_time_seconds_total"] += sample["db_time"]
+            metrics["template_render_seconds_total"] += sample[
+                "template_time"
+            ]
+            metrics["query_budget_exceeded_total"] += sample["over_budget"]
+            self.recent.append({"view": view, **sample})
+
+    def register_collector(self, collector: Callable[[], list[str]]) -> None:
+        """Add a callable returning extra exposition lines."""
+        self.collectors.append(collector)
+
+    def reset(self) -> None:
+        with self.lock:
+            self.views.clear()
+            self.recent.clear()
+
+    def render(self) -> str:
+        lines = []
+        with self.lock:
+            for name, description in self.counters:
+                metric = f"task_manager_{name}"
+                lines.append(f"# HELP {metric} {description}")
+                lines.append(f"# TYPE {metric} counter")
+                for view, metrics in sorted(self.views.items()):
+                    value = metrics[name]
+                    if value == int(value):
+                        value = int(value)
+                    lines.append(f'{metric}{{view="{view}"}} {value}')
+
+        for collector in self.collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
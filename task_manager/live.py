@@ -0,0 +1,200 @@
+import asyncio
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from typing import Iterable
+
+from django.conf import settings
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.utils.module_loading import import_string
+
+from task_manager.models import Task
+
+# Every task change; pages patch the rows they show.
+TASKS = "tasks"
+# Sent instead of the dropped events when a subscriber falls behind.
+RESYNC = {"event": "resync"}
+
+
+def worker_channel(worker_id: int) -> str:
+    """Assignments of one worker, for "my tasks"."""
+    return f"worker:{worker_id}"
+
+
+class Subscription:
+    """The events of one client, queued on its event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, size: int) -> None:
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(size)
+        self.channels: list[str] = []
+
+    def put(self, message: dict) -> None:
+        """Queue ``message``; callable from any thread."""
+        self.loop.call_soon_threadsafe(self.put_nowait, message)
+
+    def put_nowait(self, message: dict) -> None:
+        if self.queue.full():
+            # The page reloads instead of patching with a gap.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            message = RESYNC
+        self.queue.put_nowait(message)
+
+    async def get(self, timeout: float) -> dict | None:
+        """The next event, or None after ``timeout`` seconds."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class LocalBroker:
+    """
+    Fan-out to the subscribers of this process. Events published by
+    other processes are not seen, so a deployment with several workers
+    needs a shared broker with the same interface in ``LIVE_BROKER``.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.subscribers: dict[str, set[Subscription]] = defaultdict(set)
+
+    def wants(self, channel: str) -> bool:
+        """Whether an event on ``channel`` would reach anyone."""
+        return bool(self.subscribers.get(channel))
+
+    def publish(self, channel: str, message: dict) -> None:
+        with self.lock:
+            subscriptions = list(self.subscribers.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.put(message)
+
+    def subscribe(self, channels: Iterable[str]) -> Subscription:
+        """Start queueing the events of ``channels``, from async code."""
+        subscription = Subscription(
+            asyncio.get_running_loop(), settings.LIVE_QUEUE_SIZE
+        )
+        subscription.channels = list(channels)
+        with self.lock:
+            for channel in subscription.channels:
+                self.subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self.lock:
+            for channel in subscription.channels:
+                self.subscribers[channel].discard(subscription)
+                if not self.subscribers[channel]:
+                    del self.subscribers[channel]
+
+
+@lru_cache
+def load_broker(path: str) -> LocalBroker:
+    return import_string(path)()
+
+
+def get_broker() -> LocalBroker:
+    return load_broker(settings.LIVE_BROKER)
+
+
+def render_rows(task_ids: Iterable[int]) -> list[tuple[Task, str]]:
+    """Each task with its task table row, as the pages render it."""
+    tasks = Task.objects.for_task_table().filter(pk__in=task_ids)
+    return [
+        (task, render_to_string("includes/task_row.html", {"task": task}))
+        for task in tasks
+    ]
+
+
+def row_event(event: str, task: Task, html: str) -> dict:
+    return {
+        "event": event,
+        "id": task.pk,
+        "is_completed": task.is_completed,
+        "html": html,
+    }
+
+
+def publish_task_changes(task_ids: Iterable[int]) -> None:
+    """
+    Send the new rows of changed tasks once the change commits, or a
+    resync when more than ``LIVE_MAX_ROWS`` changed.
+    """
+    if not get_broker().wants(TASKS):
+        return
+    task_ids = list(task_ids)
+
+    def publish() -> None:
+        broker = get_broker()
+        if not broker.wants(TASKS):
+            return
+        if len(task_ids) > settings.LIVE_MAX_ROWS:
+            broker.publish(TASKS, RESYNC)
+            return
+        for task, html in render_rows(task_ids):
+            broker.publish(TASKS, row_event("task.updated", task, html))
+
+    transaction.on_commit(publish)
+
+
+def publish_assignments(
+    task_ids: Iterable[int], worker_ids: Iterable[int] | None = None
+) -> None:
+    """
+    Send the rows of newly assigned tasks to their workers once the
+    change commits; to every current assignee when ``worker_ids`` is None.
+    """
+    task_ids = list(task_ids)
+    worker_ids = None if worker_ids is None else set(worker_ids)
+
+    def publish() -> None:
+        broker = get_broker()
+        assignments = Task.assignees.through.objects.filter(
+            task_id__in=task_ids
+        ).values_list("task_id", "worker_id")
+        if worker_ids is not None:
+            assignments = assignments.filter(worker_id__in=worker_ids)
+            if not any(broker.wants(worker_channel(pk)) for pk in worker_ids):
+                return
+
+        workers = defaultdict(list)
+        for task_id, worker_id in assignments:
+            if broker.wants(worker_channel(worker_id)):
+                workers[task_id].append(worker_id)
+        if not workers:
+            return
+        for task, html in render_rows(workers):
+            for worker_id in workers[task.pk]:
+                broker.publish(
+                    worker_channel(worker_id),
+                    row_event("task.assigned", task, html),
+                )
+
+    transaction.on_commit(publish)
+
+
+def publish_unassignments(
+    task_ids: Iterable[int], worker_ids: Iterable[int]
+) -> None:
+    task_ids, worker_ids = list(task_ids), list(worker_ids)
+
+    def publish() -> None:
+        broker = get_broker()
+        for worker_id in worker_ids:
+            for task_id in task_ids:
+                broker.publish(
+                    worker_channel(worker_id),
+                    {"event": "task.unassigned", "id": task_id},
+                )
+
+    transaction.on_commit(publish)
+
+
+def publish_task_deleted(task_id: int) -> None:
+    transaction.on_commit(
+        lambda: get_broker().publish(
+            TASKS, {"event": "task.deleted", "id": task_id}
+        )
+    )
@@ -0,0 +1,226 @@
+import http.client
+import importlib.util
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import CommandError
+from django.test import Client
+from django.urls import reverse
+
+from task_manager.management.commands.benchmark_views import (
+    Command as BenchmarkViewsCommand,
+    percentile,
+)
+
+SERVERS = {
+    "wsgi": (
+        "gunicorn",
+        lambda port, workers: [
+            "it_company_task_manager.wsgi:application",
+            "--bind", f"127.0.0.1:{port}",
+            "--workers", str(workers),
+            "--threads", "4",
+        ],
+    ),
+    "asgi": (
+        "uvicorn",
+        lambda port, workers: [
+            "it_company_task_manager.asgi:application",
+            "--host", "127.0.0.1",
+            "--port", str(port),
+            "--workers", str(workers),
+            "--no-access-log",
+        ],
+    ),
+}
+
+
+def client_loop(
+    port: int, path: str, headers: dict, deadline: float
+) -> tuple[list[float], int]:
+    """One keep-alive client requesting ``path`` until ``deadline``."""
+    timings = []
+    errors = 0
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                response.read()
+            except (OSError, http.client.HTTPException):
+                errors += 1
+                connection.close()
+                continue
+            if response.status == 200:
+                timings.append((time.perf_counter() - start) * 1000)
+            else:
+                errors += 1
+    finally:
+        connection.close()
+    return timings, errors
+
+
+def run_load(
+    port: int, path: str, headers: dict, concurrency: int, duration: float
+) -> dict:
+    deadline = time.perf_counter() + duration
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(
+            lambda _: client_loop(port, path, headers, deadline),
+            range(concurrency),
+        ))
+
+    timings = [timing for client, _ in results for timing in client]
+    if not timings:
+        raise CommandError(f"No successful responses from {path}.")
+    return {
+        "requests": len(timings),
+        "errors": sum(errors for _, errors in results),
+        "requests_per_second": round(len(timings) / duration, 1),
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "p99_ms": round(percentile(timings, 99), 3),
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Command(BenchmarkViewsCommand):
+    help = (
+        "Serve the project with gunicorn (WSGI) and uvicorn (ASGI) and "
+        "compare throughput and latency under many concurrent clients."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--server", choices=list(SERVERS), action="append",
+            help="Server to benchmark; both by default.",
+        )
+        parser.add_argument("--concurrency", type=int, default=50)
+        parser.add_argument(
+            "--duration", type=float, default=10, help="Seconds per page."
+        )
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument(
+            "--path", action="append",
+            help="Page to request; the index and task list by default.",
+        )
+        parser.add_argument(
+            "--username",
+            help="Worker to log in as; the first worker with a team "
+                 "by default.",
+        )
+        parser.add_argument("--output", help="Write results to a JSON file.")
+
+    def handle(self, *args, **options) -> None:
+        worker = self.get_worker(options["username"])
+        client = Client()
+        client.force_login(worker)
+        headers = {
+            "Host": self.get_host(),
+            "Cookie": (
+                f"{settings.SESSION_COOKIE_NAME}="
+                f"{client.cookies[settings.SESSION_COOKIE_NAME].value}"
+            ),
+        }
+        paths = options["path"] or [
+            reverse("task_manager:index"), reverse("task_manager:task-list")
+        ]
+
+        results = {
+            "concurrency": options["concurrency"],
+            "duration": options["duration"],
+            "workers": options["workers"],
+            "servers": {},
+        }
+        for name in options["server"] or list(SERVERS):
+            with self.serve(name, options["workers"]) as port:
+                for path in paths:
+                    # Warm up connections and caches before measuring.
+                    run_load(port, path, headers, 1, 1)
+                    result = run_load(
+                        port,
+                        path,
+                        headers,
+                        options["concurrency"],
+                        options["duration"],
+                    )
+                    results["servers"].setdefault(name, {})[path] = result
+                    self.stdout.write(
+                        f"{name} {path}: "
+                        f"{result['requests_per_second']} req/s, "
+                        f"p50 {result['p50_ms']} ms, "
+                        f"p95 {result['p95_ms']} ms, "
+                        f"{result['errors']} errors"
+                    )
+
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(results, output, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+    def serve(self, name: str, workers: int) -> "Server":
+        module, arguments = SERVERS[name]
+        if importlib.util.find_spec(module) is None:
+            raise CommandError(f"{module} is not installed.")
+
+        port = free_port()
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE,
+            # Sizes each worker's share of the database connections.
+            "WEB_CONCURRENCY": str(workers),
+        }
+        return Server(
+            [sys.executable, "-m", module, *arguments(port, workers)],
+            port,
+            env,
+        )
+
+
+class Server:
+    """A server subprocess, running while used as a context manager."""
+
+    def __init__(self, command: list[str], port: int, env: dict) -> None:
+        self.command = command
+        self.port = port
+        self.env = env
+
+    def __enter__(self) -> int:
+        self.process = subprocess.Popen(
+            self.command,
+            env=self.env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise CommandError(f"{self.command[2]} exited on startup.")
+            try:
+                socket.create_connection(("127.0.0.1", self.port), 1).close()
+                return self.port
+            except OSError:
+                time.sleep(0.2)
+        self.__exit__()
+        raise CommandError(f"{self.command[2]} did not start in 30 seconds.")
+
+    def __exit__(self, *exc_info) -> None:
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
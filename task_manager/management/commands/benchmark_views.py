@@ -0,0 +1,163 @@
+import json
+import statistics
+import time
+import tracemalloc
+from itertools import combinations
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.models import Project, TaskType, Team
+
+
+def percentile(values: list[float], percent: int) -> float:
+    ordered = sorted(values)
+    index = max(0, round(percent / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive the main views through the test client and record p50/p95 "
+        "latency, query count and allocated memory per view as JSON."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument(
+            "--username",
+            help="Worker to log in as; the first worker with a team "
+                 "by default.",
+        )
+        parser.add_argument("--output", help="Write results to a JSON file.")
+        parser.add_argument(
+            "--compare", help="Previous results file to compare against."
+        )
+
+    def handle(self, *args, **options) -> None:
+        worker = self.get_worker(options["username"])
+        client = Client(SERVER_NAME=self.get_host())
+        client.force_login(worker)
+
+        results = {
+            "vendor": connection.vendor,
+            "repeat": options["repeat"],
+            "views": {},
+        }
+        for name, url in self.get_targets(worker):
+            results["views"][name] = self.measure(
+                client, url, options["repeat"]
+            )
+            self.report(name, results["views"][name])
+
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(results, output, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+        if options["compare"]:
+            self.compare(options["compare"], results)
+
+    def get_host(self) -> str:
+        hosts = [
+            host for host in settings.ALLOWED_HOSTS
+            if host != "*" and not host.startswith(".")
+        ]
+        return hosts[0] if hosts else "localhost"
+
+    def get_worker(self, username: str | None):
+        workers = get_user_model().objects.select_related("team")
+        worker = (
+            workers.filter(username=username).first() if username
+            else workers.filter(team__project__isnull=False).first()
+        )
+        if worker is None:
+            raise CommandError("No worker to log in as, run seed_data first.")
+        return worker
+
+    def get_targets(self, worker) -> list[tuple[str, str]]:
+        task_list = reverse("task_manager:task-list")
+        targets = [("index", reverse("task_manager:index"))]
+
+        filters = ["overdue=true", "hide_completed=true"]
+        filters += [
+            f"{task_type.name}=true" for task_type in TaskType.objects.all()
+        ]
+        for size in range(len(filters) + 1):
+            for combination in combinations(filters, size):
+                query = "&".join(combination)
+                name = f"task-list?{query}" if query else "task-list"
+                targets.append((name, f"{task_list}?{query}"))
+
+        project = Project.objects.filter(tasks__isnull=False).first()
+        if project:
+            targets.append((
+                "project-detail",
+                reverse("task_manager:project-detail", args=[project.pk]),
+            ))
+        targets.append((
+            "worker-detail",
+            reverse("task_manager:worker-detail", args=[worker.pk]),
+        ))
+        team = worker.team or Team.objects.first()
+        if team:
+            targets.append((
+                "team-detail",
+                reverse("task_manager:team-detail", args=[team.pk]),
+            ))
+        return targets
+
+    def measure(self, client: Client, url: str, repeat: int) -> dict:
+        # Timed without tracing, which would slow every allocation down.
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            response = client.get(url)
+            timings.append((time.perf_counter() - start) * 1000)
+            self.check_response(url, response)
+
+        # Queries and memory in a separate pass over the warmed-up view.
+        tracemalloc.start()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.check_response(url, response)
+
+        return {
+            "url": url,
+            "p50_ms": round(statistics.median(timings), 3),
+            "p95_ms": round(percentile(timings, 95), 3),
+            "queries": len(queries),
+            "peak_memory_kb": round(peak_memory / 1024, 1),
+        }
+
+    def check_response(self, url: str, response) -> None:
+        if response.status_code != 200:
+            raise CommandError(f"{url} returned {response.status_code}")
+
+    def report(self, name: str, result: dict) -> None:
+        self.stdout.write(
+            f"{name}: p50 {result['p50_ms']} ms, p95 {result['p95_ms']} ms, "
+            f"{result['queries']} queries, {result['peak_memory_kb']} KiB"
+        )
+
+    def compare(self, path: str, results: dict) -> None:
+        with open(path) as file:
+            previous = json.load(file)["views"]
+
+        for name, current in results["views"].items():
+            before = previous.get(name)
+            if before is None:
+                continue
+            self.stdout.write(
+                f"{name}: p50 {before['p50_ms']} -> {current['p50_ms']} ms, "
+                f"queries {before['queries']} -> {current['queries']}"
+            )
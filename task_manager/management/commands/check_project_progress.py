@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.progress import (
+    find_inconsistent_progress,
+    refresh_project_progress,
+)
+
+
+class Command(BaseCommand):
+    help = "Compare stored project counters with the live task aggregate."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Recompute the counters of inconsistent projects.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        mismatches = find_inconsistent_progress()
+        for project_id, stored, actual in mismatches:
+            self.stdout.write(
+                f"Project {project_id}: stored={stored} actual={actual}"
+            )
+
+        if not mismatches:
+            self.stdout.write(self.style.SUCCESS("All counters consistent."))
+            return
+
+        if options["fix"]:
+            refresh_project_progress(
+                [project_id for project_id, _, _ in mismatches]
+            )
+            self.stdout.write(
+                self.style.SUCCESS(f"Fixed {len(mismatches)} projects.")
+            )
+        else:
+            raise CommandError(f"{len(mismatches)} inconsistent projects.")
@@ -0,0 +1,136 @@
+import json
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import RequestFactory
+
+from task_manager.models import TaskType
+from task_manager.seeding import SeedConfig, seed
+from task_manager.views import ProjectListView, TaskListView
+
+# Indexes added for the list view filters; dropped for the baseline run.
+FILTER_INDEXES = (
+    "task_deadline_priority_idx",
+    "task_open_deadline_idx",
+    "task_type_deadline_idx",
+    "project_active_deadline_idx",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run the task and project list view querysets, record their "
+        "EXPLAIN plans and timings with and without the filter indexes."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Create this many temporary tasks before measuring.",
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Use EXPLAIN ANALYZE (PostgreSQL only).",
+        )
+        parser.add_argument("--output", help="Write results to a JSON file.")
+
+    def handle(self, *args, **options) -> None:
+        results = {"vendor": connection.vendor, "scenarios": {}}
+
+        # Everything runs in one transaction that is rolled back,
+        # so seeded rows and dropped indexes never persist.
+        with transaction.atomic():
+            if options["seed"]:
+                self.seed(options["seed"])
+
+            scenarios = self.get_scenarios()
+            self.measure(scenarios, "with_indexes", results, options)
+            self.drop_filter_indexes()
+            self.measure(scenarios, "without_indexes", results, options)
+            transaction.set_rollback(True)
+
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(results, output, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+    def get_scenarios(self) -> list[tuple[str, type, dict]]:
+        scenarios = [
+            ("task-list", TaskListView, {}),
+            ("task-list overdue", TaskListView, {"overdue": "true"}),
+            (
+                "task-list hide completed",
+                TaskListView,
+                {"hide_completed": "true"},
+            ),
+            ("project-list active", ProjectListView, {"active": "true"}),
+            ("project-list overdue", ProjectListView, {"overdue": "true"}),
+        ]
+        task_type = TaskType.objects.first()
+        if task_type:
+            scenarios.append(
+                ("task-list by type", TaskListView, {task_type.name: "true"})
+            )
+        return scenarios
+
+    def measure(
+        self, scenarios: list, phase: str, results: dict, options: dict
+    ) -> None:
+        factory = RequestFactory()
+        explain_options = {"analyze": True} if (
+            options["analyze"] and connection.vendor == "postgresql"
+        ) else {}
+
+        for name, view_class, params in scenarios:
+            view = view_class()
+            view.setup(factory.get("/", params))
+            queryset = view.get_queryset()[:view.paginate_by]
+
+            timings = []
+            for _ in range(options["repeat"]):
+                start = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - start) * 1000)
+
+            plan = self.explain(queryset, phase, explain_options)
+            median_ms = round(statistics.median(timings), 3)
+            results["scenarios"].setdefault(name, {})[phase] = {
+                "plan": plan,
+                "median_ms": median_ms,
+            }
+            self.stdout.write(f"[{phase}] {name}: {median_ms} ms\n{plan}\n")
+
+    def explain(self, queryset, phase: str, options: dict) -> str:
+        sql, params = queryset.query.sql_with_params()
+        prefix = connection.ops.explain_query_prefix(**options)
+        # The phase comment keeps SQLite from reusing a statement
+        # prepared before the indexes were dropped.
+        with connection.cursor() as cursor:
+            cursor.execute(f"{prefix} /* {phase} */ {sql}", params)
+            return "\n".join(
+                " ".join(str(column) for column in row)
+                for row in cursor.fetchall()
+            )
+
+    def drop_filter_indexes(self) -> None:
+        with connection.cursor() as cursor:
+            for name in FILTER_INDEXES:
+                cursor.execute(
+                    f"DROP INDEX IF EXISTS {connection.ops.quote_name(name)}"
+                )
+
+    def seed(self, count: int) -> None:
+        seed(SeedConfig(
+            tasks=count,
+            projects=max(count // 1000, 1),
+            workers=max(count // 100, 1),
+        ))
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        self.stdout.write(f"Seeded {count} tasks.")
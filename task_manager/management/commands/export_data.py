@@ -0,0 +1,50 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.http import QueryDict
+
+from task_manager.exports import EXPORT_CHUNK_SIZE, FORMATS, RESOURCES, export
+
+
+class Command(BaseCommand):
+    help = "Stream tasks, projects or workers as CSV or JSON lines."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("resource", choices=sorted(RESOURCES))
+        parser.add_argument(
+            "--format", dest="export_format", choices=sorted(FORMATS),
+            default="csv",
+        )
+        parser.add_argument("--output", help="File path, stdout by default.")
+        parser.add_argument(
+            "--chunk-size", type=int, default=EXPORT_CHUNK_SIZE
+        )
+        parser.add_argument(
+            "--filter",
+            action="append",
+            default=[],
+            metavar="KEY=VALUE",
+            help="Task list filter, e.g. overdue=true or search_field=bug.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        filters = QueryDict(mutable=True)
+        for item in options["filter"]:
+            key, separator, value = item.partition("=")
+            if not separator:
+                raise CommandError(f"Invalid filter: {item}")
+            filters.appendlist(key, value)
+
+        lines = export(
+            options["resource"],
+            options["export_format"],
+            filters,
+            options["chunk_size"],
+        )
+        if options["output"]:
+            with open(options["output"], "w", newline="") as output:
+                output.writelines(lines)
+        else:
+            # Bypass OutputWrapper, which would add a newline per write.
+            stream = getattr(self.stdout, "_out", sys.stdout)
+            stream.writelines(lines)
@@ -0,0 +1,79 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from task_manager.imports import (
+    IMPORT_BATCH_SIZE,
+    IMPORTERS,
+    import_records,
+    read_records,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk import tasks or workers from a CSV or JSON lines file "
+        "(the export_data format), in batched transactions."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("path", help="Input file, or - for stdin.")
+        parser.add_argument(
+            "--resource", choices=sorted(IMPORTERS), default="tasks"
+        )
+        parser.add_argument(
+            "--format",
+            dest="input_format",
+            choices=("csv", "jsonl"),
+            help="Guessed from the file extension by default.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=IMPORT_BATCH_SIZE
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate every row without writing anything.",
+        )
+        parser.add_argument(
+            "--create-missing",
+            action="store_true",
+            help="Create unknown task types, positions and teams.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        path = options["path"]
+        input_format = options["input_format"] or (
+            "csv" if path.endswith(".csv") else "jsonl"
+        )
+        stream = sys.stdin if path == "-" else open(path, newline="")
+
+        imported = 0
+        error_count = 0
+        start = time.perf_counter()
+        try:
+            for count, errors in import_records(
+                read_records(stream, input_format),
+                resource=options["resource"],
+                batch_size=options["batch_size"],
+                dry_run=options["dry_run"],
+                create_missing=options["create_missing"],
+            ):
+                imported += count
+                error_count += len(errors)
+                for row_number, message in errors:
+                    self.stderr.write(f"Row {row_number}: {message}")
+
+                elapsed = time.perf_counter() - start
+                self.stdout.write(
+                    f"{imported} rows, {imported / elapsed:.0f} rows/s"
+                )
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        verb = "Validated" if options["dry_run"] else "Imported"
+        self.stdout.write(f"{verb} {imported} {options['resource']}.")
+        if error_count:
+            raise CommandError(f"{error_count} rows failed.")
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from task_manager.inbox import refresh_inbox
+
+
+class Command(BaseCommand):
+    help = "Rebuild every worker's inbox from the task assignments."
+
+    def handle(self, *args, **options) -> None:
+        with transaction.atomic():
+            count = refresh_inbox()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {count} inbox entries.")
+        )
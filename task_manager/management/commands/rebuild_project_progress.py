@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from task_manager.progress import refresh_project_progress
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored task counters of every project."
+
+    def handle(self, *args, **options) -> None:
+        with transaction.atomic():
+            count = refresh_project_progress()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt progress of {count} projects.")
+        )
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from task_manager.workload import SCOPE_FIELDS, refresh_workload
+
+
+class Command(BaseCommand):
+    help = "Recount the stored workload of every worker, team and project."
+
+    def handle(self, *args, **options) -> None:
+        with transaction.atomic():
+            counts = [
+                f"{refresh_workload(scope)} {scope} rows"
+                for scope in SCOPE_FIELDS
+            ]
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt workload: {', '.join(counts)}.")
+        )
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from task_manager.overdue import SCAN_BATCH_SIZE, scan_overdue
+
+
+class Command(BaseCommand):
+    help = (
+        "Roll the overdue counters over to today, recounting only the "
+        "tasks whose deadline passed since the last scan. Run it daily; "
+        "an interrupted scan resumes where it stopped."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--batch-size", type=int, default=SCAN_BATCH_SIZE
+        )
+
+    def handle(self, *args, **options) -> None:
+        scan = scan_overdue(batch_size=options["batch_size"])
+        if scan is None:
+            self.stdout.write("Overdue counters are already rolled over.")
+            return
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{scan.overdue_tasks} tasks became overdue between "
+                f"{scan.since} and {scan.scanned_on}."
+            )
+        )
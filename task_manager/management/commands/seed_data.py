@@ -0,0 +1,39 @@
+from dataclasses import fields
+
+from django.core.management.base import BaseCommand
+
+from task_manager.seeding import SeedConfig, seed
+
+
+class Command(BaseCommand):
+    help = "Generate synthetic projects, teams, workers and tasks."
+
+    def add_arguments(self, parser) -> None:
+        defaults = SeedConfig()
+        for field in fields(SeedConfig):
+            if field.name == "priority_weights":
+                parser.add_argument(
+                    "--priority-weights",
+                    type=int,
+                    nargs=3,
+                    default=defaults.priority_weights,
+                    metavar=("HIGH", "MEDIUM", "LOW"),
+                )
+                continue
+            parser.add_argument(
+                f"--{field.name.replace('_', '-')}",
+                type=float if field.type is float else int,
+                default=getattr(defaults, field.name),
+            )
+
+    def handle(self, *args, **options) -> None:
+        config = SeedConfig(**{
+            field.name: options[field.name] for field in fields(SeedConfig)
+        })
+        config.priority_weights = tuple(config.priority_weights)
+        counts = seed(config, log=self.stdout.write)
+        self.stdout.write(self.style.SUCCESS(
+            "Seeded " + ", ".join(
+                f"{count} {name}" for name, count in counts.items()
+            )
+        ))
@@ -0,0 +1,41 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+
+from task_manager.outbox import CHANGES_BATCH_SIZE, iter_changes
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream the change events after a cursor as JSON lines; the last "
+        "id written is the cursor of the next run."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--since", type=int, default=0)
+        parser.add_argument(
+            "--batch-size", type=int, default=CHANGES_BATCH_SIZE
+        )
+        parser.add_argument(
+            "--follow",
+            action="store_true",
+            help="Keep polling for new events.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds between polls with --follow.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        since = options["since"]
+        while True:
+            for event in iter_changes(since, options["batch_size"]):
+                self.stdout.write(json.dumps(event, cls=DjangoJSONEncoder))
+                since = event["id"]
+            if not options["follow"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,195 @@
+import logging
+import random
+import time
+from contextlib import ExitStack
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.db import connections
+
+from task_manager.instrumentation import (
+    QueryBudgetExceeded,
+    QueryRecorder,
+    metrics,
+)
+from task_manager.routers import Routing, routing
+
+logger = logging.getLogger("task_manager.queries")
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Record query count, DB time, duplicate query fingerprints and template
+    render time for every view in ``task_manager.views``.
+
+    GET requests are checked against ``QUERY_BUDGETS`` (URL name ->
+    maximum number of queries); writes are not, as their cost is mostly
+    signal receivers. Going over is logged, or raised as
+    ``QueryBudgetExceeded`` when ``QUERY_BUDGET_RAISE`` is set.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        recorder = self.start(request)
+        with ExitStack() as stack:
+            self.wrap_connections(stack, recorder)
+            response = self.get_response(request)
+        return self.finish(request, response, recorder)
+
+    async def __acall__(self, request):
+        # The async ORM runs queries in the request's sync thread, so the
+        # wrappers are installed on that thread's connections.
+        recorder = self.start(request)
+        stack = ExitStack()
+        await sync_to_async(self.wrap_connections)(stack, recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.finish(request, response, recorder)
+
+    def start(self, request) -> QueryRecorder:
+        request._query_recorder = recorder = QueryRecorder()
+        request._template_time = 0.0
+        return recorder
+
+    def wrap_connections(self, stack: ExitStack, recorder) -> None:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+
+    def finish(self, request, response, recorder):
+        match = request.resolver_match
+        if match is None or not getattr(request, "_instrumented", False):
+            return response
+
+        self.report(request, response, match.url_name, recorder)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "view_class", view_func)
+        request._instrumented = view_class.__module__ == "task_manager.views"
+
+    def process_template_response(self, request, response):
+        start = time.perf_counter()
+        response.render()
+        request._template_time += time.perf_counter() - start
+        return response
+
+    def report(self, request, response, url_name, recorder) -> None:
+        budget = None
+        if request.method in ("GET", "HEAD"):
+            budget = settings.QUERY_BUDGETS.get(url_name)
+        over_budget = budget is not None and recorder.count > budget
+        duplicates = recorder.duplicates()
+        sample = {
+            "path": request.path,
+            "queries": recorder.count,
+            "db_time": recorder.duration,
+            "template_time": request._template_time,
+            "duplicates": duplicates,
+            "over_budget": over_budget,
+        }
+        metrics.record(url_name, sample)
+
+        response["Server-Timing"] = (
+            f'db;dur={recorder.duration * 1000:.1f};'
+            f'desc="{recorder.count} queries", '
+            f"tpl;dur={request._template_time * 1000:.1f}"
+        )
+        logger.debug(
+            "%s %s: %d queries in %.1f ms, template %.1f ms",
+            url_name,
+            request.path,
+            recorder.count,
+            recorder.duration * 1000,
+            request._template_time * 1000,
+            extra={"duplicates": duplicates},
+        )
+
+        if not over_budget:
+            return
+        message = (
+            f"{url_name} ran {recorder.count} queries, "
+            f"budget is {budget}"
+        )
+        if duplicates:
+            sql, count = max(duplicates.items(), key=lambda item: item[1])
+            message += f"; repeated {count}x: {sql[:200]}"
+        if settings.QUERY_BUDGET_RAISE:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Let GET requests to the views in ``REPLICA_VIEWS`` read from one of
+    ``REPLICA_DATABASES`` through ``ReplicaRouter``.
+
+    Everything else uses the primary: other methods, reads after a
+    write in the same request, and every request for
+    ``REPLICA_STICKY_SECONDS`` after one that wrote, so users see
+    their own changes despite replication lag.
+    """
+
+    sync_capable = True
+    async_capable = True
+    cookie_name = "read_primary"
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        token = routing.set(Routing())
+        try:
+            response = self.get_response(request)
+            return self.finish(request, response)
+        finally:
+            routing.reset(token)
+
+    async def __acall__(self, request):
+        token = routing.set(Routing())
+        try:
+            response = await self.get_response(request)
+            return self.finish(request, response)
+        finally:
+            routing.reset(token)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        replicas = settings.REPLICA_DATABASES
+        if (
+            replicas
+            and request.method in ("GET", "HEAD")
+            and request.resolver_match.url_name in settings.REPLICA_VIEWS
+            and self.cookie_name not in request.COOKIES
+        ):
+            routing.get().replica = random.choice(replicas)
+
+    def finish(self, request, response):
+        if routing.get().wrote or request.method not in ("GET", "HEAD"):
+            response.set_cookie(
+                self.cookie_name,
+                "1",
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
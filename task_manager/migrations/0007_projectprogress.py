@@ -0,0 +1,63 @@
+# Generated by Django 5.2a1 on 2026-10-18 13:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.utils import timezone
+
+
+def populate_project_progress(apps, schema_editor):
+    Project = apps.get_model("task_manager", "Project")
+    ProjectProgress = apps.get_model("task_manager", "ProjectProgress")
+    today = timezone.now().date()
+
+    projects = Project.objects.annotate(
+        total_tasks=Count("tasks"),
+        completed_tasks=Count("tasks", filter=Q(tasks__is_completed=True)),
+        overdue_tasks=Count(
+            "tasks",
+            filter=Q(tasks__is_completed=False, tasks__deadline__lt=today),
+        ),
+    )
+    ProjectProgress.objects.bulk_create(
+        ProjectProgress(
+            project_id=project.pk,
+            total_tasks=project.total_tasks,
+            completed_tasks=project.completed_tasks,
+            overdue_tasks=project.overdue_tasks,
+            counted_on=today,
+        )
+        for project in projects.iterator()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0006_alter_task_options"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectProgress",
+            fields=[
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="progress",
+                        serialize=False,
+                        to="task_manager.project",
+                    ),
+                ),
+                ("total_tasks", models.PositiveIntegerField(default=0)),
+                ("completed_tasks", models.PositiveIntegerField(default=0)),
+                ("overdue_tasks", models.PositiveIntegerField(default=0)),
+                ("counted_on", models.DateField(blank=True, null=True)),
+            ],
+        ),
+        migrations.RunPython(
+            populate_project_progress, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2a1 on 2026-10-18 13:16
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0007_projectprogress"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="task",
+            options={"ordering": ["deadline", "priority", "id"]},
+        ),
+    ]
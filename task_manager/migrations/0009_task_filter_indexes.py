@@ -0,0 +1,43 @@
+# Generated by Django 5.2a1 on 2026-10-18 13:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0008_alter_task_ordering"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(("status", "Active")),
+                fields=["deadline"],
+                name="project_active_deadline_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["deadline", "priority", "id"],
+                name="task_deadline_priority_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_completed", False)),
+                fields=["deadline", "priority", "id"],
+                name="task_open_deadline_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["task_type", "deadline", "priority", "id"],
+                name="task_type_deadline_idx",
+            ),
+        ),
+    ]
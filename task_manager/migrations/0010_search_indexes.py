@@ -0,0 +1,67 @@
+# Generated by Django 5.2a1 on 2026-10-18 13:40
+
+from django.db import migrations
+
+TASK_FTS_TABLE = "task_manager_task_fts"
+
+TRIGRAM_INDEXES = (
+    ("task_manager_task", "name", "task_name_trgm_idx"),
+    ("task_manager_project", "project_name", "project_name_trgm_idx"),
+    ("task_manager_worker", "username", "worker_username_trgm_idx"),
+)
+
+
+def create_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "postgresql":
+        from django.contrib.postgres.indexes import GinIndex
+        from django.contrib.postgres.search import SearchVector
+
+        Task = apps.get_model("task_manager", "Task")
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for table, column, name in TRIGRAM_INDEXES:
+            schema_editor.execute(
+                f"CREATE INDEX {name} ON {table} "
+                f"USING gin (UPPER({column}::text) gin_trgm_ops)"
+            )
+        schema_editor.add_index(
+            Task,
+            GinIndex(
+                SearchVector("name", "description", config="english"),
+                name="task_search_vector_idx",
+            ),
+        )
+
+    elif vendor == "sqlite":
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE {TASK_FTS_TABLE} "
+            f"USING fts5(name, description)"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {TASK_FTS_TABLE} (rowid, name, description) "
+            f"SELECT id, name, description FROM task_manager_task"
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "postgresql":
+        for _, _, name in TRIGRAM_INDEXES:
+            schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+        schema_editor.execute("DROP INDEX IF EXISTS task_search_vector_idx")
+
+    elif vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {TASK_FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0009_task_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,127 @@
+# Generated by Django 5.2a1 on 2026-10-18 13:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_inbox(apps, schema_editor):
+    Task = apps.get_model("task_manager", "Task")
+    InboxEntry = apps.get_model("task_manager", "InboxEntry")
+
+    rows = Task.assignees.through.objects.values_list(
+        "worker_id",
+        "task_id",
+        "task__deadline",
+        "task__priority",
+        "task__is_completed",
+        "task__task_type_id",
+        "task__project_id",
+    )
+    InboxEntry.objects.bulk_create(
+        (
+            InboxEntry(
+                worker_id=worker_id,
+                task_id=task_id,
+                deadline=deadline,
+                priority=priority,
+                is_completed=is_completed,
+                task_type_id=task_type_id,
+                project_id=project_id,
+            )
+            for (
+                worker_id,
+                task_id,
+                deadline,
+                priority,
+                is_completed,
+                task_type_id,
+                project_id,
+            ) in rows.iterator()
+        ),
+        batch_size=5000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0010_search_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="InboxEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("deadline", models.DateField()),
+                (
+                    "priority",
+                    models.IntegerField(
+                        choices=[(1, "High"), (2, "Medium"), (3, "Low")]
+                    ),
+                ),
+                ("is_completed", models.BooleanField()),
+                (
+                    "project",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="task_manager.project",
+                    ),
+                ),
+                (
+                    "task",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="inbox_entries",
+                        to="task_manager.task",
+                    ),
+                ),
+                (
+                    "task_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="task_manager.tasktype",
+                    ),
+                ),
+                (
+                    "worker",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="inbox",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["deadline", "priority", "task"],
+                "indexes": [
+                    models.Index(
+                        fields=[
+                            "worker", "is_completed", "deadline", "priority"
+                        ],
+                        name="inbox_worker_deadline_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("worker", "task"),
+                        name="inbox_worker_task_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_inbox, migrations.RunPython.noop),
+    ]
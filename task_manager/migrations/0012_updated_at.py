@@ -0,0 +1,33 @@
+# Generated by Django 5.2a1 on 2026-10-18 13:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0011_inboxentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="team",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name="worker",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
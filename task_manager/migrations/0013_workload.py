@@ -0,0 +1,111 @@
+# Generated by Django 5.2a1 on 2026-10-18 14:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q
+from django.utils import timezone
+
+
+def populate_workload(apps, schema_editor):
+    Task = apps.get_model("task_manager", "Task")
+    Workload = apps.get_model("task_manager", "Workload")
+    today = timezone.now().date()
+
+    for scope, field in (
+        ("worker", "assignees"),
+        ("team", "assignees__team"),
+        ("project", "project"),
+    ):
+        rows = (
+            Task.objects.filter(**{f"{field}__isnull": False})
+            .order_by()
+            .values(field, "priority", "task_type_id")
+            .annotate(
+                open_tasks=Count(
+                    "pk", distinct=True, filter=Q(is_completed=False)
+                ),
+                overdue_tasks=Count(
+                    "pk",
+                    distinct=True,
+                    filter=Q(is_completed=False, deadline__lt=today),
+                ),
+                completed_tasks=Count(
+                    "pk", distinct=True, filter=Q(is_completed=True)
+                ),
+            )
+        )
+        Workload.objects.bulk_create(
+            (
+                Workload(
+                    scope=scope,
+                    scope_id=row.pop(field),
+                    counted_on=today,
+                    **row,
+                )
+                for row in rows.iterator()
+            ),
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0012_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Workload",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "scope",
+                    models.CharField(
+                        choices=[
+                            ("worker", "Worker"),
+                            ("team", "Team"),
+                            ("project", "Project"),
+                        ],
+                        max_length=7,
+                    ),
+                ),
+                ("scope_id", models.PositiveBigIntegerField()),
+                (
+                    "priority",
+                    models.IntegerField(
+                        choices=[(1, "High"), (2, "Medium"), (3, "Low")]
+                    ),
+                ),
+                ("open_tasks", models.PositiveIntegerField(default=0)),
+                ("overdue_tasks", models.PositiveIntegerField(default=0)),
+                ("completed_tasks", models.PositiveIntegerField(default=0)),
+                ("counted_on", models.DateField()),
+                (
+                    "task_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="task_manager.tasktype",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("scope", "scope_id", "priority", "task_type"),
+                        name="workload_group_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_workload, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2a1 on 2026-10-18 14:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0013_workload"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OverdueScan",
+            fields=[
+                (
+                    "scanned_on",
+                    models.DateField(primary_key=True, serialize=False),
+                ),
+                ("since", models.DateField()),
+                ("cursor_deadline", models.DateField(blank=True, null=True)),
+                (
+                    "cursor_id",
+                    models.PositiveBigIntegerField(blank=True, null=True),
+                ),
+                ("overdue_tasks", models.PositiveIntegerField(default=0)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "ordering": ["-scanned_on"],
+            },
+        ),
+    ]
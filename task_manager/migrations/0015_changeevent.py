@@ -0,0 +1,49 @@
+# Generated by Django 5.2a1 on 2026-10-18 15:01
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0014_overduescan"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChangeEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("resource", models.CharField(max_length=16)),
+                ("object_id", models.PositiveBigIntegerField()),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[
+                            ("created", "Created"),
+                            ("updated", "Updated"),
+                            ("deleted", "Deleted"),
+                        ],
+                        max_length=7,
+                    ),
+                ),
+                ("fields", models.JSONField(blank=True, null=True)),
+                (
+                    "changed_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+            ],
+            options={
+                "ordering": ["id"],
+            },
+        ),
+    ]
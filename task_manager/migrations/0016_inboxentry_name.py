@@ -0,0 +1,29 @@
+# Generated by Django 5.2a1 on 2026-10-18 17:12
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_task_names(apps, schema_editor):
+    Task = apps.get_model("task_manager", "Task")
+    InboxEntry = apps.get_model("task_manager", "InboxEntry")
+
+    task = Task.objects.filter(pk=OuterRef("task_id"))
+    InboxEntry.objects.update(name=Subquery(task.values("name")[:1]))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0015_changeevent"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="inboxentry",
+            name="name",
+            field=models.CharField(default="", max_length=255),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_task_names, migrations.RunPython.noop),
+    ]
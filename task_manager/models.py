@@ -1,7 +1,36 @@
+from datetime import date
+
 from django.conf import settings
-from django.db import models
+from django.db import models, router, transaction
 from django.contrib.auth.models import AbstractUser
+from django.dispatch import Signal
 from django.urls import reverse
+from django.utils import timezone
+
+# Sent after queryset-level writes that bypass post_save, with the
+# affected ``task_ids`` (a list, or a pk queryset to be read after the
+# write) and ``project_ids`` and the changed ``fields`` (None when whole
+# rows were created).
+tasks_bulk_changed = Signal()
+
+# Task status buckets, see TaskQuerySet.with_status_bucket().
+ACTIVE = "active"
+OVERDUE = "overdue"
+COMPLETED = "completed"
+
+
+class AtomicSaveMixin:
+    """
+    Save and send pre_save/post_save in one transaction, so the change
+    events written by the receivers commit or roll back with the row.
+    """
+
+    def save(self, *args, **kwargs) -> None:
+        using = kwargs.get("using") or router.db_for_write(
+            type(self), instance=self
+        )
+        with transaction.atomic(using=using, savepoint=False):
+            super().save(*args, **kwargs)
 
 
 class TaskType(models.Model):
@@ -24,14 +53,152 @@ class Position(models.Model):
         return self.name
 
 
-class Task(models.Model):
+class TaskQuerySet(models.QuerySet):
+    @transaction.atomic(savepoint=False)
+    def update(self, **kwargs) -> int:
+        fields = set(kwargs)
+        kwargs = {"updated_at": timezone.now(), **kwargs}
+        tasks = self.order_by()
+        if self.filters_on(kwargs):
+            # The rows would no longer match once updated, so they are
+            # read first.
+            affected = list(tasks.values_list("pk", "project_id"))
+            task_ids = [pk for pk, _ in affected]
+            project_ids = {project_id for _, project_id in affected}
+        else:
+            # Read by the receivers, after the update.
+            task_ids = tasks.values_list("pk", flat=True)
+            project_ids = set(
+                tasks.values_list("project_id", flat=True).distinct()
+            )
+        rows = super().update(**kwargs)
+        new_project = kwargs.get("project", kwargs.get("project_id"))
+        project_ids.add(getattr(new_project, "pk", new_project))
+        project_ids.discard(None)
+        tasks_bulk_changed.send(
+            sender=self.model,
+            task_ids=task_ids,
+            project_ids=project_ids,
+            fields=fields,
+        )
+        return rows
+
+    def filters_on(self, names) -> bool:
+        """Whether the WHERE clause reads any of the named Task fields."""
+        fields = {self.model._meta.get_field(name) for name in names}
+        nodes = list(self.query.where.leaves())
+        while nodes:
+            node = nodes.pop()
+            if getattr(node, "target", None) in fields:
+                return True
+            if hasattr(node, "where"):
+                # A subquery.
+                nodes.extend(node.where.leaves())
+            if hasattr(node, "get_source_expressions"):
+                nodes.extend(node.get_source_expressions())
+        return False
+
+    @transaction.atomic(savepoint=False)
+    def bulk_create(self, objs, *args, assignees=None, **kwargs) -> list:
+        """
+        ``assignees``, a list of worker ids per task, are added before
+        tasks_bulk_changed is sent, so receivers see the tasks whole.
+        """
+        objs = super().bulk_create(objs, *args, **kwargs)
+        if assignees:
+            through = self.model.assignees.through
+            through.objects.bulk_create(
+                [
+                    through(task_id=obj.pk, worker_id=worker_id)
+                    for obj, worker_ids in zip(objs, assignees)
+                    for worker_id in worker_ids
+                ],
+                ignore_conflicts=True,
+            )
+        tasks_bulk_changed.send(
+            sender=self.model,
+            task_ids=[obj.pk for obj in objs if obj.pk is not None],
+            project_ids={
+                obj.project_id for obj in objs if obj.project_id is not None
+            },
+            fields=None,
+        )
+        return objs
+
+    def touch(self) -> int:
+        """Mark tasks as modified, e.g. after assignee changes."""
+        return super().update(updated_at=timezone.now())
+
+    def with_status_bucket(
+        self, current_date: date | None = None
+    ) -> "TaskQuerySet":
+        """Annotate ``status_bucket``: completed, overdue or active."""
+        return self.annotate(
+            status_bucket=models.Case(
+                models.When(is_completed=True, then=models.Value(COMPLETED)),
+                models.When(
+                    deadline__lt=current_date or date.today(),
+                    then=models.Value(OVERDUE),
+                ),
+                default=models.Value(ACTIVE),
+                output_field=models.CharField(),
+            )
+        )
+
+    def in_buckets(
+        self, *buckets: str, current_date: date | None = None
+    ) -> "TaskQuerySet":
+        """
+        Tasks in the given status buckets, filtered on the underlying
+        columns so that indexes apply.
+        """
+        current_date = current_date or date.today()
+        conditions = {
+            ACTIVE: models.Q(is_completed=False, deadline__gte=current_date),
+            OVERDUE: models.Q(is_completed=False, deadline__lt=current_date),
+            COMPLETED: models.Q(is_completed=True),
+        }
+        query = models.Q()
+        for bucket in buckets:
+            query |= conditions[bucket]
+        return self.filter(query)
+
+    def for_task_table(
+        self, current_date: date | None = None
+    ) -> "TaskQuerySet":
+        return self.with_status_bucket(current_date).select_related(
+            "task_type"
+        ).prefetch_related(
+            models.Prefetch(
+                "assignees",
+                queryset=Worker.objects.only("id", "username"),
+            )
+        )
+
+
+class Task(AtomicSaveMixin, models.Model):
     class PriorityChoices(models.IntegerChoices):
         HIGH = 1, "High"
         MEDIUM = 2, "Medium"
         LOW = 3, "Low"
 
     class Meta:
-        ordering = ["deadline", "priority"]
+        ordering = ["deadline", "priority", "id"]
+        indexes = [
+            models.Index(
+                fields=["deadline", "priority", "id"],
+                name="task_deadline_priority_idx",
+            ),
+            models.Index(
+                fields=["deadline", "priority", "id"],
+                condition=models.Q(is_completed=False),
+                name="task_open_deadline_idx",
+            ),
+            models.Index(
+                fields=["task_type", "deadline", "priority", "id"],
+                name="task_type_deadline_idx",
+            ),
+        ]
 
     name = models.CharField(max_length=255)
     description = models.TextField()
@@ -53,6 +220,9 @@ class Task(models.Model):
         on_delete=models.CASCADE,
         related_name="tasks"
     )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = TaskQuerySet.as_manager()
 
     def __str__(self) -> str:
         workers = ", ".join([str(worker) for worker in self.assignees.all()])
@@ -68,7 +238,7 @@ class Task(models.Model):
             )
 
 
-class Project(models.Model):
+class Project(AtomicSaveMixin, models.Model):
     class StatusChoices(models.TextChoices):
         ACTIVE = "Active", "Active"
         COMPLETED = "Completed", "Completed"
@@ -85,6 +255,16 @@ class Project(models.Model):
         default=StatusChoices.ACTIVE
     )
     description = models.TextField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["deadline"],
+                condition=models.Q(status="Active"),
+                name="project_active_deadline_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.project_name}, status: {self.status}"
@@ -93,7 +273,7 @@ class Project(models.Model):
         return reverse("task_manager:project-detail", kwargs={"pk": self.pk})
 
 
-class Team(models.Model):
+class Team(AtomicSaveMixin, models.Model):
     name = models.CharField(max_length=255)
     project = models.ForeignKey(
         Project,
@@ -103,12 +283,13 @@ class Team(models.Model):
         related_name="teams"
     )
     description = models.TextField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self) -> str:
         return f"{self.name}"
 
 
-class Worker(AbstractUser):
+class Worker(AtomicSaveMixin, AbstractUser):
     position = models.ForeignKey(
         Position, on_delete=models.CASCADE, related_name="workers"
     )
@@ -119,6 +300,7 @@ class Worker(AbstractUser):
         related_name="workers"
     )
     is_team_lead = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Worker"
@@ -133,3 +315,169 @@ class Worker(AbstractUser):
 
     def get_absolute_url(self) -> str:
         return reverse("task_manager:worker-detail", kwargs={"pk": self.pk})
+
+
+class ProjectProgress(models.Model):
+    project = models.OneToOneField(
+        Project,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="progress"
+    )
+    total_tasks = models.PositiveIntegerField(default=0)
+    completed_tasks = models.PositiveIntegerField(default=0)
+    overdue_tasks = models.PositiveIntegerField(default=0)
+    counted_on = models.DateField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.project_id}: {self.completed_tasks}/{self.total_tasks} "
+            f"completed, {self.overdue_tasks} overdue"
+        )
+
+    @property
+    def percentage_complete(self) -> float:
+        if not self.total_tasks:
+            return 0
+        return round(self.completed_tasks / self.total_tasks * 100, 2)
+
+
+class InboxEntry(models.Model):
+    """
+    A worker's copy of the list columns of a task assigned to them, so
+    "my tasks" is read from one table in deadline order. Kept in sync by
+    the receivers in task_manager.signals, see task_manager.inbox.
+    """
+    worker = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="inbox"
+    )
+    task = models.ForeignKey(
+        Task, on_delete=models.CASCADE, related_name="inbox_entries"
+    )
+    name = models.CharField(max_length=255)
+    deadline = models.DateField()
+    priority = models.IntegerField(choices=Task.PriorityChoices.choices)
+    is_completed = models.BooleanField()
+    task_type = models.ForeignKey(
+        TaskType, on_delete=models.CASCADE, related_name="+"
+    )
+    project = models.ForeignKey(
+        Project,
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+
+    class Meta:
+        ordering = ["deadline", "priority", "task"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["worker", "task"], name="inbox_worker_task_unique"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["worker", "is_completed", "deadline", "priority"],
+                name="inbox_worker_deadline_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.worker_id}: task {self.task_id}"
+
+
+class Workload(models.Model):
+    """
+    Task counters of a worker, team or project for one priority and task
+    type, counted on ``counted_on`` so overdue tasks can be recounted the
+    next day. Groups without tasks have no row. Kept current by the
+    receivers in task_manager.signals, see task_manager.workload.
+    """
+
+    class Scope(models.TextChoices):
+        WORKER = "worker", "Worker"
+        TEAM = "team", "Team"
+        PROJECT = "project", "Project"
+
+    scope = models.CharField(max_length=7, choices=Scope.choices)
+    scope_id = models.PositiveBigIntegerField()
+    priority = models.IntegerField(choices=Task.PriorityChoices.choices)
+    task_type = models.ForeignKey(
+        TaskType, on_delete=models.CASCADE, related_name="+"
+    )
+    open_tasks = models.PositiveIntegerField(default=0)
+    overdue_tasks = models.PositiveIntegerField(default=0)
+    completed_tasks = models.PositiveIntegerField(default=0)
+    counted_on = models.DateField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scope", "scope_id", "priority", "task_type"],
+                name="workload_group_unique",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return (
+            f"{self.scope} {self.scope_id}, priority {self.priority}, "
+            f"type {self.task_type_id}: {self.open_tasks} open, "
+            f"{self.overdue_tasks} overdue, {self.completed_tasks} completed"
+        )
+
+
+class OverdueScan(models.Model):
+    """
+    One daily rollover of the overdue counters: the open tasks with a
+    deadline in ``[since, scanned_on)`` became overdue after the stored
+    counters were last rolled over. ``cursor_*`` is the last task
+    processed, so an interrupted scan resumes after it. See
+    task_manager.overdue.
+    """
+    scanned_on = models.DateField(primary_key=True)
+    since = models.DateField()
+    cursor_deadline = models.DateField(null=True, blank=True)
+    cursor_id = models.PositiveBigIntegerField(null=True, blank=True)
+    overdue_tasks = models.PositiveIntegerField(default=0)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-scanned_on"]
+
+    def __str__(self) -> str:
+        state = "finished" if self.finished_at else "in progress"
+        return (
+            f"{self.scanned_on}: {self.overdue_tasks} tasks overdue "
+            f"since {self.since}, {state}"
+        )
+
+
+class ChangeEvent(models.Model):
+    """
+    One created, updated or deleted task, project, team or worker, written
+    in the transaction of the change (the transactional outbox). The id is
+    the sync cursor; ``resource`` and ``object_id`` address the row in the
+    JSON API. See task_manager.outbox.
+    """
+
+    class Action(models.TextChoices):
+        CREATED = "created", "Created"
+        UPDATED = "updated", "Updated"
+        DELETED = "deleted", "Deleted"
+
+    resource = models.CharField(max_length=16)
+    object_id = models.PositiveBigIntegerField()
+    action = models.CharField(max_length=7, choices=Action.choices)
+    # Changed field names of updates, when known.
+    fields = models.JSONField(null=True, blank=True)
+    # When the event was written, not when its transaction committed.
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["id"]
+
+    def __str__(self) -> str:
+        return f"{self.id}: {self.resource} {self.object_id} {self.action}"
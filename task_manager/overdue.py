@@ -0,0 +1,128 @@
+from datetime import date
+
+from django.db import transaction
+from django.db.models import Min, Q, QuerySet
+from django.utils import timezone
+
+from task_manager.models import OverdueScan, ProjectProgress, Task, Workload
+from task_manager.progress import refresh_project_progress
+from task_manager.workload import assignment_scopes, refresh_workloads
+
+SCAN_BATCH_SIZE = 1000
+# Stored counters that count overdue tasks as of their ``counted_on``.
+ROLLUPS = (ProjectProgress, Workload)
+
+
+def start_scan(current_date: date) -> OverdueScan | None:
+    """
+    The scan of ``current_date``, resumed after its cursor when a
+    previous run was interrupted; None when it already finished.
+    """
+    scan = OverdueScan.objects.filter(scanned_on=current_date).first()
+    if scan is not None:
+        return None if scan.finished_at else scan
+
+    last = OverdueScan.objects.filter(
+        scanned_on__lt=current_date, finished_at__isnull=False
+    ).first()
+    if last is not None:
+        since = last.scanned_on
+    else:
+        # First run: start from the oldest stored counters.
+        oldest = [
+            model.objects.aggregate(oldest=Min("counted_on"))["oldest"]
+            for model in ROLLUPS
+        ]
+        since = min(filter(None, oldest), default=current_date)
+    return OverdueScan.objects.create(scanned_on=current_date, since=since)
+
+
+def newly_overdue(scan: OverdueScan) -> QuerySet:
+    """
+    Open tasks whose deadline passed in ``[since, scanned_on)``, after
+    the cursor: a range scan of the open-task deadline index.
+    """
+    tasks = Task.objects.filter(
+        is_completed=False,
+        deadline__gte=scan.since,
+        deadline__lt=scan.scanned_on,
+    )
+    if scan.cursor_id is not None:
+        tasks = tasks.filter(
+            Q(deadline__gt=scan.cursor_deadline)
+            | Q(deadline=scan.cursor_deadline, pk__gt=scan.cursor_id)
+        )
+    return tasks.order_by("deadline", "pk")
+
+
+def scan_batch(
+    scan: OverdueScan, batch_size: int, counted: dict[str, set]
+) -> int:
+    """
+    Recount the counters of the next batch of newly overdue tasks and
+    move the cursor past them, skipping the scopes ``counted`` already.
+    """
+    rows = list(
+        newly_overdue(scan).values_list("pk", "deadline", "project_id")[
+            :batch_size
+        ]
+    )
+    if not rows:
+        return 0
+
+    worker_ids, team_ids = assignment_scopes([pk for pk, _, _ in rows])
+    scopes = {
+        "workers": worker_ids - counted["workers"],
+        "teams": team_ids - counted["teams"],
+        "projects": {
+            project_id for _, _, project_id in rows if project_id
+        } - counted["projects"],
+    }
+    with transaction.atomic():
+        refresh_project_progress(scopes["projects"], scan.scanned_on)
+        refresh_workloads(
+            scopes["workers"],
+            scopes["teams"],
+            scopes["projects"],
+            scan.scanned_on,
+        )
+        scan.cursor_id, scan.cursor_deadline, _ = rows[-1]
+        scan.overdue_tasks += len(rows)
+        scan.save(
+            update_fields=["cursor_id", "cursor_deadline", "overdue_tasks"]
+        )
+    for name, ids in scopes.items():
+        counted[name] |= ids
+    return len(rows)
+
+
+def finish_scan(scan: OverdueScan) -> None:
+    """
+    Roll the untouched counters over to ``scanned_on``: no task of theirs
+    became overdue since they were counted.
+    """
+    with transaction.atomic():
+        for model in ROLLUPS:
+            model.objects.filter(
+                counted_on__gte=scan.since, counted_on__lt=scan.scanned_on
+            ).update(counted_on=scan.scanned_on)
+        scan.finished_at = timezone.now()
+        scan.save(update_fields=["finished_at"])
+
+
+def scan_overdue(
+    current_date: date | None = None, batch_size: int = SCAN_BATCH_SIZE
+) -> OverdueScan | None:
+    """
+    Roll the overdue counters over to ``current_date``, recounting only
+    the workers, teams and projects with a task that became overdue since
+    the last scan. Returns None when the day was already scanned.
+    """
+    scan = start_scan(current_date or date.today())
+    if scan is None:
+        return None
+    counted = {"workers": set(), "teams": set(), "projects": set()}
+    while scan_batch(scan, batch_size, counted):
+        pass
+    finish_scan(scan)
+    return scan
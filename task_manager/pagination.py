@@ -0,0 +1,276 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import InvalidPage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Field, Q, QuerySet
+from django.http import Http404, QueryDict
+from django.utils.functional import cached_property
+
+NEXT = "n"
+PREVIOUS = "p"
+
+
+def encode_cursor(values: list, direction: str) -> str:
+    payload = json.dumps([direction, values], cls=DjangoJSONEncoder)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, list]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, values = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError, binascii.Error):
+        raise InvalidPage("Invalid cursor.")
+
+    if direction not in (NEXT, PREVIOUS) or not isinstance(values, list):
+        raise InvalidPage("Invalid cursor.")
+    return direction, values
+
+
+class KeysetPage:
+    is_keyset = True
+
+    def __init__(
+        self,
+        object_list: list,
+        paginator: "KeysetPaginator",
+        has_next: bool,
+        has_previous: bool,
+    ) -> None:
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        return self._has_previous
+
+    def has_other_pages(self) -> bool:
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self) -> str | None:
+        if not self._has_next:
+            return None
+        return self.paginator.cursor_for(self.object_list[-1], NEXT)
+
+    @property
+    def previous_cursor(self) -> str | None:
+        if not self._has_previous:
+            return None
+        return self.paginator.cursor_for(self.object_list[0], PREVIOUS)
+
+
+class KeysetPaginator:
+    """
+    Seek paginator: pages are fetched with ``WHERE (keys) > (last keys)``
+    on the queryset ordering instead of OFFSET, and no COUNT(*) is run.
+
+    The ordering keys are the queryset (or model ``Meta``) ordering
+    followed by ``pk``; they must be non-nullable local fields.
+    """
+
+    def __init__(self, queryset: QuerySet, per_page: int) -> None:
+        self.per_page = int(per_page)
+        self.keys = self.get_ordering_keys(queryset)
+        self.queryset = queryset.order_by(*self.keys)
+
+    @staticmethod
+    def get_ordering_keys(queryset: QuerySet) -> list[str]:
+        ordering = list(
+            queryset.query.order_by or queryset.model._meta.ordering
+        )
+        pk_name = queryset.model._meta.pk.name
+        names = {key.lstrip("-") for key in ordering}
+        if not names & {"pk", "id", pk_name}:
+            ordering.append("pk")
+        return ordering
+
+    def attname(self, key: str) -> str:
+        name = key.lstrip("-")
+        if name == "pk":
+            return self.queryset.model._meta.pk.attname
+        try:
+            return self.queryset.model._meta.get_field(name).attname
+        except FieldDoesNotExist:
+            # Annotations such as a search rank.
+            return name
+
+    def key_field(self, name: str) -> Field:
+        meta = self.queryset.model._meta
+        if name == "pk":
+            return meta.pk
+        try:
+            return meta.get_field(name)
+        except FieldDoesNotExist:
+            return self.queryset.query.annotations[name].output_field
+
+    def cursor_for(self, obj, direction: str) -> str:
+        if isinstance(obj, dict):
+            # A .values() row holding the ordering keys by name.
+            values = [obj[key.lstrip("-")] for key in self.keys]
+        else:
+            values = [getattr(obj, self.attname(key)) for key in self.keys]
+        return encode_cursor(values, direction)
+
+    def seek_filter(self, values: list, forward: bool) -> Q:
+        if len(values) != len(self.keys):
+            raise InvalidPage("Invalid cursor.")
+        # Cursors come from the client, so their values are checked.
+        try:
+            values = [
+                self.key_field(key.lstrip("-")).to_python(value)
+                for key, value in zip(self.keys, values)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            raise InvalidPage("Invalid cursor.")
+        if any(value is None for value in values):
+            raise InvalidPage("Invalid cursor.")
+
+        condition = Q()
+        equal = Q()
+        for key, value in zip(self.keys, values):
+            name = key.lstrip("-")
+            ascending = not key.startswith("-")
+            lookup = "gt" if ascending == forward else "lt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def page_queryset(self, cursor: str | None) -> tuple[QuerySet, str]:
+        """The query for a page, one row longer to detect more rows."""
+        if not cursor:
+            return self.queryset[:self.per_page + 1], ""
+
+        direction, values = decode_cursor(cursor)
+        forward = direction == NEXT
+        queryset = self.queryset.filter(self.seek_filter(values, forward))
+        if not forward:
+            queryset = queryset.reverse()
+        return queryset[:self.per_page + 1], direction
+
+    def make_page(self, rows: list, direction: str) -> KeysetPage:
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if direction != PREVIOUS:
+            return KeysetPage(
+                rows, self, has_more, has_previous=direction == NEXT
+            )
+
+        rows.reverse()
+        return KeysetPage(rows, self, has_next=True, has_previous=has_more)
+
+    def page(self, cursor: str | None) -> KeysetPage:
+        queryset, direction = self.page_queryset(cursor)
+        return self.make_page(list(queryset), direction)
+
+    async def apage(self, cursor: str | None) -> KeysetPage:
+        queryset, direction = self.page_queryset(cursor)
+        return self.make_page([row async for row in queryset], direction)
+
+
+class KeysetPaginationMixin:
+    """
+    Opt-in keyset pagination for list views: enabled for every view by
+    the ``KEYSET_PAGINATION`` setting, or per request by a ``cursor``
+    query parameter.
+    """
+
+    cursor_kwarg = "cursor"
+
+    def use_keyset_pagination(self) -> bool:
+        return (
+            getattr(settings, "KEYSET_PAGINATION", False)
+            or self.cursor_kwarg in self.request.GET
+        )
+
+    def paginate_queryset(self, queryset: QuerySet, page_size: int) -> tuple:
+        if not self.use_keyset_pagination():
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = KeysetPaginator(queryset, page_size)
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidPage as e:
+            raise Http404(str(e))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    async def apaginate_queryset(
+        self, queryset: QuerySet, page_size: int
+    ) -> tuple:
+        """For AsyncListView, which fetches numbered pages."""
+        if not self.use_keyset_pagination():
+            return await super().apaginate_queryset(queryset, page_size)
+
+        paginator = KeysetPaginator(queryset, page_size)
+        try:
+            page = await paginator.apage(
+                self.request.GET.get(self.cursor_kwarg)
+            )
+        except InvalidPage as e:
+            raise Http404(str(e))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+class ShowMore:
+    """
+    The first ``per_page`` rows of a queryset, ``per_page`` more for each
+    time its "show more" link was followed. The link counts the pages in
+    the ``param`` query parameter, up to ``max_pages``. Rows are fetched
+    on first use, so a cached fragment skips the query.
+    """
+
+    # Bounds the rows fetched and the fragments cached per page.
+    max_pages = 20
+
+    def __init__(
+        self, queryset: QuerySet, data: QueryDict, param: str, per_page: int
+    ) -> None:
+        self.queryset = queryset
+        self.data = data
+        self.param = param
+        try:
+            self.pages = max(1, int(data.get(param, 1)))
+        except ValueError:
+            self.pages = 1
+        self.pages = min(self.pages, self.max_pages)
+        self.limit = self.pages * per_page
+
+    @cached_property
+    def fetched(self) -> list:
+        # One row past the limit tells whether there are more.
+        return list(self.queryset[: self.limit + 1])
+
+    @property
+    def has_more(self) -> bool:
+        return (
+            self.pages < self.max_pages and len(self.fetched) > self.limit
+        )
+
+    def more_query(self) -> str:
+        data = self.data.copy()
+        data[self.param] = self.pages + 1
+        return data.urlencode()
+
+    def __len__(self) -> int:
+        return len(self.fetched[: self.limit])
+
+    def __iter__(self):
+        return iter(self.fetched[: self.limit])
@@ -0,0 +1,96 @@
+import threading
+from collections import Counter
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+# psycopg_pool statistic -> (metric, type, description, scale)
+POOL_METRICS = {
+    "pool_size": (
+        "db_pool_connections", "gauge", "Connections held by the pool.", 1
+    ),
+    "pool_available": (
+        "db_pool_idle_connections", "gauge", "Idle connections in the pool.", 1
+    ),
+    "requests_waiting": (
+        "db_pool_waiting", "gauge", "Checkouts waiting for a connection.", 1
+    ),
+    "requests_num": (
+        "db_pool_checkouts_total", "counter", "Connections checked out.", 1
+    ),
+    "requests_queued": (
+        "db_pool_waits_total", "counter", "Checkouts that had to wait.", 1
+    ),
+    "requests_wait_ms": (
+        "db_pool_wait_seconds_total",
+        "counter",
+        "Time spent waiting for a connection.",
+        0.001,
+    ),
+    "requests_errors": (
+        "db_pool_timeouts_total",
+        "counter",
+        "Checkouts that timed out or failed.",
+        1,
+    ),
+    "connections_lost": (
+        "db_pool_connections_lost_total",
+        "counter",
+        "Connections found broken by the health check.",
+        1,
+    ),
+}
+
+_lock = threading.Lock()
+connects = Counter()
+
+
+@receiver(connection_created)
+def count_connect(sender, connection, **kwargs) -> None:
+    with _lock:
+        connects[connection.alias] += 1
+
+
+def get_pool_stats() -> dict[str, dict]:
+    """psycopg_pool statistics of every database alias with a pool."""
+    stats = {}
+    for alias in connections:
+        pool = getattr(connections[alias], "pool", None)
+        if pool is not None:
+            stats[alias] = pool.get_stats()
+    return stats
+
+
+def render_pool_stats(stats: dict[str, dict]) -> list[str]:
+    lines = []
+    if not stats:
+        return lines
+    for key, (name, kind, description, scale) in POOL_METRICS.items():
+        metric = f"task_manager_{name}"
+        lines.append(f"# HELP {metric} {description}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for alias, values in sorted(stats.items()):
+            value = values.get(key, 0) * scale
+            if value == int(value):
+                value = int(value)
+            lines.append(f'{metric}{{database="{alias}"}} {value}')
+    return lines
+
+
+def connection_metrics() -> list[str]:
+    """
+    Connections Django set up (pool checkouts when pooled), then the
+    pool statistics.
+    """
+    metric = "task_manager_db_connects_total"
+    lines = [
+        f"# HELP {metric} Database connections set up by Django.",
+        f"# TYPE {metric} counter",
+    ]
+    with _lock:
+        lines.extend(
+            f'{metric}{{database="{alias}"}} {count}'
+            for alias, count in sorted(connects.items())
+        )
+    return lines + render_pool_stats(get_pool_stats())
@@ -0,0 +1,121 @@
+from datetime import date
+from typing import Iterable
+
+from asgiref.sync import sync_to_async
+from django.db.models import Count, Q
+
+from task_manager.models import Project, ProjectProgress, Task
+
+
+def count_project_tasks(
+    project_ids: Iterable[int] | None = None,
+    current_date: date | None = None,
+) -> dict[int, dict]:
+    """Live per-project task counters, grouped in a single query."""
+    current_date = current_date or date.today()
+    tasks = Task.objects.filter(project__isnull=False)
+    if project_ids is not None:
+        tasks = tasks.filter(project_id__in=project_ids)
+
+    rows = (
+        tasks.order_by()
+        .values("project_id")
+        .annotate(
+            total_tasks=Count("pk"),
+            completed_tasks=Count("pk", filter=Q(is_completed=True)),
+            overdue_tasks=Count(
+                "pk",
+                filter=Q(is_completed=False, deadline__lt=current_date),
+            ),
+        )
+    )
+    return {row.pop("project_id"): row for row in rows}
+
+
+def refresh_project_progress(
+    project_ids: Iterable[int] | None = None,
+    current_date: date | None = None,
+) -> int:
+    """
+    Recompute the stored counters of the given projects
+    (all projects when ``project_ids`` is None).
+    """
+    current_date = current_date or date.today()
+    projects = Project.objects.all()
+    if project_ids is not None:
+        project_ids = {pk for pk in project_ids if pk is not None}
+        if not project_ids:
+            return 0
+        projects = projects.filter(pk__in=project_ids)
+
+    existing_ids = list(projects.values_list("pk", flat=True))
+    counts = count_project_tasks(existing_ids, current_date)
+    empty = {"total_tasks": 0, "completed_tasks": 0, "overdue_tasks": 0}
+
+    progress = [
+        ProjectProgress(
+            project_id=pk,
+            counted_on=current_date,
+            **counts.get(pk, empty),
+        )
+        for pk in existing_ids
+    ]
+    ProjectProgress.objects.bulk_create(
+        progress,
+        update_conflicts=True,
+        unique_fields=["project"],
+        update_fields=[
+            "total_tasks", "completed_tasks", "overdue_tasks", "counted_on"
+        ],
+    )
+    return len(progress)
+
+
+def get_project_progress(project: Project) -> ProjectProgress:
+    """
+    Return the stored counters for a project, recomputing them only
+    when they are missing or were counted on a previous day.
+    """
+    current_date = date.today()
+    progress = ProjectProgress.objects.filter(project=project).first()
+    if progress is None or progress.counted_on != current_date:
+        refresh_project_progress([project.pk], current_date)
+        progress = ProjectProgress.objects.get(project=project)
+    return progress
+
+
+async def aget_project_progress(project: Project) -> ProjectProgress:
+    current_date = date.today()
+    progress = await ProjectProgress.objects.filter(project=project).afirst()
+    if progress is None or progress.counted_on != current_date:
+        await sync_to_async(refresh_project_progress)(
+            [project.pk], current_date
+        )
+        progress = await ProjectProgress.objects.aget(project=project)
+    return progress
+
+
+def find_inconsistent_progress(
+    current_date: date | None = None,
+) -> list[tuple[int, dict, dict]]:
+    """
+    Compare stored counters with the live aggregate and return
+    ``(project_id, stored, actual)`` for every mismatch.
+    """
+    current_date = current_date or date.today()
+    counts = count_project_tasks(current_date=current_date)
+    stored = {
+        row.pop("project_id"): row
+        for row in ProjectProgress.objects.values(
+            "project_id", "total_tasks", "completed_tasks", "overdue_tasks"
+        )
+    }
+    empty = {"total_tasks": 0, "completed_tasks": 0, "overdue_tasks": 0}
+
+    mismatches = []
+    for project_id in Project.objects.values_list("pk", flat=True):
+        actual = counts.get(project_id, empty)
+        current = stored.get(project_id)
+        if current != actual:
+            mismatches.append((project_id, current, actual))
+    return mismatches
@@ -0,0 +1,114 @@
+from uuid import uuid4
+
+from asgiref.local import Local
+from asgiref.sync import sync_to_async
+
+from django.core.cache import caches
+from django.db import models, transaction
+
+from task_manager.fragments import FRAGMENT_CACHE
+from task_manager.models import Position, TaskType
+
+# Seconds before a stored table is read again from the database.
+REFERENCE_TIMEOUT = 3600
+
+
+class ReferenceTable:
+    """
+    All rows of a small, rarely changed table, precomputed in the shared
+    fragment cache under a version stamp and kept per process until the
+    stamp changes. Saving or deleting a row reloads the table once the
+    change commits (see task_manager.signals), so pages never query it;
+    until then the writing transaction reads the table from the database.
+    The rows are shared: never modify them.
+    """
+
+    def __init__(self, model: type[models.Model]) -> None:
+        self.model = model
+        self.local: tuple[str | None, list] = (None, [])
+        # Per connection: the on-commit callbacks of its uncommitted
+        # changes, and the rows as its transaction sees them.
+        self.uncommitted = Local()
+
+    @property
+    def stamp_key(self) -> str:
+        return f"reference:{self.model._meta.label_lower}"
+
+    def rows_key(self, version: str) -> str:
+        return f"{self.stamp_key}:{version}"
+
+    def all(self) -> list[models.Model]:
+        rows = self.uncommitted_rows()
+        if rows is not None:
+            return rows
+        cache = caches[FRAGMENT_CACHE]
+        version = cache.get(self.stamp_key)
+        local_version, rows = self.local
+        if version is None or version != local_version:
+            rows = version and cache.get(self.rows_key(version))
+            if rows is None:
+                version, rows = self.refresh()
+            self.local = (version, rows)
+        return rows
+
+    async def aall(self) -> list[models.Model]:
+        return await sync_to_async(self.all)()
+
+    def changed(self) -> None:
+        """
+        Drop the process-local copy after a row is saved or deleted, reload
+        the table for this transaction and publish it once the change
+        commits.
+        """
+        self.local = (None, [])
+
+        def publish() -> None:
+            if getattr(self.uncommitted, "state", None) is not None:
+                self.uncommitted.state = None
+                self.refresh()
+
+        self.uncommitted.state = (
+            (*self.queued_callbacks(), publish),
+            list(self.model._default_manager.all()),
+        )
+        transaction.on_commit(publish)
+
+    def queued_callbacks(self) -> tuple:
+        """The publish callbacks of this connection that can still run."""
+        state = getattr(self.uncommitted, "state", None)
+        if state is None:
+            return ()
+        # A rollback drops the callbacks queued since its savepoint.
+        queued = {
+            func for _, func, _ in transaction.get_connection().run_on_commit
+        }
+        return tuple(func for func in state[0] if func in queued)
+
+    def uncommitted_rows(self) -> list[models.Model] | None:
+        """The rows in a transaction that changed them, else None."""
+        state = getattr(self.uncommitted, "state", None)
+        if state is None:
+            return None
+        callbacks, rows = state
+        live = self.queued_callbacks()
+        if not live:
+            self.uncommitted.state = None
+            return None
+        if live != callbacks:
+            rows = list(self.model._default_manager.all())
+            self.uncommitted.state = (live, rows)
+        return rows
+
+    def refresh(self) -> tuple[str, list[models.Model]]:
+        rows = list(self.model._default_manager.all())
+        version = uuid4().hex
+        cache = caches[FRAGMENT_CACHE]
+        cache.set(self.rows_key(version), rows, REFERENCE_TIMEOUT)
+        cache.set(self.stamp_key, version, REFERENCE_TIMEOUT)
+        return version, rows
+
+
+task_types = ReferenceTable(TaskType)
+positions = ReferenceTable(Position)
+
+TABLES = {table.model: table for table in (task_types, positions)}
@@ -0,0 +1,44 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.db import DEFAULT_DB_ALIAS
+
+
+@dataclass
+class Routing:
+    """Where the current request reads from."""
+
+    replica: str | None = None
+    wrote: bool = False
+
+
+# Set per request by ReplicaRoutingMiddleware; None outside requests.
+routing: ContextVar[Routing | None] = ContextVar("routing", default=None)
+
+
+class ReplicaRouter:
+    """
+    Send reads to the replica picked for the current request, until the
+    request writes; everything else goes to the primary. Replicas are
+    copies of the primary, so only the primary is migrated.
+    """
+
+    def db_for_read(self, model, **hints) -> str:
+        state = routing.get()
+        if state is not None and state.replica and not state.wrote:
+            return state.replica
+        # Explicit, or reads of related objects would follow the
+        # instance to the replica it was loaded from.
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints) -> str:
+        state = routing.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, **hints) -> bool:
+        return db == DEFAULT_DB_ALIAS
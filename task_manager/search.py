@@ -0,0 +1,132 @@
+from typing import Iterable
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import QuerySet
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+from task_manager.models import Task
+
+TASK_FTS_TABLE = "task_manager_task_fts"
+
+
+class IContainsSearchBackend:
+    """Case-insensitive substring search, portable across databases."""
+
+    def search(
+        self, queryset: QuerySet, field_name: str, term: str
+    ) -> QuerySet:
+        if not term:
+            return queryset
+        return queryset.filter(**{f"{field_name}__icontains": term})
+
+
+class PostgresSearchBackend(IContainsSearchBackend):
+    """
+    Ranked full-text search over task name and description; other
+    fields keep ``icontains``, which is served by the pg_trgm GIN indexes.
+    """
+
+    config = "english"
+
+    def search(
+        self, queryset: QuerySet, field_name: str, term: str
+    ) -> QuerySet:
+        if not term or queryset.model is not Task:
+            return super().search(queryset, field_name, term)
+
+        from django.contrib.postgres.search import (
+            SearchQuery,
+            SearchRank,
+            SearchVector,
+        )
+
+        # Must match the expression of the task_search_vector_idx index.
+        vector = SearchVector("name", "description", config=self.config)
+        query = SearchQuery(term, config=self.config, search_type="websearch")
+        return rank(
+            queryset.annotate(search_vector=vector)
+            .filter(search_vector=query)
+            .annotate(search_rank=SearchRank(vector, query)),
+            descending=True,
+        )
+
+
+class SQLiteFTSSearchBackend(IContainsSearchBackend):
+    """
+    Ranked prefix search on tasks through an FTS5 table that signals
+    keep in sync; other fields keep ``icontains``.
+    """
+
+    def search(
+        self, queryset: QuerySet, field_name: str, term: str
+    ) -> QuerySet:
+        match = fts_query(term)
+        if not match or queryset.model is not Task:
+            return super().search(queryset, field_name, term)
+
+        task_id = f'"{Task._meta.db_table}"."id"'
+        matching = RawSQL(
+            f"SELECT rowid FROM {TASK_FTS_TABLE} "
+            f"WHERE {TASK_FTS_TABLE} MATCH %s",
+            [match],
+        )
+        # bm25() is lower for better matches.
+        score = RawSQL(
+            f"SELECT bm25({TASK_FTS_TABLE}) FROM {TASK_FTS_TABLE} "
+            f"WHERE {TASK_FTS_TABLE} MATCH %s AND rowid = {task_id}",
+            [match],
+        )
+        return rank(
+            queryset.filter(pk__in=matching).annotate(search_rank=score),
+            descending=False,
+        )
+
+
+def rank(queryset: QuerySet, descending: bool) -> QuerySet:
+    ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+    search_rank = "-search_rank" if descending else "search_rank"
+    return queryset.order_by(search_rank, *ordering)
+
+
+def fts_query(term: str) -> str:
+    """Turn user input into an FTS5 query matching every word prefix."""
+    words = term.split()
+    return " ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
+
+
+def get_search_backend() -> IContainsSearchBackend:
+    return import_string(settings.SEARCH_BACKEND)()
+
+
+def index_tasks(task_ids: Iterable[int]) -> None:
+    if connection.vendor != "sqlite":
+        return
+
+    rows = list(
+        Task.objects.filter(pk__in=task_ids)
+        .order_by()
+        .values_list("pk", "name", "description")
+    )
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"DELETE FROM {TASK_FTS_TABLE} WHERE rowid = %s",
+            [(pk,) for pk, _, _ in rows],
+        )
+        cursor.executemany(
+            f"INSERT INTO {TASK_FTS_TABLE} (rowid, name, description) "
+            f"VALUES (%s, %s, %s)",
+            rows,
+        )
+
+
+def unindex_tasks(task_ids: Iterable[int]) -> None:
+    if connection.vendor != "sqlite":
+        return
+
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f"DELETE FROM {TASK_FTS_TABLE} WHERE rowid = %s",
+            [(pk,) for pk in task_ids],
+        )
@@ -0,0 +1,166 @@
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from task_manager.models import (
+    Position,
+    Project,
+    Task,
+    TaskType,
+    Team,
+    tasks_bulk_changed,
+)
+
+TASK_TYPES = ("Bug", "Breaking change", "New feature", "QA", "Refactoring")
+POSITIONS = ("Developer", "QA engineer", "Designer", "DevOps", "Manager")
+
+
+@dataclass
+class SeedConfig:
+    projects: int = 10
+    teams_per_project: int = 2
+    workers: int = 100
+    tasks: int = 10_000
+    completed_ratio: float = 0.6
+    overdue_ratio: float = 0.2
+    # Relative weights of High, Medium and Low priorities.
+    priority_weights: tuple[int, int, int] = (1, 3, 2)
+    min_assignees: int = 1
+    max_assignees: int = 3
+    deadline_days: int = 180
+    batch_size: int = 5000
+    seed: int | None = None
+
+
+def seed(config: SeedConfig, log=None) -> dict:
+    """Bulk-create a synthetic organisation and return the row counts."""
+    rng = random.Random(config.seed)
+    today = date.today()
+    log = log or (lambda message: None)
+
+    with transaction.atomic():
+        task_types = [
+            TaskType.objects.get_or_create(name=name)[0] for name in TASK_TYPES
+        ]
+        positions = [
+            Position.objects.get_or_create(name=name)[0] for name in POSITIONS
+        ]
+
+        projects = Project.objects.bulk_create(
+            Project(
+                project_name=f"Project {i}",
+                deadline=today + timedelta(
+                    days=rng.randint(-30, config.deadline_days)
+                ),
+                status=rng.choices(
+                    Project.StatusChoices.values, weights=(6, 2, 1, 1)
+                )[0],
+                description="Seeded project",
+            )
+            for i in range(config.projects)
+        )
+        teams = Team.objects.bulk_create(
+            Team(name=f"Team {project.pk}-{i}", project=project)
+            for project in projects
+            for i in range(config.teams_per_project)
+        )
+        log(f"{len(projects)} projects, {len(teams)} teams")
+
+        password = make_password(None)
+        workers = get_user_model().objects.bulk_create(
+            (
+                get_user_model()(
+                    username=f"seed_worker_{i}_{rng.getrandbits(32):x}",
+                    password=password,
+                    first_name=f"Worker{i}",
+                    last_name="Seed",
+                    position=rng.choice(positions),
+                    team=rng.choice(teams) if teams else None,
+                    is_team_lead=rng.random() < 0.1,
+                )
+                for i in range(config.workers)
+            ),
+            batch_size=config.batch_size,
+        )
+        log(f"{len(workers)} workers")
+
+    created = 0
+    while created < config.tasks:
+        size = min(config.batch_size, config.tasks - created)
+        with transaction.atomic():
+            create_task_batch(
+                rng, config, size, created, today,
+                task_types, projects, workers,
+            )
+        created += size
+        log(f"{created} tasks")
+
+    return {
+        "projects": len(projects),
+        "teams": len(teams),
+        "workers": len(workers),
+        "tasks": created,
+    }
+
+
+def create_task_batch(
+    rng: random.Random,
+    config: SeedConfig,
+    size: int,
+    offset: int,
+    today: date,
+    task_types: list,
+    projects: list,
+    workers: list,
+) -> None:
+    priorities = Task.PriorityChoices.values
+    tasks = []
+    for i in range(size):
+        is_completed = rng.random() < config.completed_ratio
+        if not is_completed and rng.random() < config.overdue_ratio:
+            deadline = today - timedelta(
+                days=rng.randint(1, config.deadline_days)
+            )
+        else:
+            deadline = today + timedelta(
+                days=rng.randint(0, config.deadline_days)
+            )
+        tasks.append(Task(
+            name=f"Task {offset + i}",
+            description=f"Seeded task {offset + i}",
+            deadline=deadline,
+            is_completed=is_completed,
+            priority=rng.choices(priorities, config.priority_weights)[0],
+            task_type=rng.choice(task_types),
+            project=rng.choice(projects) if projects else None,
+        ))
+    tasks = Task.objects.bulk_create(tasks)
+
+    if not workers:
+        return
+
+    through = Task.assignees.through
+    through.objects.bulk_create(
+        [
+            through(task_id=task.pk, worker_id=worker.pk)
+            for task in tasks
+            for worker in rng.sample(
+                workers,
+                min(
+                    len(workers),
+                    rng.randint(config.min_assignees, config.max_assignees),
+                ),
+            )
+        ],
+        ignore_conflicts=True,
+    )
+    tasks_bulk_changed.send(
+        sender=Task,
+        task_ids=[task.pk for task in tasks],
+        project_ids={task.project_id for task in tasks if task.project_id},
+        fields={"assignees"},
+    )
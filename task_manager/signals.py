@@ -0,0 +1,627 @@
+from datetime import date
+
+from django.contrib.auth.signals import user_logged_in
+from django.db.models import QuerySet
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from task_manager.auth import forget_users, load_user
+from task_manager.fragments import bump, bump_reference
+from task_manager.inbox import (
+    UPDATED_COLUMNS,
+    add_to_inbox,
+    refresh_inbox,
+    sync_inbox,
+    sync_inbox_fields,
+)
+from task_manager.models import (
+    Project,
+    ProjectProgress,
+    InboxEntry,
+    Position,
+    Task,
+    TaskType,
+    Team,
+    Worker,
+    tasks_bulk_changed,
+)
+from task_manager.live import (
+    publish_assignments,
+    publish_task_changes,
+    publish_task_deleted,
+    publish_unassignments,
+)
+from task_manager.outbox import CREATED, DELETED, UPDATED, record_changes
+from task_manager.progress import refresh_project_progress
+from task_manager.reference import TABLES
+from task_manager.workload import (
+    PROJECT,
+    TEAM,
+    WORKER,
+    assignment_scopes,
+    forget_workload,
+    refresh_workloads,
+    worker_teams,
+)
+from task_manager.search import index_tasks, unindex_tasks
+
+
+def is_project_deletion(origin) -> bool:
+    if isinstance(origin, QuerySet):
+        return origin.model is Project
+    return isinstance(origin, Project)
+
+
+@receiver(pre_save, sender=Task)
+def remember_previous_project(sender, instance: Task, **kwargs) -> None:
+    instance._previous_project_id = (
+        Task.objects.filter(pk=instance.pk)
+        .values_list("project_id", flat=True)
+        .first()
+        if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=Task)
+def update_progress_on_task_save(sender, instance: Task, **kwargs) -> None:
+    refresh_project_progress({
+        instance.project_id,
+        getattr(instance, "_previous_project_id", None),
+    })
+
+
+@receiver(post_delete, sender=Task)
+def update_progress_on_task_delete(
+    sender, instance: Task, origin=None, **kwargs
+) -> None:
+    if not is_project_deletion(origin):
+        refresh_project_progress([instance.project_id])
+
+
+def changes_any(fields: set | None, names: set) -> bool:
+    return fields is None or bool(fields & names)
+
+
+@receiver(tasks_bulk_changed, sender=Task)
+def update_progress_on_bulk_change(
+    sender, project_ids, fields, **kwargs
+) -> None:
+    if changes_any(
+        fields, {"is_completed", "deadline", "project", "project_id"}
+    ):
+        refresh_project_progress(project_ids)
+
+
+@receiver(post_save, sender=Task)
+def index_task_on_save(sender, instance: Task, **kwargs) -> None:
+    index_tasks([instance.pk])
+
+
+@receiver(post_delete, sender=Task)
+def unindex_task_on_delete(sender, instance: Task, **kwargs) -> None:
+    unindex_tasks([instance.pk])
+
+
+@receiver(tasks_bulk_changed, sender=Task)
+def index_tasks_on_bulk_change(sender, task_ids, fields, **kwargs) -> None:
+    if changes_any(fields, {"name", "description"}):
+        index_tasks(task_ids)
+
+
+@receiver(post_save, sender=Task)
+def update_inbox_on_task_save(
+    sender, instance: Task, created: bool, **kwargs
+) -> None:
+    # A new task has no assignees until they are added.
+    if not created:
+        sync_inbox(instance)
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def update_inbox_on_assignees_change(
+    sender, instance, action: str, reverse: bool, pk_set, **kwargs
+) -> None:
+    entries = InboxEntry.objects.filter(
+        **{"worker_id" if reverse else "task_id": instance.pk}
+    )
+    if action == "post_add":
+        if reverse:
+            add_to_inbox(pk_set, [instance.pk])
+        else:
+            add_to_inbox([instance.pk], pk_set)
+    elif action == "post_remove":
+        entries.filter(
+            **{"task_id__in" if reverse else "worker_id__in": pk_set}
+        ).delete()
+    elif action == "post_clear":
+        entries.delete()
+
+
+@receiver(tasks_bulk_changed, sender=Task)
+def update_inbox_on_bulk_change(sender, task_ids, fields, **kwargs) -> None:
+    if changes_any(fields, {"assignees"}):
+        refresh_inbox(task_ids)
+    elif changes_any(fields, set(UPDATED_COLUMNS)):
+        sync_inbox_fields(task_ids, fields)
+
+
+@receiver(post_save, sender=Project)
+def create_project_progress(
+    sender, instance: Project, created: bool, raw: bool = False, **kwargs
+) -> None:
+    if created and not raw:
+        ProjectProgress.objects.get_or_create(
+            project=instance, defaults={"counted_on": date.today()}
+        )
+
+
+def is_task_deletion(origin) -> bool:
+    if isinstance(origin, QuerySet):
+        return origin.model is Task
+    return origin is None or isinstance(origin, Task)
+
+
+def task_worker_ids(task_ids) -> set[int]:
+    return set(
+        Task.assignees.through.objects.filter(task_id__in=task_ids)
+        .values_list("worker_id", flat=True)
+    )
+
+
+@receiver(post_save, sender=Task)
+def bump_fragments_on_task_save(
+    sender, instance: Task, created: bool, **kwargs
+) -> None:
+    bump("project", [
+        instance.project_id,
+        getattr(instance, "_previous_project_id", None),
+    ])
+    if not created:
+        bump("worker", task_worker_ids([instance.pk]))
+
+
+@receiver(pre_delete, sender=Task)
+def bump_fragments_on_task_delete(
+    sender, instance: Task, origin=None, **kwargs
+) -> None:
+    # Project and task type deletions bump their tasks' fragments at once.
+    if is_task_deletion(origin):
+        bump("project", [instance.project_id])
+        bump("worker", task_worker_ids([instance.pk]))
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def bump_fragments_on_assignees_change(
+    sender, instance, action: str, reverse: bool, pk_set, **kwargs
+) -> None:
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if reverse:
+        task_ids = pk_set
+        if task_ids is None:
+            task_ids = instance.tasks.values_list("pk", flat=True)
+        bump("worker", [instance.pk])
+        bump("project", Task.objects.filter(pk__in=task_ids).values_list(
+            "project_id", flat=True
+        ))
+    else:
+        bump("worker", pk_set or task_worker_ids([instance.pk]))
+        bump("project", [instance.project_id])
+
+
+@receiver(tasks_bulk_changed, sender=Task)
+def bump_fragments_on_bulk_change(
+    sender, task_ids, project_ids, worker_ids=(), **kwargs
+) -> None:
+    bump("project", project_ids)
+    bump("worker", task_worker_ids(task_ids) | set(worker_ids))
+
+
+@receiver(post_save, sender=Project)
+def bump_fragments_on_project_save(
+    sender, instance: Project, **kwargs
+) -> None:
+    bump("project", [instance.pk])
+
+
+@receiver(pre_delete, sender=Project)
+def bump_fragments_on_project_delete(
+    sender, instance: Project, **kwargs
+) -> None:
+    bump("worker", Task.assignees.through.objects.filter(
+        task__project=instance
+    ).values_list("worker_id", flat=True))
+
+
+@receiver(pre_save, sender=Team)
+def remember_previous_team_project(
+    sender, instance: Team, **kwargs
+) -> None:
+    instance._previous_project_id = (
+        Team.objects.filter(pk=instance.pk)
+        .values_list("project_id", flat=True)
+        .first()
+        if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=Team)
+def bump_fragments_on_team_save(sender, instance: Team, **kwargs) -> None:
+    bump("team", [instance.pk])
+    bump("project", [
+        instance.project_id,
+        getattr(instance, "_previous_project_id", None),
+    ])
+
+
+@receiver(post_delete, sender=Team)
+def bump_fragments_on_team_delete(
+    sender, instance: Team, **kwargs
+) -> None:
+    bump("project", [instance.project_id])
+
+
+def changes_roster(update_fields) -> bool:
+    return changes_any(
+        update_fields and set(update_fields), {"username", "team", "team_id"}
+    )
+
+
+@receiver(pre_save, sender=Worker)
+def remember_previous_worker(
+    sender, instance: Worker, update_fields=None, **kwargs
+) -> None:
+    # Logins save last_login only, which no fragment shows.
+    if instance.pk and changes_roster(update_fields):
+        instance._previous = (
+            Worker.objects.filter(pk=instance.pk)
+            .values_list("team_id", "username")
+            .first()
+        )
+
+
+@receiver(post_save, sender=Worker)
+def bump_fragments_on_worker_save(
+    sender, instance: Worker, update_fields=None, **kwargs
+) -> None:
+    if not changes_roster(update_fields):
+        return
+    previous_team_id, previous_username = getattr(
+        instance, "_previous", None
+    ) or (None, instance.username)
+    bump("worker", [instance.pk])
+    bump("team", [instance.team_id, previous_team_id])
+    if previous_username != instance.username:
+        bump_reference()
+
+
+@receiver(post_delete, sender=Worker)
+def bump_fragments_on_worker_delete(
+    sender, instance: Worker, **kwargs
+) -> None:
+    bump("team", [instance.team_id])
+    bump_reference()
+
+
+@receiver(post_save, sender=TaskType)
+@receiver(post_delete, sender=TaskType)
+@receiver(post_save, sender=Position)
+@receiver(post_delete, sender=Position)
+def bump_fragments_on_reference_change(sender, **kwargs) -> None:
+    bump_reference()
+
+
+@receiver(post_save, sender=TaskType)
+@receiver(post_delete, sender=TaskType)
+@receiver(post_save, sender=Position)
+@receiver(post_delete, sender=Position)
+def refresh_reference_table(sender, **kwargs) -> None:
+    TABLES[sender].changed()
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def touch_tasks_on_assignees_change(
+    sender, instance, action: str, reverse: bool, pk_set, **kwargs
+) -> None:
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        Task.objects.filter(pk=instance.pk).touch()
+    elif pk_set is not None:
+        Task.objects.filter(pk__in=pk_set).touch()
+    else:
+        instance.tasks.touch()
+
+
+@receiver(tasks_bulk_changed, sender=Task)
+def touch_tasks_on_bulk_assign(sender, task_ids, fields, **kwargs) -> None:
+    if fields and "assignees" in fields:
+        Task.objects.filter(pk__in=task_ids).touch()
+
+
+@receiver(post_save, sender=Worker)
+@receiver(post_delete, sender=Worker)
+def forget_cached_worker(sender, instance: Worker, **kwargs) -> None:
+    forget_users([instance.pk])
+
+
+@receiver(user_logged_in)
+def cache_user_on_login(sender, user, **kwargs) -> None:
+    # After update_last_login, so the cached user is current.
+    load_user(user.pk)
+
+
+@receiver(post_save, sender=Team)
+@receiver(pre_delete, sender=Team)
+@receiver(post_save, sender=Position)
+def forget_cached_workers(
+    sender, instance, created: bool = False, **kwargs
+) -> None:
+    if not created:
+        forget_users(instance.workers.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Project)
+@receiver(pre_delete, sender=Project)
+def forget_cached_project_workers(
+    sender, instance: Project, created: bool = False, **kwargs
+) -> None:
+    if not created:
+        forget_users(
+            Worker.objects.filter(team__project=instance)
+            .values_list("pk", flat=True)
+        )
+
+
+@receiver(post_save, sender=Task)
+def update_workload_on_task_save(
+    sender, instance: Task, created: bool, **kwargs
+) -> None:
+    # A new task has no assignees until they are added.
+    worker_ids, team_ids = (
+        (set(), set()) if created else assignment_scopes([instance.pk])
+    )
+    refresh_workloads(worker_ids, team_ids, [
+        instance.project_id,
+        getattr(instance, "_previous_project_id", None),
+    ])
+
+
+@receiver(pre_delete, sender=Task)
+def remember_task_assignments(
+    sender, instance: Task, origin=None, **kwargs
+) -> None:
+    # Task type deletions cascade to their workload rows, and project
+    # deletions recount the assignees at once.
+    if is_task_deletion(origin):
+        instance._assignment_scopes = assignment_scopes([instance.pk])
+
+
+@receiver(post_delete, sender=Task)
+def update_workload_on_task_delete(
+    sender, instance: Task, **kwargs
+) -> None:
+    if hasattr(instance, "_assignment_scopes"):
+        refresh_workloads(
+            *instance._assignment_scopes, [instance.project_id]
+        )
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def update_workload_on_assignees_change(
+    sender, instance, action: str, reverse: bool, pk_set, **kwargs
+) -> None:
+    if action == "pre_clear" and not reverse:
+        instance._cleared_assignees = set(
+            instance.assignees.values_list("pk", flat=True)
+        )
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if reverse:
+        worker_ids = {instance.pk}
+    elif action == "post_clear":
+        worker_ids = getattr(instance, "_cleared_assignees", set())
+    else:
+        worker_ids = pk_set
+    refresh_workloads(worker_ids, worker_teams(worker_ids))
+
+
+@receiver(tasks_bulk_changed, sender=Task)
+def update_workload_on_bulk_change(
+    sender, task_ids, project_ids, fields, worker_ids=(), **kwargs
+) -> None:
+    if not changes_any(fields, {
+        "is_completed", "deadline", "priority", "task_type", "task_type_id",
+        "project", "project_id", "assignees",
+    }):
+        return
+    assignees, team_ids = assignment_scopes(task_ids)
+    worker_ids = set(worker_ids) - assignees
+    refresh_workloads(
+        assignees | worker_ids,
+        team_ids | worker_teams(worker_ids),
+        project_ids,
+    )
+
+
+@receiver(post_save, sender=Worker)
+def update_workload_on_team_change(
+    sender, instance: Worker, update_fields=None, **kwargs
+) -> None:
+    previous = getattr(instance, "_previous", None)
+    if changes_roster(update_fields) and previous:
+        previous_team_id = previous[0]
+        if previous_team_id != instance.team_id:
+            refresh_workloads(team_ids=[previous_team_id, instance.team_id])
+
+
+@receiver(post_delete, sender=Worker)
+def update_workload_on_worker_delete(
+    sender, instance: Worker, **kwargs
+) -> None:
+    forget_workload(WORKER, [instance.pk])
+    refresh_workloads(team_ids=[instance.team_id])
+
+
+@receiver(post_delete, sender=Team)
+def forget_team_workload(sender, instance: Team, **kwargs) -> None:
+    forget_workload(TEAM, [instance.pk])
+
+
+@receiver(pre_delete, sender=Project)
+def remember_project_assignments(
+    sender, instance: Project, **kwargs
+) -> None:
+    instance._assignment_scopes = assignment_scopes(
+        instance.tasks.values_list("pk", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Project)
+def update_workload_on_project_delete(
+    sender, instance: Project, **kwargs
+) -> None:
+    forget_workload(PROJECT, [instance.pk])
+    refresh_workloads(*instance._assignment_scopes)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Team)
+@receiver(post_save, sender=Worker)
+def record_save(
+    sender, instance, created: bool, update_fields=None, **kwargs
+) -> None:
+    if created:
+        record_changes(sender, [instance.pk], CREATED)
+    # Logins save last_login only, which the API does not return.
+    elif update_fields is None or set(update_fields) - {"last_login"}:
+        record_changes(sender, [instance.pk], UPDATED, update_fields)
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Team)
+@receiver(post_delete, sender=Worker)
+def record_delete(sender, instance, **kwargs) -> None:
+    record_changes(sender, [instance.pk], DELETED)
+
+
+@receiver(pre_delete, sender=Project)
+def record_project_teams_unset(
+    sender, instance: Project, **kwargs
+) -> None:
+    # The deletion sets their project to NULL without saving them.
+    record_changes(
+        Team,
+        instance.teams.values_list("pk", flat=True),
+        UPDATED,
+        ["project"],
+    )
+
+
+@receiver(pre_delete, sender=Team)
+def record_team_workers_unset(sender, instance: Team, **kwargs) -> None:
+    record_changes(
+        Worker,
+        instance.workers.values_list("pk", flat=True),
+        UPDATED,
+        ["team"],
+    )
+
+
+@receiver(pre_delete, sender=Worker)
+def record_worker_tasks_unassigned(
+    sender, instance: Worker, **kwargs
+) -> None:
+    record_changes(
+        Task,
+        instance.tasks.values_list("pk", flat=True),
+        UPDATED,
+        ["assignees"],
+    )
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def record_assignees_change(
+    sender, instance, action: str, reverse: bool, pk_set, **kwargs
+) -> None:
+    if action == "pre_clear" and reverse:
+        instance._cleared_tasks = set(
+            instance.tasks.values_list("pk", flat=True)
+        )
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if action != "post_clear" and not pk_set:
+        return
+
+    if not reverse:
+        task_ids = [instance.pk]
+    elif action == "post_clear":
+        task_ids = getattr(instance, "_cleared_tasks", set())
+    else:
+        task_ids = pk_set
+    record_changes(Task, task_ids, UPDATED, ["assignees"])
+
+
+@receiver(tasks_bulk_changed, sender=Task)
+def record_bulk_change(sender, task_ids, fields, **kwargs) -> None:
+    record_changes(
+        Task, task_ids, CREATED if fields is None else UPDATED, fields
+    )
+
+
+@receiver(post_save, sender=Task)
+def publish_task_save(sender, instance: Task, **kwargs) -> None:
+    publish_task_changes([instance.pk])
+
+
+@receiver(post_delete, sender=Task)
+def publish_task_delete(sender, instance: Task, **kwargs) -> None:
+    publish_task_deleted(instance.pk)
+
+
+@receiver(m2m_changed, sender=Task.assignees.through)
+def publish_assignees_change(
+    sender, instance, action: str, reverse: bool, pk_set, **kwargs
+) -> None:
+    if action == "post_clear":
+        # Remembered on pre_clear by the receivers above.
+        if reverse:
+            task_ids = getattr(instance, "_cleared_tasks", set())
+            worker_ids = [instance.pk]
+        else:
+            task_ids = [instance.pk]
+            worker_ids = getattr(instance, "_cleared_assignees", set())
+    elif action in ("post_add", "post_remove") and pk_set:
+        task_ids, worker_ids = (
+            (pk_set, [instance.pk]) if reverse else ([instance.pk], pk_set)
+        )
+    else:
+        return
+
+    if action == "post_add":
+        publish_assignments(task_ids, worker_ids)
+    else:
+        publish_unassignments(task_ids, worker_ids)
+    # The rows list the assignees.
+    publish_task_changes(task_ids)
+
+
+@receiver(tasks_bulk_changed, sender=Task)
+def publish_bulk_change(
+    sender, task_ids, fields, worker_ids=(), **kwargs
+) -> None:
+    publish_task_changes(task_ids)
+    if fields is None or "assignees" in fields:
+        # Replaced assignees lose the tasks, the current ones get them.
+        publish_unassignments(task_ids, worker_ids)
+        publish_assignments(task_ids)
@@ -0,0 +1,109 @@
+from datetime import date
+
+from django.db.models import Count, Exists, OuterRef, Q
+
+from task_manager.models import InboxEntry, Project, Task
+
+
+def percentage(part: int, total: int) -> float:
+    return round(part / total * 100, 2) if total else 0
+
+
+def get_task_stats(
+    worker_id: int | None = None,
+    project: Project | None = None,
+    current_date: date | None = None,
+) -> dict:
+    """
+    Compute the dashboard numbers for a worker and/or a project
+    with a single conditional aggregate query.
+    """
+    current_date = current_date or date.today()
+    completed = Q(is_completed=True)
+    not_completed = Q(is_completed=False)
+    overdue = Q(is_completed=False, deadline__lt=current_date)
+
+    tasks = Task.objects.all()
+    scopes = []
+    aggregates = {}
+
+    if worker_id is not None:
+        tasks = tasks.annotate(
+            is_assigned=Exists(
+                Task.assignees.through.objects.filter(
+                    task_id=OuterRef("pk"), worker_id=worker_id
+                )
+            )
+        )
+        mine = Q(is_assigned=True)
+        scopes.append(mine)
+        aggregates.update({
+            "num_all_tasks": Count("pk", filter=mine),
+            "num_completed_tasks": Count("pk", filter=mine & completed),
+            "num_not_completed_tasks":
+                Count("pk", filter=mine & not_completed),
+            "num_overdue_tasks": Count("pk", filter=mine & overdue),
+        })
+
+    if project is not None:
+        in_project = Q(project=project)
+        scopes.append(in_project)
+        aggregates.update({
+            "num_project_tasks": Count("pk", filter=in_project),
+            "num_project_completed_tasks":
+                Count("pk", filter=in_project & completed),
+            "num_project_overdue_tasks":
+                Count("pk", filter=in_project & overdue),
+        })
+
+    stats = dict.fromkeys(
+        (
+            "num_all_tasks",
+            "num_completed_tasks",
+            "num_not_completed_tasks",
+            "num_overdue_tasks",
+            "num_project_tasks",
+            "num_project_completed_tasks",
+            "num_project_overdue_tasks",
+        ),
+        0,
+    )
+
+    if scopes:
+        scope = scopes[0]
+        for other in scopes[1:]:
+            scope |= other
+        stats.update(tasks.filter(scope).aggregate(**aggregates))
+
+    stats["percentage_complete_project"] = percentage(
+        stats["num_project_completed_tasks"], stats["num_project_tasks"]
+    )
+    return stats
+
+
+def get_worker_stats(
+    worker_id: int, current_date: date | None = None
+) -> dict:
+    """The worker's dashboard numbers, counted from their inbox alone."""
+    return InboxEntry.objects.filter(worker_id=worker_id).aggregate(
+        **worker_stats_aggregates(current_date or date.today())
+    )
+
+
+async def aget_worker_stats(
+    worker_id: int, current_date: date | None = None
+) -> dict:
+    return await InboxEntry.objects.filter(worker_id=worker_id).aaggregate(
+        **worker_stats_aggregates(current_date or date.today())
+    )
+
+
+def worker_stats_aggregates(current_date: date) -> dict:
+    return {
+        "num_all_tasks": Count("pk"),
+        "num_completed_tasks": Count("pk", filter=Q(is_completed=True)),
+        "num_not_completed_tasks": Count("pk", filter=Q(is_completed=False)),
+        "num_overdue_tasks": Count(
+            "pk", filter=Q(is_completed=False, deadline__lt=current_date)
+        ),
+    }
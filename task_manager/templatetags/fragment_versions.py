@@ -0,0 +1,10 @@
+from django import template
+
+from task_manager.fragments import fragment_version
+
+register = template.Library()
+
+
+@register.simple_tag
+def version_stamp(scope: str, pk) -> str:
+    return fragment_version(scope, pk)
@@ -30,6 +30,14 @@ from task_manager.views import (
     PositionUpdateView,
     PositionDeleteView,
     SetTaskAsCompletedView,
+    TaskBulkActionView,
+    ExportView,
+    MetricsView,
+    ApiListView,
+    ApiDetailView,
+    ApiWorkloadView,
+    ChangesView,
+    LiveUpdatesView,
 )
 
 app_name = "task_manager"
@@ -39,6 +47,7 @@ urlpatterns = [
     path("tasks/<int:pk>/", TaskDetailView.as_view(), name="task-detail"),
     path("tasks/", TaskListView.as_view(), name="task-list"),
     path("tasks/create", TaskCreateView.as_view(), name="task-create"),
+    path("tasks/bulk/", TaskBulkActionView.as_view(), name="task-bulk"),
     path(
         "tasks/<int:pk>/update/",
         TaskUpdateView.as_view(),
@@ -143,4 +152,23 @@ urlpatterns = [
         SetTaskAsCompletedView.as_view(),
         name="set-task-as-completed",
     ),
+    path(
+        "export/<str:resource>.<str:export_format>",
+        ExportView.as_view(),
+        name="export",
+    ),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
+    path("changes/", ChangesView.as_view(), name="changes"),
+    path("live/", LiveUpdatesView.as_view(), name="live"),
+    path("api/<str:resource>/", ApiListView.as_view(), name="api-list"),
+    path(
+        "api/<str:resource>/<int:pk>/",
+        ApiDetailView.as_view(),
+        name="api-detail",
+    ),
+    path(
+        "api/<str:resource>/<int:pk>/workload/",
+        ApiWorkloadView.as_view(),
+        name="api-workload",
+    ),
 ]
@@ -1,15 +1,28 @@
+import asyncio
+import json
 from datetime import datetime
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import QuerySet, Q
-from django.http import HttpResponse, HttpRequest, HttpResponseRedirect
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Max, Prefetch, QuerySet
+from django.http import (
+    HttpResponse,
+    HttpRequest,
+    HttpResponseRedirect,
+    Http404,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import render, get_object_or_404
 from django.urls import reverse_lazy, reverse
+from django.utils.functional import SimpleLazyObject
 from django.views import generic, View
-from django.views.generic import TemplateView
 
+from task_manager import reference
 from task_manager.forms import (
     TaskForm,
     ProjectForm,
@@ -18,56 +31,145 @@ from task_manager.forms import (
     WorkerCreationForm,
     TeamForm,
     SearchForm,
+    TaskBulkActionForm,
+)
+from task_manager.api import (
+    RESOURCES as API_RESOURCES,
+    ApiError,
+    get_instance,
+    parse_body,
+    read_detail,
+    read_list,
+    save,
+)
+from task_manager.async_views import (
+    AsyncDetailView,
+    AsyncListView,
+    AsyncLoginRequiredMixin,
+    AsyncTemplateView,
+    alist,
+)
+from task_manager.bulk import (
+    complete_tasks,
+    move_to_project,
+    reassign_tasks,
+    select_tasks,
+    set_priority,
+)
+from task_manager.conditional import (
+    AsyncConditionalGetMixin,
+    ConditionalGetMixin,
+)
+from task_manager.exports import FORMATS, RESOURCES, export
+from task_manager.filters import filter_projects, filter_tasks
+from task_manager.fragments import stamp_key
+from task_manager.inbox import Inbox
+from task_manager.instrumentation import metrics
+from task_manager.live import TASKS, get_broker, worker_channel
+from task_manager.models import (
+    ACTIVE,
+    COMPLETED,
+    OVERDUE,
+    Task,
+    Project,
+    Team,
+    TaskType,
+    Position,
+)
+from task_manager.outbox import (
+    CHANGES_BATCH_SIZE,
+    CHANGES_MAX_BATCH_SIZE,
+    changes_page,
 )
-from task_manager.models import Task, Project, Team, TaskType, Position
+from task_manager.pagination import KeysetPaginationMixin, ShowMore
+from task_manager.progress import aget_project_progress
+from task_manager.stats import aget_worker_stats, get_worker_stats
+from task_manager.workload import (
+    PROJECT,
+    TEAM,
+    WORKER,
+    WORKLOAD,
+    get_workload,
+    get_workloads,
+)
+
+# Rows of each task table on the project page, and per "Show more".
+TASK_TABLE_SIZE = 50
 
 
-class IndexView(LoginRequiredMixin, TemplateView):
+class IndexView(
+    AsyncLoginRequiredMixin, AsyncConditionalGetMixin, AsyncTemplateView
+):
     template_name = "task_manager/index.html"
 
-    def get_context_data(self, **kwargs) -> dict:
-        context = super().get_context_data(**kwargs)
+    async def aget_freshness(self) -> dict:
+        return await get_user_model().objects.filter(
+            pk=self.request.user.pk
+        ).aaggregate(
+            tasks_changed=Max("tasks__updated_at"),
+            num_tasks=Count("tasks", distinct=True),
+            team_changed=Max("team__workers__updated_at"),
+            num_team_workers=Count("team__workers", distinct=True),
+            project_changed=Max("team__project__updated_at"),
+            project_tasks=Max("team__project__progress__total_tasks"),
+            project_completed=Max(
+                "team__project__progress__completed_tasks"
+            ),
+        )
+
+    async def aget_context_data(self, **kwargs) -> dict:
+        context = self.get_context_data(**kwargs)
         current_user = self.request.user
         current_user_id = current_user.id
+        current_date = datetime.now().date()
+
+        async def get_project() -> tuple:
+            # Loaded with the user, see task_manager.auth.
+            team = current_user.team
+            if team is None or team.project is None:
+                # The dashboard is shown without the progress block.
+                return None, None
+            project = team.project
+            return project, await aget_project_progress(project)
 
-        tasks = Task.objects.prefetch_related("assignees").filter(
-            assignees=current_user_id)
-        project = current_user.team.project
-        num_completed_tasks = tasks.filter(is_completed=True).count()
-        num_not_completed_tasks = tasks.filter(is_completed=False).count()
+        inbox = Inbox(current_user_id, is_completed=False)
         team_workers = (
             get_user_model()
-            .objects.filter(team=current_user.team)
+            .objects.filter(team_id=current_user.team_id)
             .exclude(id=current_user_id)
         )
-        current_date = datetime.now().date()
-        project_tasks = Task.objects.filter(project=project)
-
-        percentage_complete_project = (
-            round(
-                project_tasks.filter(is_completed=True).count()
-                / project_tasks.filter(is_completed=False).count()
-                * 100,
-                2,
-            )
-            if project_tasks.exists() else 0
+        (project, progress), stats, team_workers, _ = await asyncio.gather(
+            get_project(),
+            aget_worker_stats(current_user_id, current_date),
+            alist(team_workers),
+            inbox.aload(),
         )
 
+        context.update(stats)
         context.update({
-            "tasks": tasks,
+            "tasks": inbox.open_tasks,
             "project": project,
-            "num_completed_tasks": num_completed_tasks,
-            "num_not_completed_tasks": num_not_completed_tasks,
             "team_workers": team_workers,
             "current_date": current_date,
-            "percentage_complete_project": percentage_complete_project,
+            "percentage_complete_project": (
+                progress.percentage_complete if progress else 0
+            ),
         })
 
         return context
 
 
-class TaskDetailView(LoginRequiredMixin, generic.DetailView):
+class TaskDetailView(
+    AsyncLoginRequiredMixin, AsyncConditionalGetMixin, AsyncDetailView
+):
     model = Task
+    queryset = Task.objects.select_related("task_type", "project")
+
+    async def aget_freshness(self) -> dict:
+        return await Task.objects.filter(pk=self.kwargs["pk"]).aaggregate(
+            task_changed=Max("updated_at"),
+            project_changed=Max("project__updated_at"),
+        )
 
     def get_context_data(self, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
@@ -79,9 +181,20 @@ class TaskDetailView(LoginRequiredMixin, generic.DetailView):
         return context
 
 
-class ProjectDetailView(LoginRequiredMixin, generic.DetailView):
+class ProjectDetailView(
+    LoginRequiredMixin, ConditionalGetMixin, generic.DetailView
+):
     model = Project
 
+    def get_freshness(self) -> dict:
+        return Project.objects.filter(pk=self.kwargs["pk"]).aggregate(
+            project_changed=Max("updated_at"),
+            tasks_changed=Max("tasks__updated_at"),
+            num_tasks=Count("tasks", distinct=True),
+            teams_changed=Max("teams__updated_at"),
+            num_teams=Count("teams", distinct=True),
+        )
+
     def get_context_data(self, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
         current_date = datetime.now()
@@ -90,16 +203,44 @@ class ProjectDetailView(LoginRequiredMixin, generic.DetailView):
         context["days_difference"] = days_difference
         context["is_overdue"] = days_difference > 0
         context["current_date"] = current_date.date()
-        context["completed_tasks"] = project.tasks.filter(is_completed=True)
+        tasks = project.tasks.for_task_table(current_date.date())
+        context["tasks"] = ShowMore(
+            tasks.in_buckets(
+                ACTIVE, OVERDUE, current_date=current_date.date()
+            ),
+            self.request.GET,
+            "open_pages",
+            TASK_TABLE_SIZE,
+        )
+        context["completed_tasks"] = ShowMore(
+            tasks.in_buckets(COMPLETED),
+            self.request.GET,
+            "completed_pages",
+            TASK_TABLE_SIZE,
+        )
+        context["workload"] = SimpleLazyObject(
+            lambda: get_workload(PROJECT, project.pk)
+        )
         return context
 
 
-class TaskListView(LoginRequiredMixin, generic.ListView):
+class TaskListView(
+    AsyncLoginRequiredMixin,
+    AsyncConditionalGetMixin,
+    KeysetPaginationMixin,
+    AsyncListView,
+):
     model = Task
     context_object_name = "task_list"
     template_name = "task_manager/task_list.html"
     paginate_by = 20
 
+    async def aget_freshness(self) -> dict:
+        queryset = await self.aget_queryset()
+        return await queryset.aaggregate(
+            tasks_changed=Max("updated_at"), num_tasks=Count("pk")
+        )
+
     def get_context_data(self, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
         name = self.request.GET.get("search_field", "")
@@ -107,41 +248,44 @@ class TaskListView(LoginRequiredMixin, generic.ListView):
         context["search_form"] = SearchForm(
             initial={"search_field": name}, field_name="name"
         )
-        context["task_types"] = TaskType.objects.all()
+        context["task_types"] = self.task_types
         return context
 
     def get_queryset(self) -> QuerySet:
-        queryset = Task.objects.all()
-        form = SearchForm(data=self.request.GET, field_name="name")
-        if form.is_valid():
-            if self.request.GET.get("overdue") == "true":
-                queryset = queryset.filter(
-                    deadline__lt=datetime.now().date(), is_completed=False
-                )
-
-            if self.request.GET.get("hide_completed") == "true":
-                queryset = queryset.filter(is_completed=False)
-
-            type_filters = Q()
-            for task_type in TaskType.objects.all():
-                if self.request.GET.get(task_type.name) == "true":
-                    type_filters |= Q(task_type=task_type)
-
-            if type_filters:
-                queryset = queryset.filter(type_filters)
-
-            return queryset.filter(
-                name__icontains=form.cleaned_data["search_field"])
-
-        return queryset
-
+        return filter_tasks(
+            Task.objects.for_task_table(),
+            self.request.GET,
+            getattr(self, "task_types", None),
+        )
 
-class ProjectListView(LoginRequiredMixin, generic.ListView):
+    async def aget_queryset(self) -> QuerySet:
+        # Shared by aget_freshness() and the page; the task types are
+        # read once for the filters and the filter form.
+        if not hasattr(self, "_queryset"):
+            self.task_types = await reference.task_types.aall()
+            self._queryset = self.get_queryset()
+        return self._queryset
+
+
+class ProjectListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    generic.ListView,
+):
     model = Project
     context_object_name = "project_list"
     template_name = "task_manager/project_list.html"
     paginate_by = 20
 
+    def get_freshness(self) -> dict:
+        return self.get_queryset().aggregate(
+            projects_changed=Max("updated_at"),
+            num_projects=Count("pk", distinct=True),
+            teams_changed=Max("teams__updated_at"),
+            num_teams=Count("teams", distinct=True),
+        )
+
     def get_context_data(self, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
         context["current_date"] = datetime.now().date()
@@ -152,22 +296,9 @@ class ProjectListView(LoginRequiredMixin, generic.ListView):
         return context
 
     def get_queryset(self) -> QuerySet:
-        queryset = Project.objects.all()
-        form = SearchForm(data=self.request.GET, field_name="project_name")
-        if form.is_valid():
-            if self.request.GET.get("overdue") == "true":
-                queryset = queryset.filter(
-                    deadline__lt=datetime.now().date(), status="Active"
-                )
-
-            if self.request.GET.get("active") == "true":
-                queryset = queryset.filter(status="Active")
-
-            return queryset.filter(
-                project_name__icontains=form.cleaned_data["search_field"]
-            )
-
-        return queryset
+        return filter_projects(
+            Project.objects.prefetch_related("teams"), self.request.GET
+        )
 
 
 class ProjectCreateView(LoginRequiredMixin, generic.CreateView):
@@ -188,12 +319,25 @@ class ProjectDeleteView(LoginRequiredMixin, generic.DeleteView):
     success_url = reverse_lazy("task_manager:project-list")
 
 
-class WorkerListView(LoginRequiredMixin, generic.ListView):
+class WorkerListView(
+    LoginRequiredMixin,
+    ConditionalGetMixin,
+    KeysetPaginationMixin,
+    generic.ListView,
+):
     model = get_user_model()
     context_object_name = "worker_list"
     template_name = "task_manager/worker_list.html"
     paginate_by = 20
 
+    def get_freshness(self) -> dict:
+        return self.get_queryset().aggregate(
+            workers_changed=Max("updated_at"),
+            num_workers=Count("pk"),
+            teams_changed=Max("team__updated_at"),
+            num_teams=Count("team", distinct=True),
+        )
+
     def get_context_data(self, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
         username = self.request.GET.get("search_field", "")
@@ -203,56 +347,124 @@ class WorkerListView(LoginRequiredMixin, generic.ListView):
         return context
 
     def get_queryset(self) -> QuerySet:
-        queryset = get_user_model().objects.all()
+        queryset = get_user_model().objects.select_related("team")
         form = SearchForm(data=self.request.GET, field_name="username")
         if form.is_valid():
-            return queryset.filter(
-                username__icontains=form.cleaned_data["search_field"]
-            )
+            return form.search(queryset)
 
         return queryset
 
 
-class WorkerDetailView(LoginRequiredMixin, generic.DetailView):
+class WorkerDetailView(
+    LoginRequiredMixin, ConditionalGetMixin, generic.DetailView
+):
     model = get_user_model()
-    queryset = get_user_model().objects.all().prefetch_related(
-        "tasks__task_type")
+    queryset = get_user_model().objects.select_related(
+        "position", "team__project")
+
+    def get_freshness(self) -> dict:
+        return get_user_model().objects.filter(
+            pk=self.kwargs["pk"]
+        ).aggregate(
+            worker_changed=Max("updated_at"),
+            team_changed=Max("team__updated_at"),
+            project_changed=Max("team__project__updated_at"),
+            tasks_changed=Max("tasks__updated_at"),
+            num_tasks=Count("tasks"),
+        )
 
     def get_context_data(self, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
-        context["current_date"] = datetime.now().date()
-        tasks = Task.objects.prefetch_related("assignees").filter(
-            assignees=context["worker"].id
-        )
-        context["num_all_tasks"] = tasks.count()
-        not_completed_tasks = tasks.filter(is_completed=False)
-        context["not_completed_tasks"] = not_completed_tasks
-        context["num_not_completed_tasks"] = not_completed_tasks.count()
-        completed_tasks = tasks.filter(is_completed=True)
-        context["completed_tasks"] = completed_tasks
-        context["num_completed_tasks"] = completed_tasks.count()
+        current_date = datetime.now().date()
+        context["current_date"] = current_date
+        worker_id = context["worker"].id
+        context.update(get_worker_stats(worker_id, current_date))
+        inbox = Inbox(worker_id)
+        context["not_completed_tasks"] = inbox.open_tasks
+        context["completed_tasks"] = inbox.completed_tasks
         return context
 
 
-class TeamListView(LoginRequiredMixin, generic.ListView):
+class TeamListView(
+    LoginRequiredMixin, ConditionalGetMixin, generic.ListView
+):
     model = Team
     context_object_name = "team_list"
     template_name = "task_manager/team_list.html"
     paginate_by = 20
+    queryset = Team.objects.select_related("project").prefetch_related(
+        Prefetch(
+            "workers",
+            queryset=get_user_model().objects.only("id", "username", "team"),
+        )
+    )
+
+    def get_freshness(self) -> dict:
+        return Team.objects.aggregate(
+            teams_changed=Max("updated_at"),
+            num_teams=Count("pk", distinct=True),
+            projects_changed=Max("project__updated_at"),
+            num_projects=Count("project", distinct=True),
+            workers_changed=Max("workers__updated_at"),
+            num_workers=Count("workers", distinct=True),
+        )
 
+    def get_stamp_keys(self) -> list[str]:
+        return [*super().get_stamp_keys(), stamp_key(WORKLOAD)]
 
-class TeamDetailView(LoginRequiredMixin, generic.DetailView):
+    def get_context_data(self, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+        teams = list(context["team_list"])
+        workloads = get_workloads(TEAM, [team.pk for team in teams])
+        for team in teams:
+            team.workload = workloads[team.pk]
+        context["team_list"] = teams
+        return context
+
+
+class TeamDetailView(
+    LoginRequiredMixin, ConditionalGetMixin, generic.DetailView
+):
     model = Team
+    queryset = Team.objects.select_related("project")
+
+    def get_freshness(self) -> dict:
+        return Team.objects.filter(pk=self.kwargs["pk"]).aggregate(
+            team_changed=Max("updated_at"),
+            project_changed=Max("project__updated_at"),
+            workers_changed=Max("workers__updated_at"),
+            num_workers=Count("workers"),
+        )
+
+    def get_stamp_keys(self) -> list[str]:
+        # Bumped when the workload of the team is recounted.
+        team_key = stamp_key(TEAM, self.kwargs["pk"])
+        return [*super().get_stamp_keys(), team_key]
+
+    def get_context_data(self, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+        team = context["team"]
+        context["current_date"] = datetime.now().date()
+        context["workload"] = SimpleLazyObject(
+            lambda: get_workload(TEAM, team.pk)
+        )
+        workers = SimpleLazyObject(lambda: list(team.workers.all()))
+        context["workers"] = workers
+        context["worker_workloads"] = SimpleLazyObject(
+            lambda: self.get_worker_workloads(workers)
+        )
+        return context
+
+    def get_worker_workloads(self, workers: list) -> list[tuple]:
+        workloads = get_workloads(WORKER, [worker.pk for worker in workers])
+        return [(worker, workloads[worker.pk]) for worker in workers]
 
 
 class CategoriesView(LoginRequiredMixin, View):
     def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
-        task_types = TaskType.objects.all()
-        positions = Position.objects.all()
-
         context = {
-            "task_types": task_types,
-            "positions": positions,
+            "task_types": reference.task_types.all(),
+            "positions": reference.positions.all(),
         }
 
         return render(request, "task_manager/category.html", context)
@@ -372,8 +584,180 @@ class TeamDeleteView(LoginRequiredMixin, generic.DeleteView):
 
 class SetTaskAsCompletedView(LoginRequiredMixin, View):
     def dispatch(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
-        task = get_object_or_404(Task, pk=kwargs["pk"])
-        task.is_completed = True
-        task.save()
+        task = get_object_or_404(Task.objects.only("pk"), pk=kwargs["pk"])
+        complete_tasks(Task.objects.filter(pk=task.pk))
         return HttpResponseRedirect(
             reverse_lazy("task_manager:task-detail", args=[task.pk]))
+
+
+class TaskBulkActionView(LoginRequiredMixin, View):
+    def post(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        form = TaskBulkActionForm(request.POST)
+        if not form.is_valid():
+            return JsonResponse({"errors": form.errors}, status=400)
+
+        data = form.cleaned_data
+        tasks = select_tasks(
+            data["task_ids"], request.POST if data["use_filters"] else None
+        )
+        actions = TaskBulkActionForm.ActionChoices
+        action = data["action"]
+
+        if action == actions.COMPLETE:
+            affected = complete_tasks(tasks)
+        elif action == actions.REASSIGN:
+            affected = reassign_tasks(
+                tasks, data["assignees"], replace=not data["keep_assignees"]
+            )
+        elif action == actions.PRIORITIZE:
+            affected = set_priority(tasks, data["priority"])
+        else:
+            affected = move_to_project(tasks, data["project"])
+
+        return JsonResponse({"action": action, "affected": affected})
+
+
+class ExportView(LoginRequiredMixin, View):
+    def get(
+        self, request: HttpRequest, resource: str, export_format: str
+    ) -> StreamingHttpResponse:
+        if resource not in RESOURCES or export_format not in FORMATS:
+            raise Http404("Unknown export.")
+
+        content_type, _ = FORMATS[export_format]
+        response = StreamingHttpResponse(
+            export(resource, export_format, request.GET),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{resource}.{export_format}"'
+        )
+        return response
+
+
+class ApiView(LoginRequiredMixin, View):
+    """JSON API over one of ``task_manager.api.RESOURCES``."""
+
+    raise_exception = True
+
+    def dispatch(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        self.resource = API_RESOURCES.get(kwargs["resource"])
+        if self.resource is None:
+            raise Http404("Unknown resource.")
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except ApiError as e:
+            return JsonResponse({"errors": e.errors}, status=e.status)
+
+
+class ApiListView(ApiView):
+    def get(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        return JsonResponse(read_list(self.resource, request.GET))
+
+    def post(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        instance = save(self.resource, parse_body(request.body))
+        return JsonResponse(
+            read_detail(self.resource, instance.pk, request.GET), status=201
+        )
+
+
+class ApiDetailView(ApiView):
+    def get(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        return JsonResponse(
+            read_detail(self.resource, kwargs["pk"], request.GET)
+        )
+
+    def put(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        return self.update(request, kwargs["pk"], partial=False)
+
+    def patch(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        return self.update(request, kwargs["pk"], partial=True)
+
+    def delete(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        get_instance(self.resource, kwargs["pk"]).delete()
+        return HttpResponse(status=204)
+
+    def update(
+        self, request: HttpRequest, pk: int, partial: bool
+    ) -> JsonResponse:
+        instance = get_instance(self.resource, pk)
+        save(self.resource, parse_body(request.body), instance, partial)
+        return JsonResponse(read_detail(self.resource, pk, request.GET))
+
+
+class ApiWorkloadView(ApiView):
+    SCOPES = {"workers": WORKER, "teams": TEAM, "projects": PROJECT}
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        scope = self.SCOPES.get(kwargs["resource"])
+        if scope is None:
+            raise Http404("Unknown resource.")
+        get_instance(self.resource, kwargs["pk"])
+        summary = get_workload(scope, kwargs["pk"])
+        return JsonResponse({"data": summary.as_dict()})
+
+
+class ChangesView(LoginRequiredMixin, View):
+    """The change events after ``?since=<cursor>``, for incremental sync."""
+
+    raise_exception = True
+
+    def get(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        values, errors = {}, {}
+        for name, default in (("since", 0), ("limit", CHANGES_BATCH_SIZE)):
+            try:
+                values[name] = int(request.GET.get(name) or default)
+            except ValueError:
+                errors[name] = ["Enter a whole number."]
+        if errors:
+            return JsonResponse({"errors": errors}, status=400)
+        since = max(values["since"], 0)
+        limit = max(1, min(values["limit"], CHANGES_MAX_BATCH_SIZE))
+        return JsonResponse(changes_page(since, limit))
+
+
+class LiveUpdatesView(AsyncLoginRequiredMixin, View):
+    """
+    Server-sent events patching the task tables of the dashboard and the
+    task list, see task_manager.live and includes/live_updates.html.
+    """
+
+    async def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        if not isinstance(request, ASGIRequest):
+            # A WSGI worker would be held by the stream; 204 tells the
+            # browser not to reconnect.
+            return HttpResponse(status=204)
+        channels = [TASKS, worker_channel(request.user.pk)]
+        return StreamingHttpResponse(
+            self.stream(channels),
+            content_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def stream(self, channels: list[str]):
+        broker = get_broker()
+        subscription = broker.subscribe(channels)
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                message = await subscription.get(settings.LIVE_HEARTBEAT)
+                if message is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                data = json.dumps(
+                    {k: v for k, v in message.items() if k != "event"},
+                    cls=DjangoJSONEncoder,
+                )
+                yield f"event: {message['event']}\ndata: {data}\n\n"
+        finally:
+            # Also run when the client disconnects.
+            broker.unsubscribe(subscription)
+
+
+class MetricsView(View):
+    def get(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        if request.META.get("REMOTE_ADDR") not in settings.INTERNAL_IPS:
+            raise Http404
+        return HttpResponse(
+            metrics.render(), content_type="text/plain; version=0.0.4"
+        )
@@ -0,0 +1,221 @@
+from collections import defaultdict
+from datetime import date
+from typing import Iterable
+from uuid import uuid4
+
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Count, Q
+
+from task_manager import reference
+from task_manager.fragments import FRAGMENT_CACHE, bump, stamp_key
+from task_manager.models import Task, Worker, Workload
+
+WORKER = Workload.Scope.WORKER
+TEAM = Workload.Scope.TEAM
+PROJECT = Workload.Scope.PROJECT
+
+# Scope -> the Task lookup of the worker, team or project it counts
+SCOPE_FIELDS = {
+    WORKER: "assignees",
+    TEAM: "assignees__team",
+    PROJECT: "project",
+}
+COUNTERS = ("open_tasks", "overdue_tasks", "completed_tasks")
+# Version of every stored workload, for views listing many of them.
+WORKLOAD = "workload"
+
+
+def count_workload(
+    scope: str,
+    ids: Iterable[int] | None = None,
+    current_date: date | None = None,
+) -> list[Workload]:
+    """Live counters of the given scope ids, grouped in a single query."""
+    current_date = current_date or date.today()
+    field = SCOPE_FIELDS[scope]
+    tasks = Task.objects.order_by()
+    if ids is None:
+        tasks = tasks.filter(**{f"{field}__isnull": False})
+    else:
+        tasks = tasks.filter(**{f"{field}__in": ids})
+
+    # Distinct, as a team's workers may share a task.
+    rows = tasks.values(field, "priority", "task_type_id").annotate(
+        open_tasks=Count("pk", distinct=True, filter=Q(is_completed=False)),
+        overdue_tasks=Count(
+            "pk",
+            distinct=True,
+            filter=Q(is_completed=False, deadline__lt=current_date),
+        ),
+        completed_tasks=Count(
+            "pk", distinct=True, filter=Q(is_completed=True)
+        ),
+    )
+    return [
+        Workload(
+            scope=scope,
+            scope_id=row.pop(field),
+            counted_on=current_date,
+            **row,
+        )
+        for row in rows
+    ]
+
+
+def refresh_workload(
+    scope: str,
+    ids: Iterable[int] | None = None,
+    current_date: date | None = None,
+) -> int:
+    """
+    Recount the stored workload of the given scope ids (every worker,
+    team or project when ``ids`` is None).
+    """
+    stored = Workload.objects.filter(scope=scope)
+    if ids is not None:
+        ids = {pk for pk in ids if pk is not None}
+        if not ids:
+            return 0
+        stored = stored.filter(scope_id__in=ids)
+
+    # Joins the caller's transaction rather than adding savepoints.
+    with transaction.atomic(savepoint=False):
+        workload = count_workload(scope, ids, current_date)
+        # An upsert, so concurrent recounts of a scope don't collide.
+        Workload.objects.bulk_create(
+            workload,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["scope", "scope_id", "priority", "task_type"],
+            update_fields=[*COUNTERS, "counted_on"],
+        )
+        counted = {
+            (row.scope_id, row.priority, row.task_type_id)
+            for row in workload
+        }
+        emptied = [
+            pk
+            for pk, *group in stored.values_list(
+                "pk", "scope_id", "priority", "task_type_id"
+            )
+            if tuple(group) not in counted
+        ]
+        if emptied:
+            Workload.objects.filter(pk__in=emptied).delete()
+
+    if ids is None:
+        ids = {row.scope_id for row in workload}
+    bump(scope, ids)
+    bump_workload()
+    return len(workload)
+
+
+def bump_workload() -> None:
+    caches[FRAGMENT_CACHE].set(stamp_key(WORKLOAD), uuid4().hex, None)
+
+
+def refresh_workloads(
+    worker_ids: Iterable[int] = (),
+    team_ids: Iterable[int] = (),
+    project_ids: Iterable[int] = (),
+    current_date: date | None = None,
+) -> None:
+    for scope, ids in (
+        (WORKER, worker_ids), (TEAM, team_ids), (PROJECT, project_ids)
+    ):
+        refresh_workload(scope, ids, current_date)
+
+
+def forget_workload(scope: str, ids: Iterable[int]) -> None:
+    """Drop the workload of deleted workers, teams or projects."""
+    Workload.objects.filter(scope=scope, scope_id__in=ids).delete()
+
+
+def worker_teams(worker_ids: Iterable[int]) -> set[int]:
+    return set(
+        Worker.objects.filter(pk__in=worker_ids, team__isnull=False)
+        .values_list("team_id", flat=True)
+    )
+
+
+def assignment_scopes(task_ids: Iterable[int]) -> tuple[set, set]:
+    """The assignees of the given tasks and their teams."""
+    rows = Task.assignees.through.objects.filter(
+        task_id__in=task_ids
+    ).values_list("worker_id", "worker__team_id")
+    worker_ids, team_ids = set(), set()
+    for worker_id, team_id in rows:
+        worker_ids.add(worker_id)
+        team_ids.add(team_id)
+    team_ids.discard(None)
+    return worker_ids, team_ids
+
+
+class WorkloadSummary:
+    """The stored workload rows of one worker, team or project."""
+
+    def __init__(self, rows: list[Workload]) -> None:
+        self.rows = rows
+        for counter in COUNTERS:
+            setattr(self, counter, sum(getattr(row, counter) for row in rows))
+
+    def group(self, key, labels: dict) -> list[dict]:
+        totals = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+        for row in self.rows:
+            for counter in COUNTERS:
+                totals[key(row)][counter] += getattr(row, counter)
+        return [
+            {"name": label, **totals[value]}
+            for value, label in labels.items()
+            if value in totals
+        ]
+
+    def by_priority(self) -> list[dict]:
+        return self.group(
+            lambda row: row.priority, dict(Task.PriorityChoices.choices)
+        )
+
+    def by_task_type(self) -> list[dict]:
+        return self.group(
+            lambda row: row.task_type_id,
+            {
+                task_type.pk: task_type.name
+                for task_type in reference.task_types.all()
+            },
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            **{counter: getattr(self, counter) for counter in COUNTERS},
+            "by_priority": self.by_priority(),
+            "by_task_type": self.by_task_type(),
+        }
+
+
+def get_workloads(
+    scope: str, ids: Iterable[int], current_date: date | None = None
+) -> dict[int, WorkloadSummary]:
+    """
+    The stored workload of each id in one query, recounting the ones
+    counted on a previous day first.
+    """
+    current_date = current_date or date.today()
+    ids = list(ids)
+    rows = list(Workload.objects.filter(scope=scope, scope_id__in=ids))
+    stale = {row.scope_id for row in rows if row.counted_on != current_date}
+    if stale:
+        refresh_workload(scope, stale, current_date)
+        rows = [row for row in rows if row.scope_id not in stale]
+        rows += Workload.objects.filter(scope=scope, scope_id__in=stale)
+
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[row.scope_id].append(row)
+    return {pk: WorkloadSummary(grouped[pk]) for pk in ids}
+
+
+def get_workload(
+    scope: str, pk: int, current_date: date | None = None
+) -> WorkloadSummary:
+    return get_workloads(scope, [pk], current_date)[pk]
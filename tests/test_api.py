@@ -0,0 +1,263 @@
+import json
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.models import Position, Project, Task, TaskType, Team
+from task_manager.pagination import NEXT, encode_cursor
+
+
+class ApiTests(TestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="developer")
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2030-01-01"
+        )
+        self.team = Team.objects.create(name="test_team", project=self.project)
+        self.user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+            position=self.position,
+            team=self.team,
+        )
+        self.client.force_login(self.user)
+        self.bug = TaskType.objects.create(name="Bug")
+        self.today = date.today()
+        self.tasks = [self.create_task(i) for i in range(5)]
+
+    def create_task(self, i: int) -> Task:
+        task = Task.objects.create(
+            name=f"task_{i}",
+            description="test description",
+            deadline=self.today + timedelta(days=i - 1),
+            task_type=self.bug,
+            project=self.project,
+        )
+        task.assignees.set([self.user])
+        return task
+
+    def get(self, resource: str, pk: int | None = None, **params) -> dict:
+        if pk is None:
+            url = reverse("task_manager:api-list", args=[resource])
+        else:
+            url = reverse("task_manager:api-detail", args=[resource, pk])
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def send(self, method: str, url: str, data) -> object:
+        return getattr(self.client, method)(
+            url, json.dumps(data), content_type="application/json"
+        )
+
+    def test_list_tasks(self) -> None:
+        document = self.get("tasks")
+        self.assertEqual(len(document["data"]), 5)
+        self.assertEqual(
+            {
+                key: value for key, value in document["data"][0].items()
+                if key != "updated_at"
+            },
+            {
+                "id": self.tasks[0].pk,
+                "name": "task_0",
+                "description": "test description",
+                "deadline": str(self.tasks[0].deadline),
+                "priority": 2,
+                "is_completed": False,
+                "task_type": self.bug.pk,
+                "project": self.project.pk,
+                "assignees": [self.user.pk],
+            },
+        )
+        self.assertIsNone(document["next"])
+
+    def test_sparse_fieldsets(self) -> None:
+        document = self.get("tasks", fields="name,assignees")
+        self.assertEqual(
+            document["data"][0],
+            {"id": self.tasks[0].pk, "name": "task_0",
+             "assignees": [self.user.pk]},
+        )
+
+        response = self.client.get(
+            reverse("task_manager:api-list", args=["workers"]),
+            {"fields": "password"},
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fields", response.json()["errors"])
+
+    def test_includes_use_a_fixed_number_of_queries(self) -> None:
+        url = reverse("task_manager:api-list", args=["tasks"])
+        params = {
+            "include": "task_type,project,assignees",
+            "fields": "name",
+            "fields[workers]": "username",
+        }
+        # session, user, task types (filters), tasks, assignee ids,
+        # one query per included resource and the project's team ids.
+        with self.assertNumQueries(6):
+            document = self.client.get(url, params).json()
+
+        for i in range(5, 25):
+            self.create_task(i)
+        with self.assertNumQueries(6):
+            self.client.get(url, params)
+
+        self.assertEqual(
+            document["included"]["workers"],
+            [{"id": self.user.pk, "username": "test"}],
+        )
+        self.assertEqual(
+            document["included"]["task-types"],
+            [{"id": self.bug.pk, "name": "Bug"}],
+        )
+        self.assertEqual(
+            document["included"]["projects"][0]["teams"], [self.team.pk]
+        )
+
+    def test_unknown_include(self) -> None:
+        response = self.client.get(
+            reverse("task_manager:api-list", args=["tasks"]),
+            {"include": "name"},
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_keyset_pagination(self) -> None:
+        document = self.get("tasks", page_size=2, fields="name")
+        names = [row["name"] for row in document["data"]]
+        while document["next"]:
+            document = self.get(
+                "tasks", page_size=2, fields="name", cursor=document["next"]
+            )
+            names += [row["name"] for row in document["data"]]
+        self.assertEqual(names, [f"task_{i}" for i in range(5)])
+
+        document = self.get(
+            "tasks", page_size=2, cursor=document["previous"]
+        )
+        self.assertEqual(
+            [row["name"] for row in document["data"]], ["task_2", "task_3"]
+        )
+
+        response = self.client.get(
+            reverse("task_manager:api-list", args=["tasks"]),
+            {"cursor": "bogus"},
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_cursor_values(self) -> None:
+        for values in (["soon", 1, 1], [{"a": 1}, 1, 1]):
+            with self.subTest(values=values):
+                response = self.client.get(
+                    reverse("task_manager:api-list", args=["tasks"]),
+                    {"cursor": encode_cursor(values, NEXT)},
+                )
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(
+                    response.json()["errors"],
+                    {"cursor": ["Invalid cursor."]},
+                )
+
+    def test_task_list_filters(self) -> None:
+        Task.objects.filter(pk=self.tasks[0].pk).update(is_completed=True)
+        document = self.get("tasks", hide_completed="true", fields="name")
+        self.assertEqual(len(document["data"]), 4)
+
+        document = self.get("tasks", search_field="task_3", fields="name")
+        self.assertEqual([row["name"] for row in document["data"]],
+                         ["task_3"])
+
+    def test_detail(self) -> None:
+        document = self.get(
+            "projects", self.project.pk, include="teams",
+            **{"fields[teams]": "name"},
+        )
+        self.assertEqual(document["data"]["teams"], [self.team.pk])
+        self.assertEqual(
+            document["included"],
+            {"teams": [{"id": self.team.pk, "name": "test_team"}]},
+        )
+
+        response = self.client.get(
+            reverse("task_manager:api-detail", args=["projects", 999])
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_create(self) -> None:
+        response = self.send(
+            "post",
+            reverse("task_manager:api-list", args=["tasks"]),
+            {
+                "name": "new",
+                "description": "created through the API",
+                "deadline": "2030-01-01",
+                "priority": 1,
+                "task_type": self.bug.pk,
+                "project": self.project.pk,
+                "assignees": [self.user.pk],
+            },
+        )
+        self.assertEqual(response.status_code, 201)
+        task = Task.objects.get(name="new")
+        self.assertEqual(response.json()["data"]["id"], task.pk)
+        self.assertEqual(list(task.assignees.all()), [self.user])
+        self.assertTrue(self.user.inbox.filter(task=task).exists())
+
+    def test_create_validates(self) -> None:
+        response = self.send(
+            "post",
+            reverse("task_manager:api-list", args=["tasks"]),
+            {"name": "new"},
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("deadline", response.json()["errors"])
+
+    def test_patch_keeps_other_fields(self) -> None:
+        task = self.tasks[0]
+        response = self.send(
+            "patch",
+            reverse("task_manager:api-detail", args=["tasks", task.pk]),
+            {"priority": 1},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["priority"], 1)
+
+        task.refresh_from_db()
+        self.assertEqual(task.priority, 1)
+        self.assertEqual(task.name, "task_0")
+        self.assertEqual(list(task.assignees.all()), [self.user])
+
+    def test_worker_update_has_no_password(self) -> None:
+        response = self.send(
+            "patch",
+            reverse("task_manager:api-detail", args=["workers", self.user.pk]),
+            {"first_name": "Ada"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, "Ada")
+        self.assertTrue(self.user.check_password("test123"))
+        self.assertNotIn("password", response.json()["data"])
+
+    def test_delete(self) -> None:
+        task = self.tasks[0]
+        url = reverse("task_manager:api-detail", args=["tasks", task.pk])
+        self.assertEqual(self.client.delete(url).status_code, 204)
+        self.assertFalse(Task.objects.filter(pk=task.pk).exists())
+        self.assertEqual(self.client.delete(url).status_code, 404)
+
+    def test_login_required(self) -> None:
+        self.client.logout()
+        response = self.client.get(
+            reverse("task_manager:api-list", args=["tasks"])
+        )
+        self.assertEqual(response.status_code, 403)
+
+    def test_unknown_resource(self) -> None:
+        response = self.client.get(
+            reverse("task_manager:api-list", args=["secrets"])
+        )
+        self.assertEqual(response.status_code, 404)
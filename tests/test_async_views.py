@@ -0,0 +1,136 @@
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.instrumentation import metrics
+from task_manager.models import Position, Project, Task, TaskType, Team
+from task_manager.views import IndexView, TaskDetailView, TaskListView
+
+TASK_LIST_URL = reverse("task_manager:task-list")
+
+
+class AsyncViewTests(TestCase):
+    """The hot pages served the way ASGI calls them."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        position = Position.objects.create(name="test_position")
+        cls.project = Project.objects.create(
+            project_name="test_project", deadline="2030-01-01"
+        )
+        team = Team.objects.create(name="test_team", project=cls.project)
+        cls.user = get_user_model().objects.create_user(
+            username="test", password="test123", position=position, team=team
+        )
+        get_user_model().objects.create_user(
+            username="teammate", password="test123", position=position,
+            team=team,
+        )
+        cls.bug = TaskType.objects.create(name="Bug")
+        TaskType.objects.create(name="QA")
+        cls.tasks = []
+        for i in range(25):
+            task = Task.objects.create(
+                name=f"task_{i}",
+                description="test description",
+                deadline=date.today() + timedelta(days=i - 2),
+                task_type=cls.bug,
+                project=cls.project,
+                is_completed=i % 5 == 0,
+            )
+            task.assignees.set([cls.user])
+            cls.tasks.append(task)
+
+    def setUp(self) -> None:
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+    def test_views_are_async(self) -> None:
+        for view in (IndexView, TaskListView, TaskDetailView):
+            self.assertTrue(view.view_is_async, view)
+
+    async def test_index(self) -> None:
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("task_manager:index"))
+
+        self.assertEqual(response.status_code, 200)
+        context = response.context
+        self.assertEqual(context["project"], self.project)
+        self.assertEqual(
+            [worker.username for worker in context["team_workers"]],
+            ["teammate"],
+        )
+        self.assertEqual(context["num_all_tasks"], 25)
+        self.assertEqual(context["num_completed_tasks"], 5)
+        self.assertEqual(len(context["tasks"]()), 20)
+        self.assertEqual(context["percentage_complete_project"], 20)
+
+    async def test_index_without_a_project(self) -> None:
+        team = await Team.objects.acreate(name="no_project")
+        for username, team in (("loner", None), ("member", team)):
+            worker = await get_user_model().objects.acreate_user(
+                username=username,
+                password="test123",
+                position_id=self.user.position_id,
+                team=team,
+            )
+            await self.async_client.aforce_login(worker)
+            response = await self.async_client.get(
+                reverse("task_manager:index")
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertIsNone(response.context["project"])
+            self.assertContains(response, "Current project: none")
+
+    async def test_task_list_pages(self) -> None:
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(TASK_LIST_URL, {"page": 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["task_list"]), 5)
+        self.assertEqual(response.context["page_obj"].number, 2)
+        self.assertEqual(response.context["paginator"].count, 25)
+        self.assertEqual(
+            [task_type.name for task_type in response.context["task_types"]],
+            ["Bug", "QA"],
+        )
+
+        response = await self.async_client.get(
+            TASK_LIST_URL, {"hide_completed": "true", "cursor": ""}
+        )
+        self.assertEqual(len(response.context["task_list"]), 20)
+        self.assertFalse(response.context["page_obj"].has_next())
+        self.assertTrue(response.context["page_obj"].is_keyset)
+
+        response = await self.async_client.get(TASK_LIST_URL, {"QA": "true"})
+        self.assertEqual(list(response.context["task_list"]), [])
+
+    async def test_task_detail_revalidates(self) -> None:
+        await self.async_client.aforce_login(self.user)
+        url = reverse("task_manager:task-detail", args=[self.tasks[0].pk])
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        response = await self.async_client.get(
+            url, headers={"if-none-match": response["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+
+        response = await self.async_client.get(
+            reverse("task_manager:task-detail", args=[0])
+        )
+        self.assertEqual(response.status_code, 404)
+
+    async def test_login_required(self) -> None:
+        response = await self.async_client.get(TASK_LIST_URL)
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("login", response["Location"])
+
+    async def test_queries_are_instrumented(self) -> None:
+        await self.async_client.aforce_login(self.user)
+        await self.async_client.get(TASK_LIST_URL)
+
+        sample = metrics.recent[-1]
+        self.assertEqual(sample["view"], "task-list")
+        self.assertEqual(sample["queries"], 4)
@@ -0,0 +1,66 @@
+from asgiref.sync import async_to_sync
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.auth import CachedModelBackend
+from task_manager.models import Position, Project, Team
+
+TASK_LIST_URL = reverse("task_manager:task-list")
+
+
+class CachedModelBackendTests(TestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="developer")
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2030-01-01"
+        )
+        self.team = Team.objects.create(name="test_team", project=self.project)
+        self.user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+            position=self.position,
+            team=self.team,
+        )
+        self.client.force_login(self.user)
+
+    def request_user(self):
+        return self.client.get(TASK_LIST_URL).wsgi_request.user
+
+    def test_user_and_relations_are_cached(self) -> None:
+        self.request_user()
+        with self.assertNumQueries(0):
+            user = CachedModelBackend().get_user(self.user.pk)
+            self.assertEqual(user.position.name, "developer")
+            self.assertEqual(user.team.project.project_name, "test_project")
+
+        user = async_to_sync(CachedModelBackend().aget_user)(self.user.pk)
+        self.assertEqual(user.team, self.team)
+
+    def test_saves_refresh_the_cached_user(self) -> None:
+        self.request_user()
+        self.team.name = "renamed_team"
+        self.team.save()
+        self.project.project_name = "renamed_project"
+        self.project.save()
+        self.position.name = "tester"
+        self.position.save()
+
+        user = self.request_user()
+        self.assertEqual(user.team.name, "renamed_team")
+        self.assertEqual(user.team.project.project_name, "renamed_project")
+        self.assertEqual(user.position.name, "tester")
+
+    def test_deactivated_user_is_logged_out(self) -> None:
+        self.request_user()
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.get(TASK_LIST_URL)
+        self.assertEqual(response.status_code, 302)
+
+    def test_deleted_team(self) -> None:
+        self.request_user()
+        self.team.delete()
+        self.assertIsNone(self.request_user().team)
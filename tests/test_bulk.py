@@ -0,0 +1,165 @@
+from datetime import datetime, timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.models import (
+    Position,
+    Project,
+    ProjectProgress,
+    Task,
+    TaskType,
+    tasks_bulk_changed,
+)
+
+TASK_BULK_URL = reverse("task_manager:task-bulk")
+
+
+class TaskBulkActionTests(TestCase):
+    def setUp(self) -> None:
+        position = Position.objects.create(name="test_position")
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test123", position=position
+        )
+        self.other = get_user_model().objects.create_user(
+            username="other", password="test123", position=position
+        )
+        self.client.force_login(self.user)
+
+        self.bug = TaskType.objects.create(name="Bug")
+        self.feature = TaskType.objects.create(name="Feature")
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2025-01-01", status="Active"
+        )
+        self.other_project = Project.objects.create(
+            project_name="other_project",
+            deadline="2025-01-01",
+            status="Active",
+        )
+        date_now = datetime.now().date()
+        self.tasks = []
+        for i, task_type in enumerate([self.bug, self.bug, self.feature]):
+            task = Task.objects.create(
+                name=f"task_{i}",
+                description="test description",
+                deadline=date_now + timedelta(days=1),
+                task_type=task_type,
+                project=self.project,
+            )
+            task.assignees.set([self.user])
+            self.tasks.append(task)
+
+    def post(self, **data) -> dict:
+        response = self.client.post(TASK_BULK_URL, data)
+        return response.json()
+
+    def test_complete_by_ids(self) -> None:
+        ids = [self.tasks[0].pk, self.tasks[1].pk]
+        # Includes the assignees whose fragments go stale, the update of
+        # their inbox entries, the recount of their workload and the
+        # change events.
+        with self.assertNumQueries(15):
+            result = self.post(action="complete", task_ids=ids)
+        self.assertEqual(result["affected"], 2)
+        self.assertEqual(Task.objects.filter(is_completed=True).count(), 2)
+        self.assertEqual(
+            ProjectProgress.objects.get(project=self.project).completed_tasks,
+            2,
+        )
+
+    def test_complete_by_task_list_filters(self) -> None:
+        result = self.post(action="complete", use_filters=True, Bug="true")
+        self.assertEqual(result["affected"], 2)
+        self.assertFalse(Task.objects.get(pk=self.tasks[2].pk).is_completed)
+
+    def test_reprioritize_counts_changed_rows(self) -> None:
+        Task.objects.filter(pk=self.tasks[0].pk).update(priority=1)
+        result = self.post(
+            action="prioritize",
+            task_ids=[task.pk for task in self.tasks],
+            priority=1,
+        )
+        self.assertEqual(result["affected"], 2)
+        self.assertEqual(Task.objects.filter(priority=1).count(), 3)
+
+    def test_update_sends_the_affected_tasks(self) -> None:
+        sent = []
+
+        def receiver(sender, task_ids, project_ids, **kwargs) -> None:
+            sent.append((type(task_ids), set(task_ids), project_ids))
+
+        tasks_bulk_changed.connect(receiver, sender=Task)
+        self.addCleanup(tasks_bulk_changed.disconnect, receiver, sender=Task)
+        bugs = {self.tasks[0].pk, self.tasks[1].pk}
+        Task.objects.filter(task_type=self.bug).update(priority=1)
+        # Filtered on the updated field, so the ids are read first.
+        Task.objects.filter(priority=1).update(priority=3)
+
+        self.assertEqual(sent[0][1:], (bugs, {self.project.pk}))
+        self.assertNotEqual(sent[0][0], list)
+        self.assertEqual(sent[1], (list, bugs, {self.project.pk}))
+
+    def test_move_project_updates_both_counters(self) -> None:
+        result = self.post(
+            action="move",
+            task_ids=[self.tasks[0].pk],
+            project=self.other_project.pk,
+        )
+        self.assertEqual(result["affected"], 1)
+        self.assertEqual(
+            ProjectProgress.objects.get(project=self.project).total_tasks, 2
+        )
+        self.assertEqual(
+            ProjectProgress.objects.get(
+                project=self.other_project
+            ).total_tasks,
+            1,
+        )
+
+    def test_move_out_of_the_project(self) -> None:
+        result = self.post(
+            action="move", task_ids=[self.tasks[0].pk], project="none"
+        )
+        self.assertEqual(result["affected"], 1)
+        self.assertIsNone(Task.objects.get(pk=self.tasks[0].pk).project)
+        self.assertEqual(
+            ProjectProgress.objects.get(project=self.project).total_tasks, 2
+        )
+
+    def test_reassign_replaces_assignees(self) -> None:
+        ids = [task.pk for task in self.tasks]
+        result = self.post(
+            action="reassign", task_ids=ids, assignees=[self.other.pk]
+        )
+        self.assertEqual(result["affected"], 3)
+        self.assertEqual(self.user.tasks.count(), 0)
+        self.assertEqual(self.other.tasks.count(), 3)
+
+        self.post(
+            action="reassign",
+            task_ids=ids,
+            assignees=[self.user.pk],
+            keep_assignees=True,
+        )
+        self.assertEqual(self.user.tasks.count(), 3)
+        self.assertEqual(self.other.tasks.count(), 3)
+
+    def test_requires_selection_and_arguments(self) -> None:
+        response = self.client.post(TASK_BULK_URL, {"action": "complete"})
+        self.assertEqual(response.status_code, 400)
+
+        # Filtering by nothing would select every task.
+        response = self.client.post(
+            TASK_BULK_URL,
+            {"action": "complete", "use_filters": True, "search_field": " "},
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Task.objects.filter(is_completed=True).exists())
+
+        response = self.client.post(
+            TASK_BULK_URL,
+            {"action": "move", "task_ids": [self.tasks[0].pk]},
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("project", response.json()["errors"])
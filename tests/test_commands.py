@@ -0,0 +1,306 @@
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase
+
+from task_manager.management.commands.benchmark_servers import run_load
+
+from task_manager.models import (
+    ChangeEvent,
+    Position,
+    Project,
+    ProjectProgress,
+    Task,
+    TaskType,
+)
+
+
+class ExplainTaskQueriesCommandTests(TestCase):
+    def test_records_plans_with_and_without_indexes(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "explain.json")
+            call_command(
+                "explain_task_queries",
+                seed=50,
+                repeat=1,
+                output=output,
+                stdout=StringIO(),
+            )
+            with open(output) as file:
+                results = json.load(file)
+
+        scenario = results["scenarios"]["task-list overdue"]
+        self.assertIn(
+            "task_open_deadline_idx", scenario["with_indexes"]["plan"]
+        )
+        self.assertNotIn(
+            "task_open_deadline_idx", scenario["without_indexes"]["plan"]
+        )
+        self.assertFalse(Task.objects.exists())
+
+
+class ImportTasksCommandTests(TestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="developer")
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test123", position=self.position
+        )
+        TaskType.objects.create(name="Bug")
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2025-01-01", status="Active"
+        )
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write(self, name: str, content: str) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def test_import_csv_in_batches(self) -> None:
+        path = self.write(
+            "tasks.csv",
+            "name,deadline,priority,task_type,project,assignees\n"
+            + "".join(
+                f"task_{i},2025-01-0{i + 1},High,Bug,test_project,test\n"
+                for i in range(5)
+            ),
+        )
+        call_command("import_tasks", path, batch_size=2, stdout=StringIO())
+
+        self.assertEqual(Task.objects.count(), 5)
+        self.assertEqual(self.user.tasks.count(), 5)
+        self.assertEqual(Task.objects.filter(priority=1).count(), 5)
+        self.assertEqual(
+            ProjectProgress.objects.get(project=self.project).total_tasks, 5
+        )
+
+    def test_imported_tasks_are_recorded_once(self) -> None:
+        path = self.write(
+            "tasks.jsonl",
+            '{"name": "a", "deadline": "2025-01-01", "task_type": "Bug",'
+            ' "assignees": ["test"]}\n'
+            '{"name": "b", "deadline": "2025-01-01", "task_type": "Bug"}\n',
+        )
+        ChangeEvent.objects.all().delete()
+        call_command("import_tasks", path, stdout=StringIO())
+
+        self.assertEqual(
+            sorted(
+                ChangeEvent.objects.filter(resource="tasks")
+                .values_list("object_id", "action")
+            ),
+            sorted(
+                (pk, ChangeEvent.Action.CREATED)
+                for pk in Task.objects.values_list("pk", flat=True)
+            ),
+        )
+        self.assertEqual(self.user.tasks.get().name, "a")
+
+    def test_dry_run_reports_errors_without_writing(self) -> None:
+        path = self.write(
+            "tasks.jsonl",
+            '{"name": "ok", "deadline": "2025-01-01", "task_type": "Bug"}\n'
+            '{"name": "bad", "deadline": "soon", "task_type": "Bug"}\n'
+            '{"name": "new", "deadline": "2025-01-01", "task_type": "QA"}\n',
+        )
+        stderr = StringIO()
+        with self.assertRaises(CommandError):
+            call_command(
+                "import_tasks",
+                path,
+                dry_run=True,
+                stdout=StringIO(),
+                stderr=stderr,
+            )
+        self.assertIn("Row 2: Invalid deadline", stderr.getvalue())
+        self.assertIn("Row 3: Unknown task type", stderr.getvalue())
+        self.assertFalse(Task.objects.exists())
+
+    def test_unreadable_rows_are_reported(self) -> None:
+        path = self.write(
+            "tasks.jsonl",
+            '{"name": "ok", "deadline": "2025-01-01", "task_type": "Bug"}\n'
+            '{"name": "cut", "deadline\n'
+            "[1]\n"
+            '{"name": "untyped", "deadline": "2025-01-01"}\n',
+        )
+        stderr = StringIO()
+        with self.assertRaises(CommandError):
+            call_command(
+                "import_tasks",
+                path,
+                create_missing=True,
+                stdout=StringIO(),
+                stderr=stderr,
+            )
+        self.assertIn("Row 2: Invalid JSON", stderr.getvalue())
+        self.assertIn("Row 3: Expected a JSON object.", stderr.getvalue())
+        self.assertIn("Row 4: Missing task type.", stderr.getvalue())
+        self.assertFalse(Task.objects.exists())
+
+    def test_import_workers_creating_missing_positions(self) -> None:
+        path = self.write(
+            "workers.csv",
+            "username,first_name,position,is_team_lead\n"
+            "alice,Alice,developer,true\n"
+            "bob,Bob,tester,false\n",
+        )
+        call_command(
+            "import_tasks",
+            path,
+            resource="workers",
+            create_missing=True,
+            stdout=StringIO(),
+        )
+        bob = get_user_model().objects.get(username="bob")
+        self.assertEqual(bob.position.name, "tester")
+        self.assertFalse(bob.has_usable_password())
+        self.assertTrue(
+            get_user_model().objects.get(username="alice").is_team_lead
+        )
+
+    def test_imported_workers_are_recorded(self) -> None:
+        path = self.write(
+            "workers.csv", "username,position\nalice,developer\n"
+        )
+        call_command(
+            "import_tasks", path, resource="workers", stdout=StringIO()
+        )
+        alice = get_user_model().objects.get(username="alice")
+        self.assertTrue(
+            ChangeEvent.objects.filter(
+                resource="workers",
+                object_id=alice.pk,
+                action=ChangeEvent.Action.CREATED,
+            ).exists()
+        )
+
+    def test_non_string_names_are_rejected(self) -> None:
+        path = self.write(
+            "tasks.jsonl",
+            '{"name": 42, "deadline": "2025-01-01", "task_type": "Bug"}\n'
+            '{"name": "ok", "deadline": "2025-01-01", "task_type": [1]}\n',
+        )
+        stderr = StringIO()
+        with self.assertRaises(CommandError):
+            call_command(
+                "import_tasks", path, stdout=StringIO(), stderr=stderr
+            )
+        self.assertIn("Row 1: Invalid task name: 42", stderr.getvalue())
+        self.assertIn("Row 2: Invalid task type: [1]", stderr.getvalue())
+
+    def test_rejected_batches_roll_back_created_names(self) -> None:
+        path = self.write(
+            "tasks.jsonl",
+            '{"name": "a", "deadline": "2025-01-01", "task_type": "QA"}\n'
+            '{"name": "b", "deadline": "soon", "task_type": "Bug"}\n'
+            '{"name": "c", "deadline": "2025-01-01", "task_type": "QA"}\n',
+        )
+        with self.assertRaises(CommandError):
+            call_command(
+                "import_tasks",
+                path,
+                batch_size=2,
+                create_missing=True,
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
+        # The second batch creates "QA" again rather than reusing the
+        # rolled-back id.
+        self.assertEqual(Task.objects.get().task_type.name, "QA")
+        self.assertEqual(TaskType.objects.filter(name="QA").count(), 1)
+
+
+class SeedAndBenchmarkCommandTests(TestCase):
+    def test_seed_data_distributions(self) -> None:
+        call_command(
+            "seed_data",
+            projects=2,
+            teams_per_project=1,
+            workers=5,
+            tasks=40,
+            completed_ratio=0.0,
+            overdue_ratio=1.0,
+            batch_size=15,
+            seed=1,
+            stdout=StringIO(),
+        )
+        self.assertEqual(Project.objects.count(), 2)
+        self.assertEqual(get_user_model().objects.count(), 5)
+        self.assertEqual(Task.objects.count(), 40)
+        self.assertFalse(Task.objects.filter(is_completed=True).exists())
+        self.assertFalse(
+            Task.objects.filter(deadline__gte=datetime.now().date()).exists()
+        )
+        self.assertFalse(Task.objects.filter(assignees=None).exists())
+
+    def test_benchmark_views_records_every_view(self) -> None:
+        call_command(
+            "seed_data",
+            projects=1,
+            workers=3,
+            tasks=10,
+            seed=1,
+            stdout=StringIO(),
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "benchmark.json")
+            call_command(
+                "benchmark_views", repeat=2, output=output, stdout=StringIO()
+            )
+            with open(output) as file:
+                views = json.load(file)["views"]
+
+        for name in (
+            "index",
+            "task-list",
+            "task-list?overdue=true&hide_completed=true",
+            "project-detail",
+            "worker-detail",
+            "team-detail",
+        ):
+            self.assertIn(name, views)
+        self.assertGreater(views["index"]["queries"], 0)
+        self.assertIn("p95_ms", views["index"])
+
+
+class BenchmarkServersLoadTests(SimpleTestCase):
+    def test_run_load_counts_responses(self) -> None:
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                status = 200 if self.path == "/ok" else 500
+                self.send_response(status)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        port = server.server_address[1]
+
+        result = run_load(port, "/ok", {}, concurrency=3, duration=0.3)
+        self.assertGreater(result["requests"], 0)
+        self.assertEqual(result["errors"], 0)
+        self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+
+        with self.assertRaises(CommandError):
+            run_load(port, "/broken", {}, concurrency=2, duration=0.2)
@@ -0,0 +1,163 @@
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from django.views import View
+
+from task_manager.bulk import complete_tasks
+from task_manager.conditional import (
+    AsyncConditionalGetMixin,
+    ConditionalGetMixin,
+)
+from task_manager.models import Position, Project, Task, TaskType, Team
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="test_position")
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2030-01-01"
+        )
+        self.team = Team.objects.create(name="test_team", project=self.project)
+        self.user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+            position=self.position,
+            team=self.team,
+        )
+        self.client.force_login(self.user)
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.task = Task.objects.create(
+            name="test_task",
+            description="test description",
+            deadline="2030-01-01",
+            task_type=self.task_type,
+            project=self.project,
+        )
+        self.task.assignees.set([self.user])
+
+    def assert_revalidates(self, url: str, change) -> None:
+        """Repeat visits get 304 until ``change()`` alters the page."""
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.templates, [])
+
+        change()
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_task_detail(self) -> None:
+        def change() -> None:
+            self.task.name = "renamed"
+            self.task.save()
+
+        self.assert_revalidates(
+            reverse("task_manager:task-detail", args=[self.task.pk]), change
+        )
+
+    def test_assignee_change_updates_task(self) -> None:
+        before = Task.objects.get(pk=self.task.pk).updated_at
+        self.task.assignees.clear()
+        self.assertGreater(
+            Task.objects.get(pk=self.task.pk).updated_at, before
+        )
+
+    def test_task_list_follows_bulk_updates_and_deletes(self) -> None:
+        url = reverse("task_manager:task-list")
+        self.assert_revalidates(
+            url, lambda: complete_tasks(Task.objects.all())
+        )
+        self.assert_revalidates(url, lambda: self.task.delete())
+
+    def test_project_detail_follows_new_tasks(self) -> None:
+        self.assert_revalidates(
+            reverse("task_manager:project-detail", args=[self.project.pk]),
+            lambda: Task.objects.create(
+                name="new_task",
+                description="test description",
+                deadline="2030-01-01",
+                task_type=self.task_type,
+                project=self.project,
+            ),
+        )
+
+    def test_worker_detail_follows_assignments(self) -> None:
+        self.assert_revalidates(
+            reverse("task_manager:worker-detail", args=[self.user.pk]),
+            lambda: self.user.tasks.remove(self.task),
+        )
+
+    def test_team_pages_follow_worker_changes(self) -> None:
+        def change() -> None:
+            get_user_model().objects.create_user(
+                username="new", password="test123", position=self.position,
+                team=self.team,
+            )
+
+        self.assert_revalidates(
+            reverse("task_manager:team-detail", args=[self.team.pk]), change
+        )
+
+    def test_index_follows_project_progress(self) -> None:
+        self.assert_revalidates(
+            reverse("task_manager:index"),
+            lambda: complete_tasks(Task.objects.all()),
+        )
+
+    def test_reference_data_changes_etag(self) -> None:
+        def change() -> None:
+            self.task_type.name = "QA"
+            self.task_type.save()
+
+        self.assert_revalidates(reverse("task_manager:task-list"), change)
+
+    def test_etag_depends_on_user(self) -> None:
+        url = reverse("task_manager:project-list")
+        etag = self.client.get(url)["ETag"]
+
+        other = get_user_model().objects.create_user(
+            username="other", password="test123", position=self.position
+        )
+        self.client.force_login(other)
+        response = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(response.status_code, 200)
+
+    def test_if_modified_since(self) -> None:
+        url = reverse("task_manager:task-detail", args=[self.task.pk])
+        response = self.client.get(url)
+        self.assertIn("Last-Modified", response)
+
+        later = http_date((timezone.now() + timedelta(minutes=1)).timestamp())
+        response = self.client.get(url, headers={"if-modified-since": later})
+        self.assertEqual(response.status_code, 304)
+
+
+class FreshnessHookTests(SimpleTestCase):
+    def test_views_must_define_the_hook(self) -> None:
+        class PageView(ConditionalGetMixin, View):
+            pass
+
+        class AsyncPageView(AsyncConditionalGetMixin, View):
+            pass
+
+        request = RequestFactory().get("/")
+        with self.assertRaisesMessage(
+            ImproperlyConfigured, "PageView must define get_freshness()."
+        ):
+            PageView.as_view()(request)
+        with self.assertRaisesMessage(
+            ImproperlyConfigured,
+            "AsyncPageView must define aget_freshness().",
+        ):
+            async_to_sync(AsyncPageView.as_view())(request)
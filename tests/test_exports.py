@@ -0,0 +1,124 @@
+import csv
+import json
+from datetime import datetime, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.exports import export
+from task_manager.models import Position, Project, Task, TaskType, Team
+
+
+class ExportTests(TestCase):
+    def setUp(self) -> None:
+        position = Position.objects.create(name="developer")
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2025-01-01", status="Active"
+        )
+        team = Team.objects.create(name="test_team", project=self.project)
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test123", position=position, team=team
+        )
+        self.client.force_login(self.user)
+
+        task_type = TaskType.objects.create(name="Bug")
+        date_now = datetime.now().date()
+        for i in range(5):
+            task = Task.objects.create(
+                name=f"task_{i}",
+                description="test description",
+                deadline=date_now + timedelta(days=1 if i % 2 else -1),
+                task_type=task_type,
+                project=self.project if i % 2 else None,
+            )
+            task.assignees.set([self.user])
+
+    def read(self, response) -> str:
+        return b"".join(response.streaming_content).decode()
+
+    def test_task_csv_honours_task_list_filters(self) -> None:
+        response = self.client.get(
+            reverse("task_manager:export", args=["tasks", "csv"]),
+            {"overdue": "true"},
+        )
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(csv.DictReader(StringIO(self.read(response))))
+        self.assertEqual(
+            [row["name"] for row in rows], ["task_0", "task_2", "task_4"]
+        )
+        self.assertEqual(rows[0]["task_type"], "Bug")
+        self.assertEqual(rows[0]["assignees"], "test")
+
+    def test_task_export_queries_per_chunk(self) -> None:
+        # The tasks and one prefetch per chunk; the task types are cached.
+        with self.assertNumQueries(4):
+            lines = list(export("tasks", "jsonl", chunk_size=2))
+        record = json.loads(lines[-1])
+        self.assertEqual(record["project"], "test_project")
+        self.assertEqual(record["assignees"], ["test"])
+
+    def test_project_and_worker_exports(self) -> None:
+        response = self.client.get(
+            reverse("task_manager:export", args=["projects", "jsonl"])
+        )
+        records = [
+            json.loads(line) for line in self.read(response).splitlines()
+        ]
+        self.assertEqual(records[0]["project_name"], "test_project")
+
+        response = self.client.get(
+            reverse("task_manager:export", args=["workers", "csv"])
+        )
+        rows = list(csv.DictReader(StringIO(self.read(response))))
+        self.assertEqual(rows[0]["position"], "developer")
+        self.assertEqual(rows[0]["team"], "test_team")
+
+    def test_project_and_worker_exports_honour_list_filters(self) -> None:
+        Project.objects.create(
+            project_name="other_project", deadline="2030-01-01"
+        )
+        get_user_model().objects.create_user(
+            username="other",
+            password="test123",
+            position=self.user.position,
+        )
+
+        response = self.client.get(
+            reverse("task_manager:export", args=["projects", "csv"]),
+            {"search_field": "other"},
+        )
+        rows = list(csv.DictReader(StringIO(self.read(response))))
+        self.assertEqual(
+            [row["project_name"] for row in rows], ["other_project"]
+        )
+
+        response = self.client.get(
+            reverse("task_manager:export", args=["workers", "csv"]),
+            {"search_field": "oth"},
+        )
+        rows = list(csv.DictReader(StringIO(self.read(response))))
+        self.assertEqual([row["username"] for row in rows], ["other"])
+
+    def test_unknown_export_returns_404(self) -> None:
+        response = self.client.get(
+            reverse("task_manager:export", args=["teams", "csv"])
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_export_command(self) -> None:
+        output = StringIO()
+        call_command(
+            "export_data",
+            "tasks",
+            "--format=jsonl",
+            "--filter=hide_completed=true",
+            "--filter=search_field=task_1",
+            stdout=output,
+        )
+        records = [
+            json.loads(line) for line in output.getvalue().splitlines()
+        ]
+        self.assertEqual([record["name"] for record in records], ["task_1"])
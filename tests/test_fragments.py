@@ -0,0 +1,152 @@
+import re
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.bulk import reassign_tasks
+from task_manager.fragments import (
+    FRAGMENT_CACHE,
+    bump,
+    fragment_version,
+    get_stamps,
+    stamp_key,
+)
+from task_manager.models import Position, Project, Task, TaskType, Team
+
+
+class FragmentStampTests(TestCase):
+    def setUp(self) -> None:
+        caches[FRAGMENT_CACHE].clear()
+
+    def test_missing_stamp_gets_fresh_token(self) -> None:
+        key = stamp_key("project", 1)
+        first = get_stamps([key])
+        self.assertEqual(get_stamps([key]), first)
+
+        caches[FRAGMENT_CACHE].delete(key)
+        self.assertNotEqual(get_stamps([key]), first)
+
+    def test_bump_changes_only_given_ids(self) -> None:
+        first = fragment_version("project", 1)
+        second = fragment_version("project", 2)
+
+        bump("project", [1, None])
+
+        self.assertNotEqual(fragment_version("project", 1), first)
+        self.assertEqual(fragment_version("project", 2), second)
+
+
+class FragmentCacheViewTests(TestCase):
+    def setUp(self) -> None:
+        caches[FRAGMENT_CACHE].clear()
+        position = Position.objects.create(name="test_position")
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2030-01-01"
+        )
+        self.team = Team.objects.create(name="test_team", project=self.project)
+        self.user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+            position=position,
+            team=self.team,
+        )
+        self.other = get_user_model().objects.create_user(
+            username="other", password="test123", position=position
+        )
+        self.client.force_login(self.user)
+        self.task = Task.objects.create(
+            name="cached_task",
+            description="test description",
+            deadline="2030-01-01",
+            task_type=TaskType.objects.create(name="Bug"),
+            project=self.project,
+        )
+        self.task.assignees.set([self.user])
+        self.project_url = reverse(
+            "task_manager:project-detail", args=[self.project.pk]
+        )
+        self.worker_url = reverse(
+            "task_manager:worker-detail", args=[self.user.pk]
+        )
+        self.team_url = reverse(
+            "task_manager:team-detail", args=[self.team.pk]
+        )
+
+    def get(self, url: str) -> tuple[str, int]:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        # CSRF tokens are masked differently on every response.
+        content = re.sub(
+            r'name="csrfmiddlewaretoken" value="\w+"', "",
+            response.content.decode(),
+        )
+        return content, len(queries)
+
+    def test_unchanged_pages_are_served_from_cache(self) -> None:
+        for url in (self.project_url, self.worker_url, self.team_url):
+            with self.subTest(url=url):
+                first, cold_queries = self.get(url)
+                second, warm_queries = self.get(url)
+                self.assertEqual(first, second)
+                self.assertLess(warm_queries, cold_queries)
+
+    def test_task_change_refreshes_project_and_worker_pages(self) -> None:
+        self.get(self.project_url)
+        self.get(self.worker_url)
+
+        self.task.name = "renamed_task"
+        self.task.save()
+
+        self.assertIn("renamed_task", self.get(self.project_url)[0])
+        self.assertIn("renamed_task", self.get(self.worker_url)[0])
+
+    def test_bulk_reassign_refreshes_previous_assignee(self) -> None:
+        self.assertIn("cached_task", self.get(self.worker_url)[0])
+
+        reassign_tasks(Task.objects.filter(pk=self.task.pk), [self.other])
+
+        self.assertNotIn("cached_task", self.get(self.worker_url)[0])
+        self.assertIn("other", self.get(self.project_url)[0])
+
+    def test_worker_rename_refreshes_team_and_task_tables(self) -> None:
+        self.get(self.team_url)
+        self.get(self.project_url)
+
+        self.user.username = "renamed_worker"
+        self.user.save()
+
+        self.assertIn("renamed_worker", self.get(self.team_url)[0])
+        self.assertIn("renamed_worker", self.get(self.project_url)[0])
+
+    def test_login_does_not_invalidate(self) -> None:
+        version = fragment_version("worker", self.user.pk)
+        self.client.login(username="test", password="test123")
+        self.assertEqual(fragment_version("worker", self.user.pk), version)
+
+
+class FileBasedFragmentCacheTests(FragmentCacheViewTests):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings = override_settings(CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            },
+            "sessions": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "sessions",
+            },
+            FRAGMENT_CACHE: {
+                "BACKEND":
+                    "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": directory.name,
+            },
+        })
+        settings.enable()
+        self.addCleanup(settings.disable)
+        super().setUp()
@@ -0,0 +1,159 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from task_manager.bulk import complete_tasks, move_to_project, reassign_tasks
+from task_manager.inbox import Inbox
+from task_manager.models import InboxEntry, Position, Project, Task, TaskType
+from task_manager.reference import task_types
+from task_manager.stats import get_worker_stats
+
+
+class InboxTests(TestCase):
+    def setUp(self) -> None:
+        position = Position.objects.create(name="test_position")
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test123", position=position
+        )
+        self.other = get_user_model().objects.create_user(
+            username="other", password="test123", position=position
+        )
+        self.task_type = TaskType.objects.create(name="test_type")
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2030-01-01"
+        )
+        self.today = date.today()
+        self.late = self.create_task("late", self.today - timedelta(days=1))
+        self.soon = self.create_task("soon", self.today + timedelta(days=1))
+        self.late.assignees.set([self.user, self.other])
+        self.soon.assignees.set([self.user])
+
+    def create_task(self, name: str, deadline: date) -> Task:
+        return Task.objects.create(
+            name=name,
+            description="test description",
+            deadline=deadline,
+            task_type=self.task_type,
+            project=self.project,
+        )
+
+    def entries(self, worker) -> list[tuple]:
+        return list(
+            InboxEntry.objects.filter(worker=worker).values_list(
+                "task__name", "deadline", "is_completed", "project_id"
+            )
+        )
+
+    def test_assignment_creates_entries_in_deadline_order(self) -> None:
+        self.assertEqual(
+            self.entries(self.user),
+            [
+                ("late", self.late.deadline, False, self.project.pk),
+                ("soon", self.soon.deadline, False, self.project.pk),
+            ],
+        )
+        self.assertEqual(len(self.entries(self.other)), 1)
+
+    def test_removing_assignees_drops_entries(self) -> None:
+        self.late.assignees.remove(self.user)
+        self.assertEqual([row[0] for row in self.entries(self.user)], ["soon"])
+
+        self.user.tasks.clear()
+        self.assertEqual(self.entries(self.user), [])
+        self.assertEqual(len(self.entries(self.other)), 1)
+
+    def test_reverse_assignment(self) -> None:
+        self.other.tasks.add(self.soon)
+        self.assertEqual(
+            [row[0] for row in self.entries(self.other)], ["late", "soon"]
+        )
+
+    def test_task_save_updates_entries(self) -> None:
+        self.soon.deadline = self.today - timedelta(days=5)
+        self.soon.is_completed = True
+        self.soon.save()
+
+        self.assertEqual(
+            self.entries(self.user)[0],
+            ("soon", self.soon.deadline, True, self.project.pk),
+        )
+
+    def test_bulk_changes_update_entries(self) -> None:
+        complete_tasks(Task.objects.filter(pk=self.late.pk))
+        move_to_project(Task.objects.all(), None)
+
+        self.assertEqual(
+            self.entries(self.other),
+            [("late", self.late.deadline, True, None)],
+        )
+
+    def test_reassign_rebuilds_entries(self) -> None:
+        reassign_tasks(Task.objects.filter(pk=self.late.pk), [self.other])
+        self.assertEqual([row[0] for row in self.entries(self.user)], ["soon"])
+        self.assertEqual(
+            [row[0] for row in self.entries(self.other)], ["late"]
+        )
+
+    def test_deleting_task_drops_entries(self) -> None:
+        self.late.delete()
+        self.assertEqual(self.entries(self.other), [])
+
+    def test_rebuild_command(self) -> None:
+        expected = sorted(InboxEntry.objects.values_list("worker", "task"))
+        InboxEntry.objects.all().delete()
+
+        call_command("rebuild_inbox", stdout=StringIO())
+
+        self.assertEqual(
+            sorted(InboxEntry.objects.values_list("worker", "task")), expected
+        )
+
+    def test_inbox_reads_once(self) -> None:
+        complete_tasks(Task.objects.filter(pk=self.late.pk))
+        inbox = Inbox(self.user.pk)
+        task_types.all()
+
+        # The entries, then the assignees; no task rows.
+        with self.assertNumQueries(2):
+            self.assertEqual(inbox.open_tasks(), [self.soon])
+            self.assertEqual(inbox.completed_tasks(), [self.late])
+            self.assertEqual(
+                [worker.username for worker in inbox.tasks[1].assignees.all()],
+                ["test"],
+            )
+        late, soon = inbox.tasks
+        self.assertEqual(
+            (soon.name, soon.task_type.name, soon.status_bucket),
+            ("soon", "test_type", "active"),
+        )
+        self.assertEqual(late.status_bucket, "completed")
+
+    def test_task_renames_update_entries(self) -> None:
+        self.soon.name = "renamed"
+        self.soon.save()
+        Task.objects.filter(pk=self.late.pk).update(name="late renamed")
+
+        self.assertEqual(
+            [row[0] for row in self.entries(self.user)],
+            ["late renamed", "renamed"],
+        )
+        self.assertEqual(
+            list(InboxEntry.objects.filter(worker=self.user).values_list(
+                "name", flat=True
+            )),
+            ["late renamed", "renamed"],
+        )
+
+    def test_worker_stats(self) -> None:
+        self.assertEqual(
+            get_worker_stats(self.user.pk, self.today),
+            {
+                "num_all_tasks": 2,
+                "num_completed_tasks": 0,
+                "num_not_completed_tasks": 2,
+                "num_overdue_tasks": 1,
+            },
+        )
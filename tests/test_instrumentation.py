@@ -0,0 +1,139 @@
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from task_manager.instrumentation import (
+    QueryBudgetExceeded,
+    fingerprint,
+    metrics,
+)
+from task_manager.models import Position, Project, Team
+from task_manager.pooling import render_pool_stats
+
+PROJECT_LIST_URL = reverse("task_manager:project-list")
+METRICS_URL = reverse("task_manager:metrics")
+
+
+class FingerprintTests(TestCase):
+    def test_collapses_numbers_and_in_lists(self) -> None:
+        self.assertEqual(
+            fingerprint("SELECT 1 FROM t WHERE id IN (%s, %s, %s) LIMIT 21"),
+            "SELECT ? FROM t WHERE id IN (...) LIMIT ?",
+        )
+        self.assertEqual(
+            fingerprint("SELECT a FROM t WHERE id IN (%s,%s)"),
+            fingerprint("SELECT a FROM t WHERE id IN (%s, %s, %s, %s)"),
+        )
+
+
+class QueryInstrumentationMiddlewareTests(TestCase):
+    def setUp(self) -> None:
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+        position = Position.objects.create(name="test_position")
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test123", position=position
+        )
+        self.client.force_login(self.user)
+        for i in range(3):
+            project = Project.objects.create(
+                project_name=f"project_{i}",
+                deadline=date(2030, 1, 1),
+                description="test",
+            )
+            Team.objects.create(name=f"team_{i}", project=project)
+
+    def test_records_view_metrics(self) -> None:
+        response = self.client.get(PROJECT_LIST_URL)
+
+        self.assertIn("db;dur=", response["Server-Timing"])
+        sample = metrics.recent[-1]
+        self.assertEqual(sample["view"], "project-list")
+        self.assertEqual(sample["path"], PROJECT_LIST_URL)
+        self.assertGreater(sample["queries"], 0)
+        self.assertGreater(sample["template_time"], 0)
+        self.assertFalse(sample["over_budget"])
+
+    @override_settings(QUERY_BUDGETS={"project-list": 2})
+    def test_budget_fails_in_tests(self) -> None:
+        with self.assertRaisesMessage(
+            QueryBudgetExceeded, "project-list ran"
+        ):
+            self.client.get(PROJECT_LIST_URL)
+
+    @override_settings(
+        QUERY_BUDGETS={"project-list": 2}, QUERY_BUDGET_RAISE=False
+    )
+    def test_budget_logs_outside_tests(self) -> None:
+        with self.assertLogs("task_manager.queries", "WARNING") as logs:
+            response = self.client.get(PROJECT_LIST_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("budget is 2", logs.output[0])
+        self.assertTrue(metrics.recent[-1]["over_budget"])
+
+    def test_other_apps_are_not_instrumented(self) -> None:
+        self.client.get(reverse("login"))
+        self.assertEqual(len(metrics.recent), 0)
+
+    def test_metrics_endpoint(self) -> None:
+        self.client.get(PROJECT_LIST_URL)
+        response = self.client.get(METRICS_URL)
+
+        self.assertEqual(response.status_code, 200)
+        content = response.content.decode()
+        self.assertIn("# TYPE task_manager_db_queries_total counter", content)
+        self.assertIn(
+            'task_manager_requests_total{view="project-list"} 1', content
+        )
+
+    def test_metrics_endpoint_is_local_only(self) -> None:
+        response = self.client.get(METRICS_URL, REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(response.status_code, 404)
+
+
+class ConnectionMetricsTests(TestCase):
+    def test_pool_stats(self) -> None:
+        lines = render_pool_stats(
+            {
+                "default": {
+                    "pool_size": 4,
+                    "pool_available": 3,
+                    "requests_num": 120,
+                    "requests_queued": 7,
+                    "requests_wait_ms": 1500,
+                    "requests_errors": 1,
+                },
+                "replica_0": {"pool_size": 2, "requests_num": 30},
+            }
+        )
+
+        self.assertIn("# TYPE task_manager_db_pool_waits_total counter", lines)
+        self.assertIn(
+            'task_manager_db_pool_checkouts_total{database="default"} 120',
+            lines,
+        )
+        self.assertIn(
+            'task_manager_db_pool_checkouts_total{database="replica_0"} 30',
+            lines,
+        )
+        self.assertIn(
+            'task_manager_db_pool_wait_seconds_total{database="default"} 1.5',
+            lines,
+        )
+        self.assertIn(
+            'task_manager_db_pool_timeouts_total{database="replica_0"} 0',
+            lines,
+        )
+        self.assertEqual(render_pool_stats({}), [])
+
+    def test_metrics_endpoint(self) -> None:
+        content = self.client.get(METRICS_URL).content.decode()
+
+        self.assertIn(
+            'task_manager_db_connects_total{database="default"}', content
+        )
+        # SQLite connections are not pooled.
+        self.assertNotIn("task_manager_db_pool_", content)
@@ -0,0 +1,203 @@
+import asyncio
+import threading
+
+from asgiref.sync import async_to_sync
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from task_manager.bulk import complete_tasks, reassign_tasks
+from task_manager.live import (
+    RESYNC,
+    TASKS,
+    LocalBroker,
+    get_broker,
+    publish_task_changes,
+    worker_channel,
+)
+from task_manager.models import Position, Task, TaskType
+from task_manager.views import LiveUpdatesView
+
+LIVE_URL = reverse("task_manager:live")
+
+
+class RecordingBroker(LocalBroker):
+    """Records what is published, as if every channel had a listener."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages = []
+
+    def wants(self, channel: str) -> bool:
+        return True
+
+    def publish(self, channel: str, message: dict) -> None:
+        self.messages.append(
+            (channel, message["event"], message.get("id"))
+        )
+
+
+class LocalBrokerTests(SimpleTestCase):
+    def test_publish_from_another_thread(self) -> None:
+        broker = LocalBroker()
+
+        async def receive() -> list:
+            subscription = broker.subscribe([TASKS, "other"])
+            self.assertTrue(broker.wants(TASKS))
+            thread = threading.Thread(
+                target=broker.publish, args=(TASKS, {"event": "a"})
+            )
+            thread.start()
+            thread.join()
+            broker.publish("unrelated", {"event": "b"})
+            messages = [
+                await subscription.get(1),
+                await subscription.get(0.01),
+            ]
+            broker.unsubscribe(subscription)
+            return messages
+
+        self.assertEqual(async_to_sync(receive)(), [{"event": "a"}, None])
+        self.assertFalse(broker.wants(TASKS))
+
+    @override_settings(LIVE_QUEUE_SIZE=2)
+    def test_slow_subscribers_resync(self) -> None:
+        broker = LocalBroker()
+
+        async def receive() -> list:
+            subscription = broker.subscribe([TASKS])
+            for i in range(3):
+                broker.publish(TASKS, {"event": i})
+            await asyncio.sleep(0)
+            return [
+                await subscription.get(0.01),
+                await subscription.get(0.01),
+            ]
+
+        self.assertEqual(async_to_sync(receive)(), [RESYNC, None])
+
+
+@override_settings(LIVE_BROKER="tests.test_live.RecordingBroker")
+class TaskEventTests(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+            position=Position.objects.create(name="developer"),
+        )
+        self.task = Task.objects.create(
+            name="task",
+            description="test description",
+            deadline="2030-01-01",
+            task_type=TaskType.objects.create(name="Bug"),
+        )
+        self.messages = get_broker().messages
+        self.messages.clear()
+
+    def test_events_are_sent_on_commit(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.assignees.add(self.user)
+            self.assertEqual(self.messages, [])
+        self.assertEqual(
+            self.messages,
+            [
+                (worker_channel(self.user.pk), "task.assigned", self.task.pk),
+                (TASKS, "task.updated", self.task.pk),
+            ],
+        )
+
+    def test_bulk_changes(self) -> None:
+        other = get_user_model().objects.create_user(
+            username="other",
+            password="test123",
+            position=self.user.position,
+        )
+        self.task.assignees.add(self.user)
+        self.messages.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            complete_tasks(Task.objects.all())
+            reassign_tasks(Task.objects.all(), [other])
+        self.assertEqual(
+            self.messages,
+            [
+                (TASKS, "task.updated", self.task.pk),
+                (TASKS, "task.updated", self.task.pk),
+                (
+                    worker_channel(self.user.pk),
+                    "task.unassigned",
+                    self.task.pk,
+                ),
+                (worker_channel(other.pk), "task.assigned", self.task.pk),
+            ],
+        )
+
+    @override_settings(LIVE_MAX_ROWS=1)
+    def test_large_changes_resync(self) -> None:
+        Task.objects.create(
+            name="other",
+            description="test description",
+            deadline="2030-01-01",
+            task_type=self.task.task_type,
+        )
+        self.messages.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            complete_tasks(Task.objects.all())
+        self.assertEqual(self.messages, [(TASKS, "resync", None)])
+
+    def test_changes_are_skipped_without_subscribers(self) -> None:
+        with (
+            override_settings(LIVE_BROKER="task_manager.live.LocalBroker"),
+            self.captureOnCommitCallbacks() as callbacks,
+            self.assertNumQueries(0),
+        ):
+            publish_task_changes(Task.objects.values_list("pk", flat=True))
+        self.assertEqual(callbacks, [])
+
+    def test_delete(self) -> None:
+        task_pk = self.task.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.delete()
+        self.assertEqual(self.messages, [(TASKS, "task.deleted", task_pk)])
+
+
+class LiveUpdatesViewTests(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+            position=Position.objects.create(name="developer"),
+        )
+
+    async def test_stream(self) -> None:
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(LIVE_URL)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertEqual(
+            await anext(response.streaming_content), b"retry: 3000\n\n"
+        )
+
+    async def test_events(self) -> None:
+        stream = LiveUpdatesView().stream([worker_channel(self.user.pk)])
+        self.assertEqual(await anext(stream), "retry: 3000\n\n")
+        get_broker().publish(
+            worker_channel(self.user.pk),
+            {"event": "task.unassigned", "id": 1},
+        )
+        self.assertEqual(
+            await anext(stream),
+            'event: task.unassigned\ndata: {"id": 1}\n\n',
+        )
+        await stream.aclose()
+        self.assertFalse(get_broker().wants(worker_channel(self.user.pk)))
+
+    def test_requires_asgi_and_login(self) -> None:
+        self.assertEqual(self.client.get(LIVE_URL).status_code, 302)
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(LIVE_URL).status_code, 204)
+
+    def test_pages_subscribe(self) -> None:
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("task_manager:task-list"))
+        self.assertContains(response, 'data-live-tasks="all"')
+        self.assertContains(response, LIVE_URL)
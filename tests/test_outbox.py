@@ -0,0 +1,166 @@
+import json
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from task_manager.models import (
+    ChangeEvent,
+    Position,
+    Project,
+    Task,
+    TaskType,
+    Team,
+)
+from task_manager.outbox import read_changes
+
+CHANGES_URL = reverse("task_manager:changes")
+
+
+class ChangeEventTests(TestCase):
+    def setUp(self) -> None:
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2030-01-01"
+        )
+        self.team = Team.objects.create(name="team", project=self.project)
+        self.user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+            position=Position.objects.create(name="developer"),
+            team=self.team,
+        )
+        self.task = Task.objects.create(
+            name="task",
+            description="test description",
+            deadline="2030-01-01",
+            task_type=TaskType.objects.create(name="Bug"),
+            project=self.project,
+        )
+        self.client.force_login(self.user)
+        self.cursor = ChangeEvent.objects.last().pk
+
+    def changes(self) -> list[tuple]:
+        return [
+            (event["resource"], event["object_id"], event["action"],
+             event["fields"])
+            for event in read_changes(self.cursor)
+        ]
+
+    def test_saves_and_deletes(self) -> None:
+        self.assertEqual(
+            [
+                (event.resource, event.action)
+                for event in ChangeEvent.objects.all()
+            ],
+            [
+                ("projects", "created"),
+                ("teams", "created"),
+                ("workers", "created"),
+                ("tasks", "created"),
+            ],
+        )
+        self.task.name = "renamed"
+        self.task.save(update_fields=["name"])
+        self.user.last_login = timezone.now()
+        self.user.save(update_fields=["last_login"])
+        team_pk = self.team.pk
+        self.team.delete()
+        self.assertEqual(
+            self.changes(),
+            [
+                ("tasks", self.task.pk, "updated", ["name"]),
+                ("workers", self.user.pk, "updated", ["team"]),
+                ("teams", team_pk, "deleted", None),
+            ],
+        )
+
+    def test_project_delete_cascades(self) -> None:
+        task_pk, project_pk = self.task.pk, self.project.pk
+        self.project.delete()
+        self.assertCountEqual(
+            self.changes(),
+            [
+                ("teams", self.team.pk, "updated", ["project"]),
+                ("tasks", task_pk, "deleted", None),
+                ("projects", project_pk, "deleted", None),
+            ],
+        )
+
+    def test_assignees_and_bulk_changes(self) -> None:
+        self.task.assignees.add(self.user)
+        self.task.assignees.add(self.user)
+        self.user.tasks.clear()
+        response = self.client.post(
+            reverse(
+                "task_manager:set-task-as-completed", args=[self.task.pk]
+            )
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            self.changes(),
+            [
+                ("tasks", self.task.pk, "updated", ["assignees"]),
+                ("tasks", self.task.pk, "updated", ["assignees"]),
+                ("tasks", self.task.pk, "updated", ["is_completed"]),
+            ],
+        )
+
+    def test_rolled_back_changes_leave_no_events(self) -> None:
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            self.task.name = "renamed"
+            self.task.save()
+            raise RuntimeError
+        self.assertEqual(self.changes(), [])
+
+    def test_feed_waits_for_unsettled_gaps(self) -> None:
+        self.task.save()
+        ChangeEvent.objects.last().delete()
+        self.task.save()
+        self.assertEqual(self.changes(), [])
+
+        ChangeEvent.objects.filter(pk__gt=self.cursor).update(
+            changed_at=timezone.now() - timedelta(minutes=1)
+        )
+        with self.settings(CHANGES_SETTLE_SECONDS=300):
+            self.assertEqual(self.changes(), [])
+        # The default window is a few seconds.
+        self.assertEqual(len(self.changes()), 1)
+
+    def test_endpoint(self) -> None:
+        self.task.save()
+        self.project.save()
+        response = self.client.get(
+            CHANGES_URL, {"since": self.cursor, "limit": 1}
+        )
+        document = response.json()
+        self.assertEqual(document["data"][0]["resource"], "tasks")
+        self.assertTrue(document["has_more"])
+
+        document = self.client.get(
+            CHANGES_URL, {"since": document["next"]}
+        ).json()
+        self.assertEqual(
+            [event["resource"] for event in document["data"]], ["projects"]
+        )
+        self.assertFalse(document["has_more"])
+
+        response = self.client.get(CHANGES_URL, {"since": "x"})
+        self.assertEqual(response.status_code, 400)
+        self.client.logout()
+        self.assertEqual(self.client.get(CHANGES_URL).status_code, 403)
+
+    def test_command(self) -> None:
+        out = StringIO()
+        call_command("stream_changes", batch_size=3, stdout=out)
+        events = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(events), 4)
+        self.assertEqual(events[-1]["id"], self.cursor)
+
+        out = StringIO()
+        call_command("stream_changes", since=self.cursor, stdout=out)
+        self.assertEqual(out.getvalue(), "")
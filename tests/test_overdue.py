@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from task_manager.models import (
+    OverdueScan,
+    Position,
+    Project,
+    ProjectProgress,
+    Task,
+    TaskType,
+    Workload,
+)
+from task_manager.overdue import newly_overdue, scan_overdue
+from task_manager.workload import PROJECT, WORKER, get_workload
+
+
+class OverdueScanTests(TestCase):
+    def setUp(self) -> None:
+        self.today = datetime.now().date()
+        self.user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+            position=Position.objects.create(name="developer"),
+        )
+        self.task_type = TaskType.objects.create(name="Bug")
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2030-01-01"
+        )
+        self.other_project = Project.objects.create(
+            project_name="other_project", deadline="2030-01-01"
+        )
+        self.soon = self.create_task(self.project, days=1)
+        self.later = self.create_task(self.project, days=3)
+        self.create_task(self.other_project, days=10)
+        self.soon.assignees.add(self.user)
+        # Start the daily scans today.
+        scan_overdue(self.today)
+
+    def create_task(self, project, days) -> Task:
+        return Task.objects.create(
+            name=f"task_{days}",
+            description="test description",
+            deadline=self.today + timedelta(days=days),
+            task_type=self.task_type,
+            project=project,
+        )
+
+    def test_recounts_newly_overdue_tasks_only(self) -> None:
+        day = self.today + timedelta(days=2)
+        scan = scan_overdue(day)
+
+        self.assertEqual((scan.since, scan.overdue_tasks), (self.today, 1))
+        progress = ProjectProgress.objects.get(project=self.project)
+        self.assertEqual(
+            (progress.overdue_tasks, progress.counted_on), (1, day)
+        )
+        self.assertEqual(
+            get_workload(WORKER, self.user.pk, day).overdue_tasks, 1
+        )
+        # Untouched counters are rolled over without a recount.
+        self.assertFalse(
+            ProjectProgress.objects.exclude(counted_on=day).exists()
+        )
+        self.assertFalse(Workload.objects.exclude(counted_on=day).exists())
+        with self.assertNumQueries(1):
+            summary = get_workload(PROJECT, self.project.pk, day)
+        self.assertEqual(summary.overdue_tasks, 1)
+
+    def test_is_idempotent(self) -> None:
+        day = self.today + timedelta(days=4)
+        self.assertEqual(scan_overdue(day).overdue_tasks, 2)
+        with self.assertNumQueries(1):
+            self.assertIsNone(scan_overdue(day))
+
+        scan = scan_overdue(day + timedelta(days=1))
+        self.assertEqual((scan.since, scan.overdue_tasks), (day, 0))
+
+    def test_resumes_after_the_cursor(self) -> None:
+        day = self.today + timedelta(days=4)
+        OverdueScan.objects.create(
+            scanned_on=day,
+            since=self.today,
+            cursor_deadline=self.soon.deadline,
+            cursor_id=self.soon.pk,
+            overdue_tasks=1,
+        )
+        self.assertEqual(
+            list(newly_overdue(OverdueScan.objects.get(pk=day))),
+            [self.later],
+        )
+        scan = scan_overdue(day, batch_size=1)
+        self.assertEqual(scan.overdue_tasks, 2)
+        self.assertIsNotNone(scan.finished_at)
+        self.assertEqual(
+            ProjectProgress.objects.get(project=self.project).overdue_tasks, 2
+        )
+
+    def test_completed_tasks_are_skipped(self) -> None:
+        self.soon.is_completed = True
+        self.soon.save()
+        scan = scan_overdue(self.today + timedelta(days=2))
+        self.assertEqual(scan.overdue_tasks, 0)
+
+    def test_command(self) -> None:
+        out = StringIO()
+        call_command("scan_overdue", stdout=out)
+        self.assertIn("already rolled over", out.getvalue())
+
+        OverdueScan.objects.all().delete()
+        out = StringIO()
+        call_command("scan_overdue", batch_size=10, stdout=out)
+        self.assertIn("0 tasks became overdue", out.getvalue())
@@ -0,0 +1,204 @@
+from datetime import date, timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.paginator import InvalidPage
+from django.http import QueryDict
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from task_manager.models import (
+    ACTIVE,
+    COMPLETED,
+    OVERDUE,
+    Position,
+    Project,
+    Task,
+    TaskType,
+)
+from task_manager.pagination import (
+    NEXT,
+    KeysetPaginator,
+    ShowMore,
+    encode_cursor,
+)
+
+TASK_LIST_URL = reverse("task_manager:task-list")
+PROJECT_LIST_URL = reverse("task_manager:project-list")
+
+
+class KeysetPaginatorTests(TestCase):
+    def setUp(self) -> None:
+        task_type = TaskType.objects.create(name="test_type")
+        start = date(2025, 1, 1)
+        for i in range(7):
+            Task.objects.create(
+                name=f"task_{i}",
+                description="test description",
+                deadline=start + timedelta(days=i % 3),
+                priority=i % 2 + 1,
+                task_type=task_type,
+            )
+        self.expected = list(Task.objects.all())
+
+    def test_ordering_keys_follow_model_meta(self) -> None:
+        paginator = KeysetPaginator(Task.objects.all(), 3)
+        self.assertEqual(paginator.keys, ["deadline", "priority", "id"])
+        paginator = KeysetPaginator(Project.objects.all(), 3)
+        self.assertEqual(paginator.keys, ["pk"])
+
+    def test_walk_forward_and_back(self) -> None:
+        paginator = KeysetPaginator(Task.objects.all(), 3)
+        pages = [paginator.page(None)]
+        while pages[-1].has_next():
+            pages.append(paginator.page(pages[-1].next_cursor))
+
+        self.assertEqual(
+            [task for page in pages for task in page], self.expected
+        )
+        self.assertFalse(pages[0].has_previous())
+
+        previous = paginator.page(pages[-1].previous_cursor)
+        self.assertEqual(list(previous), list(pages[-2]))
+        self.assertTrue(previous.has_next())
+
+    def test_page_does_not_count(self) -> None:
+        paginator = KeysetPaginator(Task.objects.all(), 3)
+        cursor = paginator.page(None).next_cursor
+        with self.assertNumQueries(1):
+            list(paginator.page(cursor))
+
+    def test_cursor_values_are_validated(self) -> None:
+        paginator = KeysetPaginator(Task.objects.all(), 3)
+        for values in (
+            ["soon", 1, 1],
+            [{"a": 1}, 1, 1],
+            ["2025-01-01", [1], 1],
+            ["2025-01-01", 1, None],
+        ):
+            with self.subTest(values=values), self.assertRaises(InvalidPage):
+                paginator.page(encode_cursor(values, NEXT))
+
+
+class KeysetListViewTests(TestCase):
+    def setUp(self) -> None:
+        user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+            position=Position.objects.create(name="test_position"),
+        )
+        self.client.force_login(user)
+        for i in range(25):
+            Project.objects.create(
+                project_name=f"project_{i}",
+                deadline="2025-01-01",
+                status="Active",
+            )
+
+    @override_settings(KEYSET_PAGINATION=True)
+    def test_project_list_cursor_pages(self) -> None:
+        response = self.client.get(PROJECT_LIST_URL)
+        page = response.context["page_obj"]
+        self.assertEqual(len(response.context["project_list"]), 20)
+        self.assertTrue(response.context["is_paginated"])
+        self.assertContains(response, f"cursor={page.next_cursor}")
+        self.assertNotContains(response, "of 2")
+
+        response = self.client.get(
+            PROJECT_LIST_URL, {"cursor": page.next_cursor}
+        )
+        self.assertEqual(len(response.context["project_list"]), 5)
+        self.assertFalse(response.context["page_obj"].has_next())
+
+    def test_invalid_cursor_returns_404(self) -> None:
+        response = self.client.get(TASK_LIST_URL, {"cursor": "broken"})
+        self.assertEqual(response.status_code, 404)
+        cursor = encode_cursor(["soon", 1, 1], NEXT)
+        response = self.client.get(TASK_LIST_URL, {"cursor": cursor})
+        self.assertEqual(response.status_code, 404)
+
+    def test_offset_pagination_is_default(self) -> None:
+        response = self.client.get(PROJECT_LIST_URL)
+        self.assertContains(response, "1 of 2")
+
+
+class TaskBucketTests(TestCase):
+    def setUp(self) -> None:
+        user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+            position=Position.objects.create(name="test_position"),
+        )
+        self.client.force_login(user)
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2030-01-01"
+        )
+        task_type = TaskType.objects.create(name="test_type")
+        today = date.today()
+        for i in range(9):
+            Task.objects.create(
+                name=f"task_{i}",
+                description="test description",
+                deadline=today + timedelta(days=i % 3 - 1),
+                is_completed=i >= 6,
+                task_type=task_type,
+                project=self.project,
+            )
+
+    def test_status_buckets(self) -> None:
+        buckets = dict(
+            Task.objects.with_status_bucket()
+            .values_list("name", "status_bucket")
+        )
+        self.assertEqual(buckets["task_0"], OVERDUE)
+        self.assertEqual(buckets["task_1"], ACTIVE)
+        self.assertEqual(buckets["task_2"], ACTIVE)
+        self.assertEqual(buckets["task_6"], COMPLETED)
+
+        self.assertEqual(Task.objects.in_buckets(OVERDUE).count(), 2)
+        self.assertEqual(Task.objects.in_buckets(ACTIVE, OVERDUE).count(), 6)
+        self.assertEqual(Task.objects.in_buckets(COMPLETED).count(), 3)
+
+    def test_show_more(self) -> None:
+        queryset = Task.objects.in_buckets(ACTIVE, OVERDUE)
+        rows = ShowMore(queryset, QueryDict("a=1"), "pages", 4)
+        with self.assertNumQueries(1):
+            self.assertEqual(len(rows), 4)
+            self.assertTrue(rows.has_more)
+        self.assertEqual(rows.more_query(), "a=1&pages=2")
+
+        rows = ShowMore(queryset, QueryDict("pages=2"), "pages", 4)
+        self.assertEqual(len(list(rows)), 6)
+        self.assertFalse(rows.has_more)
+
+        rows = ShowMore(queryset, QueryDict("pages=x"), "pages", 4)
+        self.assertEqual(rows.pages, 1)
+
+        rows = ShowMore(
+            queryset, QueryDict("pages=100000000000000000000"), "pages", 1
+        )
+        self.assertEqual(rows.pages, ShowMore.max_pages)
+        self.assertEqual(len(rows), 6)
+        self.assertFalse(rows.has_more)
+
+    @mock.patch("task_manager.views.TASK_TABLE_SIZE", 4)
+    def test_project_detail_shows_each_bucket(self) -> None:
+        url = reverse("task_manager:project-detail", args=[self.project.pk])
+        response = self.client.get(url)
+        context = response.context
+        self.assertEqual(len(context["tasks"]), 4)
+        self.assertTrue(
+            all(not task.is_completed for task in context["tasks"])
+        )
+        self.assertEqual(len(context["completed_tasks"]), 3)
+        self.assertContains(response, "?open_pages=2")
+        self.assertNotContains(response, "?completed_pages=2")
+
+        response = self.client.get(url, {"open_pages": 2})
+        self.assertEqual(len(response.context["tasks"]), 6)
+        self.assertNotContains(response, "?open_pages=3")
+
+        response = self.client.get(
+            url, {"open_pages": "100000000000000000000"}
+        )
+        self.assertEqual(len(response.context["tasks"]), 6)
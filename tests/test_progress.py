@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.models import (
+    Position,
+    Project,
+    ProjectProgress,
+    Task,
+    TaskType,
+)
+from task_manager.progress import (
+    find_inconsistent_progress,
+    get_project_progress,
+)
+
+
+class ProjectProgressTests(TestCase):
+    def setUp(self) -> None:
+        self.task_type = TaskType.objects.create(name="test_type")
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2025-01-01", status="Active"
+        )
+        self.other_project = Project.objects.create(
+            project_name="other_project",
+            deadline="2025-01-01",
+            status="Active",
+        )
+        date_now = datetime.now().date()
+        self.task_1 = self.create_task(date_now + timedelta(days=1))
+        self.task_2 = self.create_task(date_now - timedelta(days=1))
+
+    def create_task(self, deadline, is_completed=False) -> Task:
+        return Task.objects.create(
+            name="test",
+            description="test description",
+            deadline=deadline,
+            is_completed=is_completed,
+            task_type=self.task_type,
+            project=self.project,
+        )
+
+    def assert_progress(self, project, total, completed, overdue) -> None:
+        progress = ProjectProgress.objects.get(project=project)
+        self.assertEqual(
+            (progress.total_tasks,
+             progress.completed_tasks,
+             progress.overdue_tasks),
+            (total, completed, overdue),
+        )
+
+    def test_counters_follow_task_saves(self) -> None:
+        self.assert_progress(self.project, 2, 0, 1)
+        self.task_2.is_completed = True
+        self.task_2.save()
+        self.assert_progress(self.project, 2, 1, 0)
+
+    def test_counters_follow_project_change(self) -> None:
+        self.task_1.project = self.other_project
+        self.task_1.save()
+        self.assert_progress(self.project, 1, 0, 1)
+        self.assert_progress(self.other_project, 1, 0, 0)
+
+    def test_counters_follow_bulk_update(self) -> None:
+        Task.objects.filter(project=self.project).update(
+            project=self.other_project
+        )
+        self.assert_progress(self.project, 0, 0, 0)
+        self.assert_progress(self.other_project, 2, 0, 1)
+
+    def test_counters_follow_delete(self) -> None:
+        self.task_2.delete()
+        self.assert_progress(self.project, 1, 0, 0)
+
+    def test_project_delete_cascades(self) -> None:
+        self.project.delete()
+        self.assertFalse(
+            ProjectProgress.objects.filter(project_id=self.project.pk).exists()
+        )
+
+    def test_set_task_as_completed_updates_counters(self) -> None:
+        user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+            position=Position.objects.create(name="test_position"),
+        )
+        self.client.force_login(user)
+        self.client.post(reverse(
+            "task_manager:set-task-as-completed", args=[self.task_1.pk]
+        ))
+        self.assert_progress(self.project, 2, 1, 1)
+        self.assertEqual(
+            get_project_progress(self.project).percentage_complete, 50
+        )
+
+    def test_read_is_single_query(self) -> None:
+        with self.assertNumQueries(1):
+            get_project_progress(self.project)
+
+    def test_consistency_check_and_rebuild(self) -> None:
+        ProjectProgress.objects.filter(project=self.project).update(
+            total_tasks=10
+        )
+        self.assertEqual(
+            [project_id for project_id, _, _ in find_inconsistent_progress()],
+            [self.project.pk],
+        )
+        with self.assertRaises(CommandError):
+            call_command("check_project_progress", stdout=StringIO())
+
+        call_command("rebuild_project_progress", stdout=StringIO())
+        self.assertEqual(find_inconsistent_progress(), [])
+        self.assert_progress(self.project, 2, 0, 1)
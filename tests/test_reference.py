@@ -0,0 +1,116 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import transaction
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.forms import TaskForm, WorkerCreationForm
+from task_manager.fragments import FRAGMENT_CACHE
+from task_manager.models import Position, TaskType
+from task_manager.reference import positions, task_types
+
+CATEGORIES_URL = reverse("task_manager:categories")
+
+
+class ReferenceTableTests(TestCase):
+    def setUp(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            self.position = Position.objects.create(name="developer")
+            self.bug = TaskType.objects.create(name="Bug")
+            TaskType.objects.create(name="QA")
+        user = get_user_model().objects.create_user(
+            username="test", password="test123", position=self.position
+        )
+        self.client.force_login(user)
+
+    def test_rows_are_precomputed(self) -> None:
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [task_type.name for task_type in task_types.all()],
+                ["Bug", "QA"],
+            )
+            self.assertEqual(positions.all(), [self.position])
+
+    def test_other_processes_read_the_shared_cache(self) -> None:
+        task_types.local = (None, [])
+        with self.assertNumQueries(0):
+            self.assertEqual(len(task_types.all()), 2)
+
+    def test_cold_cache_loads_once(self) -> None:
+        caches[FRAGMENT_CACHE].clear()
+        with self.assertNumQueries(1):
+            task_types.all()
+        with self.assertNumQueries(0):
+            task_types.all()
+
+    def test_changes_reload_the_table_on_commit(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bug.name = "Defect"
+            self.bug.save()
+            Position.objects.create(name="tester")
+            # Seen by this transaction, not published before the commit.
+            self.assertEqual(
+                [task_type.name for task_type in task_types.all()],
+                ["Defect", "QA"],
+            )
+            cache = caches[FRAGMENT_CACHE]
+            shared = cache.get(
+                task_types.rows_key(cache.get(task_types.stamp_key))
+            )
+            self.assertEqual(
+                [task_type.name for task_type in shared], ["Bug", "QA"]
+            )
+
+        self.assertEqual(
+            [task_type.name for task_type in task_types.all()],
+            ["Defect", "QA"],
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bug.delete()
+        self.assertEqual(
+            [task_type.name for task_type in task_types.all()], ["QA"]
+        )
+
+        response = self.client.get(CATEGORIES_URL)
+        self.assertEqual(
+            [position.name for position in response.context["positions"]],
+            ["developer", "tester"],
+        )
+
+    def test_rolled_back_changes_are_not_published(self) -> None:
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            TaskType.objects.create(name="Spike")
+            self.assertEqual(len(task_types.all()), 3)
+            raise RuntimeError
+        self.assertEqual(
+            [task_type.name for task_type in task_types.all()],
+            ["Bug", "QA"],
+        )
+
+    def test_categories_page_does_not_query(self) -> None:
+        self.client.get(CATEGORIES_URL)
+        with self.assertNumQueries(0):
+            response = self.client.get(CATEGORIES_URL)
+        self.assertContains(response, "QA")
+
+    def test_categories_page_keeps_its_budget_with_cold_caches(self) -> None:
+        for alias in settings.CACHES:
+            caches[alias].clear()
+        task_types.local = positions.local = (None, [])
+        # Raises QueryBudgetExceeded when over.
+        response = self.client.get(CATEGORIES_URL)
+        self.assertContains(response, "QA")
+
+    def test_form_choices(self) -> None:
+        with self.assertNumQueries(0):
+            choices = list(TaskForm().fields["task_type"].choices)
+            position_field = WorkerCreationForm().fields["position"]
+            self.assertEqual(len(position_field.choices), 2)
+        self.assertEqual(
+            [label for _, label in choices], ["---------", "Bug", "QA"]
+        )
+
+        form = TaskForm(data={"task_type": self.bug.pk})
+        form.is_valid()
+        self.assertEqual(form.cleaned_data["task_type"], self.bug)
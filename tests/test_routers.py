@@ -0,0 +1,116 @@
+from contextlib import ExitStack
+
+from asgiref.sync import async_to_sync
+
+from django.contrib.auth import get_user_model
+from django.db import connections, router
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from task_manager.models import (
+    Position,
+    Project,
+    ProjectProgress,
+    Task,
+    TaskType,
+    Team,
+)
+
+TASK_LIST_URL = reverse("task_manager:task-list")
+
+
+@override_settings(REPLICA_DATABASES=["replica"])
+class ReplicaRoutingTests(TransactionTestCase):
+    """
+    "replica" is a second SQLite connection mirroring the test database,
+    so committed rows are visible from both aliases.
+    """
+
+    databases = {"default", "replica"}
+
+    def setUp(self) -> None:
+        position = Position.objects.create(name="developer")
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2030-01-01"
+        )
+        team = Team.objects.create(name="test_team", project=self.project)
+        self.user = get_user_model().objects.create_user(
+            username="test", password="test123", position=position, team=team
+        )
+        self.client.force_login(self.user)
+        self.task = Task.objects.create(
+            name="test_task",
+            description="test description",
+            deadline="2030-01-01",
+            task_type=TaskType.objects.create(name="Bug"),
+            project=self.project,
+        )
+        self.task.assignees.set([self.user])
+
+    def request(self, method: str, url: str, data=None) -> tuple:
+        """Return the response and the number of queries per alias."""
+        with ExitStack() as stack:
+            primary, replica = (
+                stack.enter_context(CaptureQueriesContext(connections[alias]))
+                for alias in ("default", "replica")
+            )
+            response = getattr(self.client, method)(url, data)
+        return response, len(primary), len(replica)
+
+    def test_list_reads_from_replica(self) -> None:
+        response, primary, replica = self.request("get", TASK_LIST_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(primary, 0)
+        self.assertGreater(replica, 0)
+        self.assertNotIn("read_primary", response.cookies)
+
+    def test_other_views_read_from_primary(self) -> None:
+        _, primary, replica = self.request(
+            "get", reverse("task_manager:task-create")
+        )
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+    def test_writes_stick_to_primary(self) -> None:
+        response, _, replica = self.request(
+            "post",
+            reverse("task_manager:task-bulk"),
+            {"action": "complete", "task_ids": [self.task.pk]},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(replica, 0)
+        self.assertEqual(response.cookies["read_primary"]["max-age"], 10)
+
+        _, primary, replica = self.request("get", TASK_LIST_URL)
+        self.assertGreater(primary, 0)
+        self.assertEqual(replica, 0)
+
+        del self.client.cookies["read_primary"]
+        _, primary, replica = self.request("get", TASK_LIST_URL)
+        self.assertEqual(primary, 0)
+
+    @override_settings(QUERY_BUDGET_RAISE=False)
+    def test_reads_after_a_write_use_primary(self) -> None:
+        # The first dashboard visit of the day stores project progress,
+        # then reads it back.
+        ProjectProgress.objects.all().delete()
+        response, primary, replica = self.request(
+            "get", reverse("task_manager:index")
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(primary, 0)
+        self.assertGreater(replica, 0)
+        self.assertIn("read_primary", response.cookies)
+
+    def test_async_views(self) -> None:
+        async_to_sync(self.async_client.aforce_login)(self.user)
+        with CaptureQueriesContext(connections["replica"]) as replica:
+            response = async_to_sync(self.async_client.get)(TASK_LIST_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(len(replica), 0)
+
+    def test_primary_outside_requests(self) -> None:
+        self.assertEqual(router.db_for_read(Task), "default")
+        self.assertEqual(router.db_for_write(Task), "default")
+        self.assertFalse(router.allow_migrate("replica", "task_manager"))
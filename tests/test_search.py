@@ -1,6 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.base_user import AbstractBaseUser
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
 from task_manager.models import Team, Position, Task, TaskType, Project
@@ -165,3 +165,40 @@ class ProjectSearchTests(TestCase, SearchTests):
         self.object_2 = project_2.project_name
         self.object_3 = project_3.project_name
         self.url = reverse("task_manager:project-list")
+
+
+@override_settings(
+    SEARCH_BACKEND="task_manager.search.SQLiteFTSSearchBackend"
+)
+class TaskFullTextSearchTests(TaskSearchTests):
+    def test_results_are_ranked(self) -> None:
+        task_type = TaskType.objects.first()
+        weak = Task.objects.create(
+            name="Cleanup",
+            description="minor parser fix",
+            deadline="2025-01-01",
+            task_type=task_type,
+        )
+        strong = Task.objects.create(
+            name="Parser parser",
+            description="rewrite the parser",
+            deadline="2025-01-02",
+            task_type=task_type,
+        )
+        response = self.client.get(self.url, {"search_field": "parser"})
+        self.assertEqual(list(response.context["task_list"]), [strong, weak])
+
+    def test_index_follows_updates_and_deletes(self) -> None:
+        task = Task.objects.get(name=self.object_3)
+        task.name = "Renamed"
+        task.save()
+        response = self.client.get(self.url, {"search_field": "renamed"})
+        self.assertEqual(list(response.context["task_list"]), [task])
+
+        Task.objects.filter(pk=task.pk).update(description="bulk edited")
+        response = self.client.get(self.url, {"search_field": "bulk"})
+        self.assertEqual(list(response.context["task_list"]), [task])
+
+        task.delete()
+        response = self.client.get(self.url, {"search_field": "renamed"})
+        self.assertEqual(list(response.context["task_list"]), [])
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.models import Position, Project, Task, TaskType, Team
+from task_manager.stats import get_task_stats
+
+
+class TaskStatsTests(TestCase):
+    def setUp(self) -> None:
+        position = Position.objects.create(name="test_position")
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2025-01-01", status="Active"
+        )
+        team = Team.objects.create(name="test_team", project=self.project)
+        self.user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+            position=position,
+            team=team,
+        )
+        self.other = get_user_model().objects.create_user(
+            username="other",
+            password="test123",
+            position=position,
+        )
+        task_type = TaskType.objects.create(name="test_type")
+        date_now = datetime.now().date()
+
+        def create_task(is_completed, deadline, assignees, project=None):
+            task = Task.objects.create(
+                name="test",
+                description="test description",
+                deadline=deadline,
+                is_completed=is_completed,
+                task_type=task_type,
+                project=project,
+            )
+            task.assignees.set(assignees)
+
+        create_task(True, date_now, [self.user, self.other], self.project)
+        create_task(False, date_now + timedelta(days=1), [self.user])
+        create_task(
+            False, date_now - timedelta(days=1), [self.other], self.project
+        )
+        create_task(False, date_now - timedelta(days=1), [self.user])
+
+    def test_worker_stats(self) -> None:
+        stats = get_task_stats(worker_id=self.user.id)
+        self.assertEqual(stats["num_all_tasks"], 3)
+        self.assertEqual(stats["num_completed_tasks"], 1)
+        self.assertEqual(stats["num_not_completed_tasks"], 2)
+        self.assertEqual(stats["num_overdue_tasks"], 1)
+        self.assertEqual(stats["num_project_tasks"], 0)
+
+    def test_worker_and_project_stats_in_one_query(self) -> None:
+        with self.assertNumQueries(1):
+            stats = get_task_stats(
+                worker_id=self.user.id, project=self.project
+            )
+        self.assertEqual(stats["num_all_tasks"], 3)
+        self.assertEqual(stats["num_project_tasks"], 2)
+        self.assertEqual(stats["num_project_completed_tasks"], 1)
+        self.assertEqual(stats["num_project_overdue_tasks"], 1)
+        self.assertEqual(stats["percentage_complete_project"], 50)
+
+    def test_empty_scope_does_not_query(self) -> None:
+        with self.assertNumQueries(0):
+            stats = get_task_stats()
+        self.assertEqual(stats["percentage_complete_project"], 0)
+
+    def test_index_view_uses_stats(self) -> None:
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("task_manager:index"))
+        self.assertEqual(response.context["num_all_tasks"], 3)
+        self.assertEqual(response.context["num_overdue_tasks"], 1)
+        self.assertEqual(
+            response.context["percentage_complete_project"], 50
+        )
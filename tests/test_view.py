@@ -227,3 +227,60 @@ class SetTaskAsCompletedTest(TestCase):
         self.task.refresh_from_db()
         self.assertEqual(self.task.is_completed, True)
         self.assertRedirects(response, self.url)
+
+
+class TaskTableQueryCountTest(TestCase):
+    def setUp(self) -> None:
+        self.position = Position.objects.create(name="test_position")
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2025-01-01", status="Active"
+        )
+        team = Team.objects.create(name="test_team", project=self.project)
+        self.user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+            position=self.position,
+            team=team,
+        )
+        self.client.force_login(self.user)
+        self.task_types = [
+            TaskType.objects.create(name=f"type_{i}") for i in range(3)
+        ]
+
+    def create_tasks(self, count: int) -> None:
+        for i in range(count):
+            task = Task.objects.create(
+                name=f"task_{i}",
+                description="test description",
+                deadline="2025-01-01",
+                is_completed=bool(i % 2),
+                task_type=self.task_types[i % len(self.task_types)],
+                project=self.project,
+            )
+            assignee = get_user_model().objects.create_user(
+                username=f"worker_{Task.objects.count()}",
+                password="test123",
+                position=self.position,
+            )
+            task.assignees.set([self.user, assignee])
+
+    def assert_constant_queries(self, url: str, num: int) -> None:
+        self.create_tasks(2)
+        with self.assertNumQueries(num):
+            self.client.get(url)
+        self.create_tasks(10)
+        with self.assertNumQueries(num):
+            self.client.get(url)
+
+    def test_task_list_query_count(self) -> None:
+        self.assert_constant_queries(TASK_LIST_URL, 4)
+
+    def test_project_detail_query_count(self) -> None:
+        self.assert_constant_queries(
+            reverse("task_manager:project-detail", args=[self.project.pk]), 8
+        )
+
+    def test_worker_detail_query_count(self) -> None:
+        self.assert_constant_queries(
+            reverse("task_manager:worker-detail", args=[self.user.pk]), 5
+        )
@@ -0,0 +1,241 @@
+from datetime import datetime, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from task_manager.bulk import reassign_tasks
+from task_manager.models import (
+    Position,
+    Project,
+    Task,
+    TaskType,
+    Team,
+    Workload,
+)
+from task_manager.workload import (
+    PROJECT,
+    TEAM,
+    WORKER,
+    get_workload,
+    get_workloads,
+)
+
+
+class WorkloadTests(TestCase):
+    def setUp(self) -> None:
+        position = Position.objects.create(name="developer")
+        self.bug = TaskType.objects.create(name="Bug")
+        self.feature = TaskType.objects.create(name="Feature")
+        self.project = Project.objects.create(
+            project_name="test_project", deadline="2030-01-01"
+        )
+        self.other_project = Project.objects.create(
+            project_name="other_project", deadline="2030-01-01"
+        )
+        self.team = Team.objects.create(name="team", project=self.project)
+        self.other_team = Team.objects.create(
+            name="other_team", project=self.project
+        )
+        self.user = get_user_model().objects.create_user(
+            username="test",
+            password="test123",
+            position=position,
+            team=self.team,
+        )
+        self.other = get_user_model().objects.create_user(
+            username="other",
+            password="test123",
+            position=position,
+            team=self.team,
+        )
+        self.client.force_login(self.user)
+
+        self.today = datetime.now().date()
+        self.open_task = self.create_task(self.bug, days=1)
+        self.overdue_task = self.create_task(self.feature, days=-1)
+        self.done_task = self.create_task(self.bug, days=1, completed=True)
+        for task in (self.open_task, self.overdue_task, self.done_task):
+            task.assignees.set([self.user, self.other])
+
+    def create_task(self, task_type, days, completed=False) -> Task:
+        return Task.objects.create(
+            name=f"task_{days}",
+            description="test description",
+            deadline=self.today + timedelta(days=days),
+            is_completed=completed,
+            task_type=task_type,
+            project=self.project,
+        )
+
+    def assert_workload(self, scope, pk, open_, overdue, completed) -> None:
+        summary = get_workload(scope, pk)
+        self.assertEqual(
+            (summary.open_tasks,
+             summary.overdue_tasks,
+             summary.completed_tasks),
+            (open_, overdue, completed),
+        )
+
+    def test_counts_per_scope(self) -> None:
+        self.assert_workload(WORKER, self.user.pk, 2, 1, 1)
+        self.assert_workload(PROJECT, self.project.pk, 2, 1, 1)
+        # Tasks shared by two workers of the team are counted once.
+        self.assert_workload(TEAM, self.team.pk, 2, 1, 1)
+        self.assert_workload(TEAM, self.other_team.pk, 0, 0, 0)
+
+    def test_groups(self) -> None:
+        summary = get_workload(PROJECT, self.project.pk)
+        self.assertEqual(
+            summary.by_task_type(),
+            [
+                {
+                    "name": "Bug",
+                    "open_tasks": 1,
+                    "overdue_tasks": 0,
+                    "completed_tasks": 1,
+                },
+                {
+                    "name": "Feature",
+                    "open_tasks": 1,
+                    "overdue_tasks": 1,
+                    "completed_tasks": 0,
+                },
+            ],
+        )
+        self.assertEqual(
+            [group["name"] for group in summary.by_priority()], ["Medium"]
+        )
+
+    def test_task_saves_update_the_rollups(self) -> None:
+        self.overdue_task.is_completed = True
+        self.overdue_task.save()
+        self.assert_workload(WORKER, self.other.pk, 1, 0, 2)
+        self.assert_workload(TEAM, self.team.pk, 1, 0, 2)
+
+        self.open_task.project = self.other_project
+        self.open_task.save()
+        self.assert_workload(PROJECT, self.project.pk, 0, 0, 2)
+        self.assert_workload(PROJECT, self.other_project.pk, 1, 0, 0)
+
+    def test_assignee_changes_update_the_rollups(self) -> None:
+        self.open_task.assignees.remove(self.other)
+        self.assert_workload(WORKER, self.other.pk, 1, 1, 1)
+        self.assert_workload(TEAM, self.team.pk, 2, 1, 1)
+
+        self.overdue_task.assignees.clear()
+        self.assert_workload(WORKER, self.user.pk, 1, 0, 1)
+        self.assert_workload(TEAM, self.team.pk, 1, 0, 1)
+
+        self.other.tasks.add(self.open_task)
+        self.assert_workload(WORKER, self.other.pk, 1, 0, 1)
+
+    def test_bulk_changes_update_the_rollups(self) -> None:
+        Task.objects.filter(pk=self.open_task.pk).update(is_completed=True)
+        self.assert_workload(WORKER, self.user.pk, 1, 1, 2)
+        self.assert_workload(PROJECT, self.project.pk, 1, 1, 2)
+
+        reassign_tasks(Task.objects.all(), [self.other])
+        self.assert_workload(WORKER, self.user.pk, 0, 0, 0)
+        self.assert_workload(WORKER, self.other.pk, 1, 1, 2)
+
+    def test_deletes_update_the_rollups(self) -> None:
+        self.overdue_task.delete()
+        self.assert_workload(WORKER, self.user.pk, 1, 0, 1)
+        self.assert_workload(TEAM, self.team.pk, 1, 0, 1)
+
+        self.project.delete()
+        self.assertFalse(
+            Workload.objects.filter(scope=PROJECT, scope_id=self.project.pk)
+        )
+        self.assert_workload(WORKER, self.user.pk, 0, 0, 0)
+        self.assert_workload(TEAM, self.team.pk, 0, 0, 0)
+
+    def test_team_changes_update_the_rollups(self) -> None:
+        self.other.team = self.other_team
+        self.other.save()
+        self.assert_workload(TEAM, self.other_team.pk, 2, 1, 1)
+
+        self.user.delete()
+        self.other.delete()
+        self.assert_workload(TEAM, self.team.pk, 0, 0, 0)
+        self.assert_workload(TEAM, self.other_team.pk, 0, 0, 0)
+
+    def test_stale_rows_are_recounted(self) -> None:
+        Workload.objects.update(
+            counted_on=self.today - timedelta(days=1), overdue_tasks=0
+        )
+        tomorrow = self.today + timedelta(days=2)
+        workloads = get_workloads(
+            WORKER, [self.user.pk, self.other.pk], tomorrow
+        )
+        self.assertEqual(workloads[self.user.pk].overdue_tasks, 2)
+        self.assertFalse(
+            Workload.objects.filter(scope=WORKER).exclude(counted_on=tomorrow)
+        )
+
+    def test_recounts_update_rows_in_place(self) -> None:
+        rows = set(Workload.objects.values_list("pk", flat=True))
+        self.done_task.task_type = self.feature
+        self.done_task.save()
+        self.assertEqual(
+            set(Workload.objects.values_list("pk", flat=True)), rows
+        )
+        summary = get_workload(WORKER, self.user.pk)
+        self.assertEqual(
+            [group["completed_tasks"] for group in summary.by_task_type()],
+            [0, 1],
+        )
+
+    def test_reads_take_one_query(self) -> None:
+        with self.assertNumQueries(1):
+            get_workloads(TEAM, [self.team.pk, self.other_team.pk])
+
+    def test_rebuild_command(self) -> None:
+        Workload.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_workload", stdout=out)
+        self.assertIn("Rebuilt workload", out.getvalue())
+        self.assert_workload(TEAM, self.team.pk, 2, 1, 1)
+
+    def test_api(self) -> None:
+        url = reverse(
+            "task_manager:api-workload", args=["teams", self.team.pk]
+        )
+        data = self.client.get(url).json()["data"]
+        self.assertEqual(
+            (data["open_tasks"], data["overdue_tasks"]), (2, 1)
+        )
+        self.assertEqual(len(data["by_task_type"]), 2)
+
+        response = self.client.get(
+            reverse("task_manager:api-workload", args=["tasks", 1])
+        )
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get(
+            reverse("task_manager:api-workload", args=["teams", 999])
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_pages_show_the_workload(self) -> None:
+        response = self.client.get(
+            reverse("task_manager:team-detail", args=[self.team.pk])
+        )
+        self.assertContains(response, "Overdue tasks: 1")
+        self.assertEqual(len(response.context["worker_workloads"]), 2)
+
+        self.overdue_task.is_completed = True
+        self.overdue_task.save()
+        response = self.client.get(
+            reverse("task_manager:team-detail", args=[self.team.pk])
+        )
+        self.assertContains(response, "Overdue tasks: 0")
+
+        response = self.client.get(
+            reverse("task_manager:project-detail", args=[self.project.pk])
+        )
+        self.assertContains(response, "Completed tasks: 2")
+        response = self.client.get(reverse("task_manager:team-list"))
+        self.assertContains(response, "Open: 1")